@@ -14,8 +14,64 @@ class Settings:
     FRONTEND_URL = os.getenv("FRONTEND_URL")
     SECRET_KEY = os.getenv("SECRET_KEY", "ssami-secret")
     ATLAS_URI = os.getenv("ATLAS_URI")
+
+    # MongoDB 커넥션 풀 (워커당 클라이언트 1개)
+    MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+    MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "2"))
+    MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000"))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+    MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "10000"))
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+    # 문서 본문 추출 (HWP/HWPX)
+    EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", "2"))
+    EXTRACT_QUEUE_LIMIT = int(os.getenv("EXTRACT_QUEUE_LIMIT", "16"))
+    EXTRACT_RETRY_AFTER = int(os.getenv("EXTRACT_RETRY_AFTER", "5"))
+
+    # EXAONE 분류기 배치 스케줄러
+    EXAONE_MAX_BATCH_SIZE = int(os.getenv("EXAONE_MAX_BATCH_SIZE", "32"))
+    EXAONE_MAX_WAIT_MS = int(os.getenv("EXAONE_MAX_WAIT_MS", "10"))
+    EXAONE_BATCH_SIZE = int(os.getenv("EXAONE_BATCH_SIZE", "16"))  # 길이 정렬 후 한 번에 모델에 넣는 문장 수
+
+    # EXAONE 추론 백엔드: torch | quantized | onnx (onnx 는 onnxruntime 설치 필요)
+    EXAONE_BACKEND = os.getenv("EXAONE_BACKEND", "torch").lower()
+    EXAONE_ONNX_PATH = os.getenv("EXAONE_ONNX_PATH")  # 미지정 시 <모델 경로>/onnx/model.onnx
+    EXAONE_PARITY_MIN_AGREEMENT = float(os.getenv("EXAONE_PARITY_MIN_AGREEMENT", "0.95"))
+
+    # 전역 문장 분석 캐시: 프로세스 내 LRU 항목 수
+    SENTENCE_CACHE_LRU_SIZE = int(os.getenv("SENTENCE_CACHE_LRU_SIZE", "10000"))
+
+    # 문장 분리/언어 감지 메모 (프로세스 내 LRU 항목 수) + 언어 감지 샘플 길이
+    SPLIT_CACHE_SIZE = int(os.getenv("SPLIT_CACHE_SIZE", "5000"))
+    LANG_DETECT_CACHE_SIZE = int(os.getenv("LANG_DETECT_CACHE_SIZE", "1000"))
+    LANG_DETECT_SAMPLE_CHARS = int(os.getenv("LANG_DETECT_SAMPLE_CHARS", "1000"))
+
+    # 문장 분리 워커 풀 (0 이면 풀 없이 스레드에서 실행) + 이 글자 수 이상이면 문단을 나눠 병렬 분리
+    SPLIT_WORKERS = int(os.getenv("SPLIT_WORKERS", "2"))
+    SPLIT_PARALLEL_MIN_CHARS = int(os.getenv("SPLIT_PARALLEL_MIN_CHARS", "5000"))
+
+    # 모델 지문이 바뀐 분석 캐시 백그라운드 재분석
+    REANALYSIS_ENABLED = os.getenv("REANALYSIS_ENABLED", "true").lower() == "true"
+    REANALYSIS_INTERVAL_SEC = int(os.getenv("REANALYSIS_INTERVAL_SEC", "30"))
+    REANALYSIS_BATCH_SIZE = int(os.getenv("REANALYSIS_BATCH_SIZE", "20"))
+    REANALYSIS_MAX_ATTEMPTS = int(os.getenv("REANALYSIS_MAX_ATTEMPTS", "3"))  # 이만큼 실패한 항목은 건너뜀 (사용자가 다시 분석하면 초기화)
+
+    # 일괄 분석 작업: 동시에 분석할 문서 수, 한 번에 본문을 읽어 올 문서 수, 작업당 최대 문서 수
+    ANALYSIS_JOB_CONCURRENCY = int(os.getenv("ANALYSIS_JOB_CONCURRENCY", "2"))
+    ANALYSIS_JOB_FETCH_SIZE = int(os.getenv("ANALYSIS_JOB_FETCH_SIZE", "20"))
+    ANALYSIS_JOB_MAX_DOCS = int(os.getenv("ANALYSIS_JOB_MAX_DOCS", "1000"))
+
+    # ID 발급: 워커별로 미리 예약할 doc/category/user ID 개수 (1이면 매번 counters 조회)
+    ID_BLOCK_SIZE = int(os.getenv("ID_BLOCK_SIZE", "1"))
+
+    # Chroma 벡터스토어: 시작 시 한 번 열어 공유할 디렉터리 목록, 워밍업 검색 여부
+    VECTORSTORE_DIRS = [d.strip() for d in os.getenv("VECTORSTORE_DIRS", "chroma_db_editorial,chroma_db_opinion,chroma_db_news,chroma_opinion").split(",") if d.strip()]
+    VECTORSTORE_WARMUP = os.getenv("VECTORSTORE_WARMUP", "true").lower() == "true"
+
+    # 로깅: DEBUG | INFO | WARNING | ERROR, 문장 단위 DEBUG 로그 샘플링 비율 (0~1)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.01"))
+
     # CORS
     CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "http://52.15.42.56:5173").split(",") if o.strip()]
     CORS_ALLOW_CREDENTIALS = os.getenv("CORS_ALLOW_CREDENTIALS", "true").lower() == "true"
@@ -0,0 +1,89 @@
+# app/core/database.py
+# 앱 전체가 공유하는 단일 Motor 클라이언트 (워커당 커넥션 풀 1개)
+#
+# - 클라이언트는 FastAPI lifespan 에서 connect_database() 로 생성/워밍업하고 close_database() 로 정리
+# - 서비스 모듈은 import 시점에 get_collection() 으로 "지연 핸들"만 잡아두고,
+#   실제 클라이언트는 첫 사용(또는 lifespan) 시점에 만들어진다
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorGridFSBucket
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger("database")
+
+DB_NAME = "uploadedbyusers"
+BLOB_BUCKET = "doc_blobs"
+
+_client: Optional[AsyncIOMotorClient] = None
+_blob_bucket: Optional[AsyncIOMotorGridFSBucket] = None
+
+
+# ===== 클라이언트 =====
+
+def get_client() -> AsyncIOMotorClient:
+    global _client
+    if _client is None:
+        _client = AsyncIOMotorClient(
+            settings.ATLAS_URI,
+            maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+            serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            connectTimeoutMS=settings.MONGO_CONNECT_TIMEOUT_MS,
+            appname="ssami-back",
+        )
+    return _client
+
+def get_database():
+    return get_client()[DB_NAME]
+
+def get_blob_bucket() -> AsyncIOMotorGridFSBucket:
+    """원본 파일(GridFS) 버킷"""
+    global _blob_bucket
+    if _blob_bucket is None:
+        _blob_bucket = AsyncIOMotorGridFSBucket(get_database(), bucket_name=BLOB_BUCKET)
+    return _blob_bucket
+
+
+# ===== 지연 핸들 =====
+
+class LazyCollection:
+    """첫 속성 접근 시 공유 클라이언트의 컬렉션으로 위임"""
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(get_database()[self._name], attr)
+
+    def __repr__(self):
+        return f"LazyCollection({DB_NAME}.{self._name})"
+
+
+class LazyDatabase:
+    def __getitem__(self, name: str) -> LazyCollection:
+        return LazyCollection(name)
+
+    def __getattr__(self, attr):
+        return getattr(get_database(), attr)
+
+
+db = LazyDatabase()
+
+def get_collection(name: str) -> LazyCollection:
+    return LazyCollection(name)
+
+
+# ===== lifespan =====
+
+async def connect_database():
+    await get_client().admin.command("ping")
+    logger.info("mongo_connected", max_pool_size=settings.MONGO_MAX_POOL_SIZE, min_pool_size=settings.MONGO_MIN_POOL_SIZE)
+
+def close_database():
+    global _client, _blob_bucket
+    if _client is not None:
+        _client.close()
+    _client = None
+    _blob_bucket = None
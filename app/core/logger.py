@@ -0,0 +1,102 @@
+# app/core/logger.py
+# 레벨/샘플링이 있는 구조화 로거 (key=value 한 줄 출력)
+#
+#   logger = get_logger("analyze")
+#   logger.info("analysis_done", doc_id=doc_id, sentences=len(results))
+#   logger.debug("sentence_reused", sample=0.01, index=idx)   # DEBUG 활성 시 1%만 기록
+#   if logger.debug_enabled(): logger.debug("batch", labels=summarize(results))  # 인자 계산이 비쌀 때
+#
+# 비활성 레벨은 isEnabledFor 에서 바로 반환 → 메시지 포맷팅 비용 없음.
+# 큰 목록/문장 원문 대신 개수·앞부분만 넘길 것.
+import logging
+import random
+import sys
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+_ROOT_NAME = "ssami"
+_configured = False
+
+# 문자열 값은 이 길이까지만 기록
+MAX_VALUE_LENGTH = 200
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, float):
+        text = f"{value:.4f}"
+    else:
+        text = str(value)
+    if len(text) > MAX_VALUE_LENGTH:
+        text = text[:MAX_VALUE_LENGTH] + "..."
+    if not text or any(ch.isspace() for ch in text) or "=" in text or '"' in text:
+        text = '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+    return text
+
+
+class KeyValueFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        parts = [
+            self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            f"level={record.levelname}",
+            f"logger={record.name}",
+            f"event={record.getMessage()}",
+        ]
+        fields: Dict[str, Any] = getattr(record, "fields", None) or {}
+        parts.extend(f"{key}={_format_value(value)}" for key, value in fields.items())
+        line = " ".join(parts)
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+def _configure():
+    global _configured
+    if _configured:
+        return
+    root = logging.getLogger(_ROOT_NAME)
+    root.setLevel(settings.LOG_LEVEL)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(KeyValueFormatter())
+    root.addHandler(handler)
+    root.propagate = False
+    _configured = True
+
+
+class StructuredLogger:
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+
+    def is_enabled(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def debug_enabled(self) -> bool:
+        # 로그 인자 자체를 만드는 비용이 큰 경우 호출 전에 확인
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    def log(self, level: int, event: str, sample: Optional[float] = None, exc_info: bool = False, **fields):
+        if not self._logger.isEnabledFor(level):
+            return
+        if sample is not None and sample < 1.0 and random.random() >= sample:
+            return
+        self._logger.log(level, event, extra={"fields": fields}, exc_info=exc_info)
+
+    def debug(self, event: str, sample: Optional[float] = None, **fields):
+        self.log(logging.DEBUG, event, sample=sample, **fields)
+
+    def info(self, event: str, **fields):
+        self.log(logging.INFO, event, **fields)
+
+    def warning(self, event: str, **fields):
+        self.log(logging.WARNING, event, **fields)
+
+    def error(self, event: str, **fields):
+        self.log(logging.ERROR, event, **fields)
+
+    def exception(self, event: str, **fields):
+        self.log(logging.ERROR, event, exc_info=True, **fields)
+
+
+def get_logger(name: str) -> StructuredLogger:
+    _configure()
+    return StructuredLogger(logging.getLogger(f"{_ROOT_NAME}.{name}"))
@@ -1,28 +1,76 @@
 # 📁 app/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from app.core.config import settings
+from app.core.database import connect_database, close_database
+from app.core.logger import get_logger
 from app.services.exaone_client import load_dependencies
-import sys
+from app.services.extract_executor import start_extract_executor, shutdown_extract_executor
+from app.services.split_executor import start_split_executor, shutdown_split_executor
+from app.services.index_registry import ensure_indexes
+from app.services.inference_scheduler import exaone_scheduler
+from app.services.reanalysis_job import start_reanalysis_job, stop_reanalysis_job
+from app.services.analysis_job import recover_interrupted_jobs, stop_analysis_jobs
+from app.services.vectorstore_registry import load_vectorstores
+import asyncio
 
 load_dotenv()
 
 from app.routes import auth, documents, trash, user, category, chat, analyze
 
-app = FastAPI()
+logger = get_logger("app")
 
-@app.on_event("startup")
-async def startup_event():
-    print("[INFO] FastAPI 애플리케이션 시작: 의존성 로딩...")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("app_starting")
+    try:
+        await connect_database()
+    except Exception as e:
+        logger.exception("mongo_connect_failed", error=str(e))
     try:
         load_dependencies()
-        print("[INFO] EXAONE 클라이언트 의존성 로드 완료.")
+        logger.info("exaone_dependencies_loaded")
     except Exception as e:
-        print(f"[CRITICAL] 애플리케이션 시작 실패: {e}", file=sys.stderr)
+        logger.exception("exaone_dependencies_failed", error=str(e))
         # 실제 운영 환경에서는 여기에서 애플리케이션 종료를 고려할 수 있음
         # raise
-        
+    try:
+        start_extract_executor()
+    except Exception as e:
+        logger.exception("extract_pool_start_failed", error=str(e))
+    try:
+        start_split_executor()
+    except Exception as e:
+        logger.exception("split_pool_start_failed", error=str(e))
+    exaone_scheduler.start()
+    try:
+        await ensure_indexes()
+    except Exception as e:
+        logger.exception("ensure_indexes_failed", error=str(e))
+    try:
+        # Chroma 컬렉션을 한 번만 열고 워밍업 (디스크 I/O → 스레드에서)
+        await asyncio.to_thread(load_vectorstores)
+    except Exception as e:
+        logger.exception("vectorstore_load_failed", error=str(e))
+    try:
+        await recover_interrupted_jobs()
+    except Exception as e:
+        logger.exception("recover_jobs_failed", error=str(e))
+    start_reanalysis_job()
+
+    yield
+
+    await stop_analysis_jobs()
+    await stop_reanalysis_job()
+    await exaone_scheduler.stop()
+    shutdown_extract_executor()
+    shutdown_split_executor()
+    close_database()
+
+app = FastAPI(lifespan=lifespan)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
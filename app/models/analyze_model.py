@@ -1,14 +1,25 @@
 # ✅ app/models/analyze_model.py
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
+class HighlightSpan(BaseModel):
+    word: str
+    start: int  # 문장(text) 기준 시작 offset
+    end: int    # 문장(text) 기준 끝 offset (exclusive)
+
 class SentenceAnalysis(BaseModel):
     index: int
     text: str
     flag: bool
     label: str
     highlighted: List[str] = Field(default_factory=list)
+    highlight_spans: List[HighlightSpan] = Field(default_factory=list)
     explanation: List[str] = Field(default_factory=list)
 
 class DocumentAnalysisResponse(BaseModel):
-    sentences: List[SentenceAnalysis]
\ No newline at end of file
+    sentences: List[SentenceAnalysis]
+
+class AnalysisJobRequest(BaseModel):
+    # doc_ids 가 없으면 사용자 문서 전체 (category_id 가 있으면 해당 카테고리만)
+    doc_ids: Optional[List[str]] = None
+    category_id: Optional[str] = None
@@ -1,6 +1,6 @@
 # app/models/document_model.py
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
 class Doc(BaseModel):
@@ -10,7 +10,22 @@ class Doc(BaseModel):
     contents: str = Field("", description="본문")
     file_type: str
     file_blob: Optional[bytes] = None
+    content_hash: Optional[str] = None
     category_id: Optional[str] = Field(default="")
     created_dt: datetime = Field(default_factory=datetime.now)
     updated_dt: Optional[datetime] = None
-    delete_yn: Optional[str] =  Field(default="n")
\ No newline at end of file
+    delete_yn: Optional[str] =  Field(default="n")
+
+# 목록(대시보드/휴지통) 응답용 요약 - 본문 전체 대신 preview
+class DocSummary(BaseModel):
+    doc_id: str
+    user_id: str
+    title: str
+    preview: str = ""
+    file_type: str
+    category_id: Optional[str] = Field(default="")
+    topic_id: Optional[int] = None
+    hashtag: List[str] = Field(default_factory=list)
+    created_dt: Optional[datetime] = None
+    updated_dt: Optional[datetime] = None
+    delete_yn: Optional[str] = Field(default="n")
\ No newline at end of file
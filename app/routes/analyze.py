@@ -1,13 +1,58 @@
 # ✅ app/routes/analyze.py
-from fastapi import APIRouter, Body
-from app.services.analyze_service import smart_sentence_split, analyze_document 
+import json
+from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from app.core.jwt import get_current_user
+from app.core.logger import get_logger
+from app.services.analyze_service import smart_sentence_split, analyze_document, analyze_document_stream
 from app.services.exaone_client import run_exaone_batch
-from app.models.analyze_model import SentenceAnalysis, DocumentAnalysisResponse
+from app.services.sentence_cache import get_sentence_cache_stats
+from app.services.analysis_job import create_job, get_job
+from app.models.analyze_model import SentenceAnalysis, DocumentAnalysisResponse, AnalysisJobRequest
 
 router = APIRouter(prefix="/analyze", tags=["문서AI분석"])
+logger = get_logger("analyze")
 
 @router.post("/", response_model=DocumentAnalysisResponse)
 async def analyze_route(doc_id: str = Body(...), contents: str = Body(...)):
-    print(f"[LOG] 분석 요청: doc_id={doc_id}, contents={contents[:200]}...")
+    logger.info("analyze_request", doc_id=doc_id, chars=len(contents))
     analysis = await analyze_document(doc_id, contents)
-    return DocumentAnalysisResponse(sentences=analysis)
\ No newline at end of file
+    return DocumentAnalysisResponse(sentences=analysis)
+
+@router.post("/stream")
+async def analyze_stream_route(doc_id: str = Body(...), contents: str = Body(...)):
+    # NDJSON: 한 줄에 이벤트 하나 (meta → sentences... → done). 캐시된 문장이 먼저, 모델 결과는 배치가 끝나는 대로
+    logger.info("analyze_stream_request", doc_id=doc_id, chars=len(contents))
+
+    async def event_lines():
+        try:
+            async for event in analyze_document_stream(doc_id, contents):
+                if event["type"] == "sentences":
+                    event = {**event, "sentences": [s.model_dump() for s in event["sentences"]]}
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        except Exception as e:
+            logger.exception("analyze_stream_failed", doc_id=doc_id, error=str(e))
+            yield json.dumps({"type": "error", "message": "문서 분석 중 오류가 발생했습니다."}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(
+        event_lines(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/cache/stats")
+async def sentence_cache_stats():
+    # 전역 문장 캐시 적중 통계 (워커 프로세스 단위)
+    return get_sentence_cache_stats()
+
+@router.post("/jobs", status_code=202)
+async def create_analysis_job_route(request: AnalysisJobRequest = Body(...), current_user_id: str = Depends(get_current_user)):
+    # 여러 문서 일괄 분석 (백그라운드) → job_id 로 진행 상황 조회
+    return await create_job(current_user_id, doc_ids=request.doc_ids, category_id=request.category_id)
+
+@router.get("/jobs/{job_id}")
+async def get_analysis_job_route(job_id: str, current_user_id: str = Depends(get_current_user)):
+    job = await get_job(job_id, current_user_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="분석 작업을 찾을 수 없습니다.")
+    return job
@@ -2,6 +2,7 @@
 from fastapi import APIRouter, HTTPException, Depends
 from app.services.chat_service import save_chat_qa, get_chat_history, delete_chat_history
 from app.services.ai_service import generate_ai_response
+from app.services.vectorstore_registry import get_vectorstore_stats
 from app.models.chat_model import ChatSendRequest, ChatQA
 from typing import List
 import httpx
@@ -42,3 +43,8 @@ async def chat_history(doc_id: str):
 async def delete_history(doc_id: str):
     deleted = await delete_chat_history(doc_id)
     return {"deleted_count": deleted}
+
+@router.get("/vectorstores/stats")
+async def vectorstore_stats():
+    # 벡터스토어별 로드 시간 / 문서 수 / 디스크 크기 (워커 프로세스 단위)
+    return get_vectorstore_stats()
@@ -1,15 +1,18 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Response, Query, Body, Depends
-from app.services.hwpx_extractor import extract_text_from_hwpx
-from app.services.hwp_extractor import extract_text_from_hwp
+from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Query, Body, Depends
+from fastapi.responses import StreamingResponse
+from app.services.extract_executor import ExtractionQueueFull, ensure_extract_capacity
 from app.services.document_service import (
-    upload_file, get_next_doc_id, get_documents, download_file, delete_file,
+    upload_file, get_next_doc_id, get_documents, get_all_documents, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, download_file, open_file_stream, delete_file,
     update_document_title, update_document_topic, has_temp_doc, get_temp_doc, get_doc, update_temp_doc, finalize_temp_doc,delete_temp_doc
 )
 from app.services.doc_topic import get_topic_info_with_docs
+from app.services.content_cache import get_cache_stats
+from app.services.analyze_service import touch_analysis
 from app.models.document_model import Doc
 from typing import List, Optional, Dict
 from urllib.parse import quote
 from app.core.jwt import get_current_user
+from app.core.config import settings
 
 # [보안] 모든 라우터에 JWT 인증 의존성 추가
 router = APIRouter(prefix="/documents", tags=["Documents"], dependencies=[Depends(get_current_user)])
@@ -17,12 +20,28 @@ router = APIRouter(prefix="/documents", tags=["Documents"], dependencies=[Depend
 # ======================== 대시보드 ========================
 
 @router.get("/")
-async def list_documents(user_id: str = Query(...), current_user_id: str = Depends(get_current_user)):
+async def list_documents(
+    user_id: str = Query(...),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    category_id: Optional[str] = Query(None),
+    topic_id: Optional[int] = Query(None),
+    sort: str = Query("updated_desc"),
+    current_user_id: str = Depends(get_current_user)
+):
     if user_id != current_user_id:
         raise HTTPException(status_code=403, detail="Forbidden: You can only access your own documents.")
     try:
-        docs = await get_documents(user_id)
-        return docs
+        # limit/cursor 가 없으면 기존 응답 형식(전체 목록 배열) 유지,
+        # 있으면 {"items", "next_cursor", "has_more"} 페이지 (limit 생략 시 DEFAULT_PAGE_SIZE)
+        if limit is None and cursor is None:
+            return await get_all_documents(user_id, category_id=category_id, topic_id=topic_id, sort=sort)
+        return await get_documents(
+            user_id, category_id=category_id, topic_id=topic_id, sort=sort,
+            limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -48,7 +67,10 @@ async def download_document(doc_id: str, current_user_id: str = Depends(get_curr
         filename = f"{title}.{ext}" if ext else f"{title}.hwpx"
         quoted_filename = quote(filename)
         headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{quoted_filename}"}
-        return Response(content=doc.get("file_blob") or doc.get("contents"), media_type="application/octet-stream", headers=headers)
+        chunks = await open_file_stream(doc)
+        return StreamingResponse(chunks, media_type="application/octet-stream", headers=headers)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -62,6 +84,23 @@ async def delete_document_api(doc_id: str, current_user_id: str = Depends(get_cu
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _upload_or_503(user_id: str, filename: str, file_type: str, contents: bytes, category_id: Optional[str]):
+    # 추출 대기열이 가득 차면 바로 503 + Retry-After 로 되돌려 보냄 (backpressure)
+    # 대기열 확인 후에 doc_id 발급 → 503 응답마다 ID 가 소모되지 않음
+    try:
+        ensure_extract_capacity()
+        doc = Doc(
+            doc_id=await get_next_doc_id(), user_id=user_id, title=filename.rsplit(".", 1)[0],
+            file_type=file_type, file_blob=contents, category_id=category_id or ""
+        )
+        return await upload_file(doc)
+    except ExtractionQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="문서 처리 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(settings.EXTRACT_RETRY_AFTER)},
+        )
+
 @router.post("/upload/hwpx")
 async def documents_upload_hwpx(
     file: UploadFile = File(...),
@@ -74,16 +113,7 @@ async def documents_upload_hwpx(
     if not file.filename.lower().endswith('.hwpx'):
         raise HTTPException(status_code=400, detail="Only .hwpx files are allowed.")
     contents = await file.read()
-    text = ""
-    try:
-        text = extract_text_from_hwpx(contents)
-    except Exception as e:
-        print(f"본문 추출 실패: {e}")
-    doc = Doc(
-        doc_id=await get_next_doc_id(), user_id=user_id, title=file.filename.rsplit(".", 1)[0],
-        contents=text, file_type="hwpx", file_blob=contents, category_id=category_id or ""
-    )
-    return await upload_file(doc)
+    return await _upload_or_503(user_id, file.filename, "hwpx", contents, category_id)
 
 @router.post("/upload/hwp")
 async def documents_upload_hwp(
@@ -97,16 +127,12 @@ async def documents_upload_hwp(
     if not file.filename.lower().endswith('.hwp'):
         raise HTTPException(status_code=400, detail="Only .hwp files are allowed.")
     contents = await file.read()
-    text = ""
-    try:
-        text = extract_text_from_hwp(contents)
-    except Exception as e:
-        print(f"본문 추출 실패: {e}")
-    doc = Doc(
-        doc_id=await get_next_doc_id(), user_id=user_id, title=file.filename.rsplit(".", 1)[0],
-        contents=text, file_type="hwp", file_blob=contents, category_id=category_id or ""
-    )
-    return await upload_file(doc)
+    return await _upload_or_503(user_id, file.filename, "hwp", contents, category_id)
+
+@router.get("/cache/stats")
+async def content_cache_stats():
+    # 동일 파일 재업로드 캐시 적중 통계 (워커 프로세스 단위)
+    return get_cache_stats()
 
 # ======================== 챗봇/에디터 ========================
 
@@ -120,6 +146,7 @@ async def get_temp_doc_route(doc_id: str, current_user_id: str = Depends(get_cur
     doc = await get_temp_doc(doc_id, current_user_id)
     if not doc:
         raise HTTPException(404, "임시저장 문서가 없습니다")
+    await touch_analysis(doc_id)  # 백그라운드 재분석 우선순위 (최근 연 문서 먼저)
     
     # [수정] file_blob 필드를 응답에서 제외
     doc.pop("file_blob", None)
@@ -135,6 +162,7 @@ async def get_doc_route(doc_id: str, current_user_id: str = Depends(get_current_
     doc = await get_doc(doc_id, current_user_id)
     if not doc:
         raise HTTPException(404, "문서가 없거나 접근 권한이 없습니다.")
+    await touch_analysis(doc_id)  # 백그라운드 재분석 우선순위 (최근 연 문서 먼저)
     
     contents = doc.get("contents")
     if isinstance(contents, bytes):
@@ -158,7 +186,9 @@ async def get_doc_route(doc_id: str, current_user_id: str = Depends(get_current_
             doc_id=doc_id,
             user_id=current_user_id,
             topic_id=topic_id,
-            hashtag=hashtag
+            hashtag=hashtag,
+            content_hash=doc.get("content_hash"),
+            contents=contents,
         )
     else:
         topic_id = doc["topic_id"]
@@ -7,14 +7,14 @@ from app.services.trash_service import (
     delete_document_permanently,
     delete_all_deleted_documents
 )
-from app.models.document_model import Doc
+from app.models.document_model import DocSummary
 from typing import List
 from app.core.jwt import get_current_user
 
 router = APIRouter(prefix="/trash", tags=["Trash"], dependencies=[Depends(get_current_user)])
 
 # 1. 휴지통 문서 목록 조회
-@router.get("/", response_model=List[Doc])
+@router.get("/", response_model=List[DocSummary])
 async def get_trash_documents(user_id: str = Query(...)):
     try:
         docs = await get_deleted_documents(user_id)
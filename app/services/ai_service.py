@@ -1,10 +1,11 @@
 # app/services/ai_service.py
 from typing import Optional, Tuple
 from datetime import timedelta, timezone
-from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.database import db
 from openai import OpenAI
 from langgraph.graph import StateGraph, END
 from app.core.config import Settings
+from app.core.logger import get_logger
 import asyncio
 from app.services.chat_service import get_curr_chat_id
 from app.services.node import (
@@ -21,21 +22,19 @@ from app.services.node import (
 )
 
 # ===== 설정 =====
-ATLAS_URI = Settings.ATLAS_URI
-client = AsyncIOMotorClient(ATLAS_URI)
-db = client['uploadedbyusers']
+logger = get_logger("graph")
 openai_client = OpenAI(api_key=Settings.OPENAI_API_KEY)
 tz_kst = timezone(timedelta(hours=9))
 
 # ===== 문서 조회 노드 =====
 async def retrieve_document_node(state: GraphState) -> dict:
-    print("--- 노드 실행: retrieve_document_node ---")
+    logger.debug("node_start", node="retrieve_document")
     doc_id = state.get("doc_id")
     if not doc_id:
         return {**state, "selected_text": ""}
 
     async def fetch(coll):
-        return await db[coll].find_one({"doc_id": doc_id})
+        return await db[coll].find_one({"doc_id": doc_id}, {"_id": 0, "contents": 1, "topic_id": 1})
     
     temp_doc, main_doc = await asyncio.gather(fetch("temp_docs"), fetch("docs"))
     doc = temp_doc or main_doc
@@ -52,7 +51,7 @@ async def retrieve_document_node(state: GraphState) -> dict:
     return {**state, "selected_text": doc.get("contents", "")}
 
 async def no_generate_node(state: GraphState) -> dict:
-    print("--- 노드 실행: no_generate_node ---")
+    logger.debug("node_start", node="no_generate")
     generation_reason = "요청에 부적절한 표현이 포함되어 있어 응답 생성을 중단했습니다."
     return {**state, "generation": generation_reason}  # ✨ 여기에 이유를 명시
 
@@ -136,7 +135,7 @@ async def generate_ai_response(
 
     try:
         chat_id = await get_curr_chat_id(doc_id)
-        print(f"chat_id:{chat_id}")
+        logger.debug("chat_resolved", doc_id=doc_id, chat_id=chat_id)
         if not chat_id:
             chat_id = "chat_00000001"
         inputs = {
@@ -158,5 +157,5 @@ async def generate_ai_response(
         )
 
     except Exception as e:
-        print(f"AI 응답 생성 중 오류: {str(e)}")
+        logger.exception("ai_response_failed", doc_id=doc_id, error=str(e))
         return f"AI 응답 생성 중 오류가 발생했습니다", None, None, None
@@ -0,0 +1,191 @@
+# app/services/analysis_job.py
+# 여러 문서를 한 번에 미리 분석하는 일괄 분석 작업 (야간 pre-warm 등)
+# - 대상: doc_id 목록, 또는 사용자(+카테고리)의 삭제되지 않은 문서 전체 (최근 수정순)
+# - 본문은 temp_docs(편집 중) → docs 순으로 읽음 (blob 제외, 묶음 단위 $in 조회)
+# - 문서마다 analyze_document 로 분석 → 문단 diff / 전역 문장 캐시 / EXAONE 배치 스케줄러를 그대로 사용
+# - 진행 상황은 analysis_jobs 컬렉션에 기록 (GET /analyze/jobs/{job_id})
+
+import asyncio
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.database import db
+from app.core.logger import get_logger
+from app.services.analyze_service import analyze_document
+from app.services.document_service import DELETE_NO
+from app.services.sequence_service import next_sequence, format_id
+
+# ====== 설정 ======
+job_collection = db["analysis_jobs"]
+doc_collection = db["docs"]
+temp_collection = db["temp_docs"]
+
+logger = get_logger("analysis_job")
+
+tz_kst = timezone(timedelta(hours=9))
+
+# 작업 문서에 남길 오류 개수 상한 (최근 것만 유지)
+MAX_JOB_ERRORS = 20
+
+UNFINISHED_STATUSES = ["queued", "running"]
+
+# 작업을 실행하는 프로세스 ("호스트:pid") ─ 재시작/크래시로 끊긴 작업 판별용
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+# 조회 응답에서 제외 (doc_ids 는 수천 개일 수 있음)
+JOB_STATUS_PROJECTION = {"_id": 0, "doc_ids": 0}
+
+_tasks: Dict[str, asyncio.Task] = {}
+
+
+# ====== [대상 문서 / 본문 조회] ======
+
+async def resolve_doc_ids(user_id: str, doc_ids: Optional[List[str]] = None, category_id: Optional[str] = None) -> List[str]:
+    """분석 대상 doc_id 목록 (중복 제거, 요청 순서 유지). doc_ids 가 없으면 사용자(+카테고리) 문서 전체"""
+    limit = settings.ANALYSIS_JOB_MAX_DOCS
+    if doc_ids:
+        return list(dict.fromkeys(doc_ids))[:limit]
+    query = {"user_id": user_id, "delete_yn": DELETE_NO}
+    if category_id:
+        query["category_id"] = category_id
+    cursor = doc_collection.find(query, {"_id": 0, "doc_id": 1}) \
+        .sort([("updated_dt", -1), ("doc_id", -1)]) \
+        .limit(limit)
+    return [doc["doc_id"] async for doc in cursor]
+
+async def load_contents(user_id: str, doc_ids: List[str]) -> Dict[str, str]:
+    """{doc_id: 본문} ─ 편집 중인 temp_docs 본문 우선. 본문이 문자열이 아닌(레거시) 문서는 제외"""
+    projection = {"_id": 0, "doc_id": 1, "contents": 1}
+    temp_docs, docs = await asyncio.gather(
+        temp_collection.find({"doc_id": {"$in": doc_ids}, "user_id": user_id}, projection).to_list(length=len(doc_ids)),
+        doc_collection.find({"doc_id": {"$in": doc_ids}, "user_id": user_id, "delete_yn": DELETE_NO}, projection).to_list(length=len(doc_ids)),
+    )
+    contents = {}
+    for doc in docs + temp_docs:  # temp_docs 가 뒤에 오므로 덮어씀
+        if isinstance(doc.get("contents"), str):
+            contents[doc["doc_id"]] = doc["contents"]
+    return contents
+
+
+# ====== [작업 실행] ======
+
+async def _update_job(job_id: str, fields: Optional[dict] = None, inc: Optional[dict] = None, error: Optional[dict] = None):
+    update = {"$set": {**(fields or {}), "updated_dt": datetime.now(tz=tz_kst)}}
+    if inc:
+        update["$inc"] = inc
+    if error:
+        update["$push"] = {"errors": {"$each": [error], "$slice": -MAX_JOB_ERRORS}}
+    await job_collection.update_one({"job_id": job_id}, update)
+
+async def _analyze_one(job_id: str, doc_id: str, contents: Optional[str], semaphore: asyncio.Semaphore):
+    if not contents or not contents.strip():
+        await _update_job(job_id, inc={"processed": 1, "skipped": 1})
+        return
+    async with semaphore:
+        try:
+            analysis = await analyze_document(doc_id, contents)
+        except Exception as e:
+            logger.exception("job_doc_failed", job_id=job_id, doc_id=doc_id, error=str(e))
+            await _update_job(job_id, inc={"processed": 1, "failed": 1}, error={"doc_id": doc_id, "message": str(e)})
+            return
+    await _update_job(job_id, inc={"processed": 1, "succeeded": 1, "sentences": len(analysis)})
+
+async def run_job(job_id: str, user_id: str, doc_ids: List[str]):
+    """doc_ids 를 FETCH_SIZE 묶음으로 본문 조회 → 묶음 안에서 ANALYSIS_JOB_CONCURRENCY 개씩 동시 분석"""
+    await _update_job(job_id, {"status": "running", "started_dt": datetime.now(tz=tz_kst)})
+    logger.info("job_started", job_id=job_id, user_id=user_id, total=len(doc_ids))
+    semaphore = asyncio.Semaphore(max(1, settings.ANALYSIS_JOB_CONCURRENCY))
+    fetch_size = max(1, settings.ANALYSIS_JOB_FETCH_SIZE)
+    try:
+        for i in range(0, len(doc_ids), fetch_size):
+            chunk = doc_ids[i:i + fetch_size]
+            contents = await load_contents(user_id, chunk)
+            await asyncio.gather(*(
+                _analyze_one(job_id, doc_id, contents.get(doc_id), semaphore) for doc_id in chunk
+            ))
+    except asyncio.CancelledError:
+        await _update_job(job_id, {"status": "cancelled", "finished_dt": datetime.now(tz=tz_kst)})
+        logger.info("job_cancelled", job_id=job_id)
+        raise
+    except Exception as e:
+        logger.exception("job_failed", job_id=job_id, error=str(e))
+        await _update_job(job_id, {"status": "failed", "finished_dt": datetime.now(tz=tz_kst)}, error={"doc_id": None, "message": str(e)})
+        return
+    await _update_job(job_id, {"status": "completed", "finished_dt": datetime.now(tz=tz_kst)})
+    logger.info("job_done", job_id=job_id, total=len(doc_ids))
+
+
+# ====== [작업 생성/조회] ======
+
+async def create_job(user_id: str, doc_ids: Optional[List[str]] = None, category_id: Optional[str] = None) -> dict:
+    target_ids = await resolve_doc_ids(user_id, doc_ids, category_id)
+    job_id = format_id("job", await next_sequence("analysis_job_id"))
+    now = datetime.now(tz=tz_kst)
+    job = {
+        "job_id": job_id,
+        "user_id": user_id,
+        "category_id": category_id,
+        "doc_ids": target_ids,
+        "status": "queued",
+        "worker": WORKER_ID,
+        "total": len(target_ids),
+        "processed": 0,
+        "succeeded": 0,
+        "skipped": 0,
+        "failed": 0,
+        "sentences": 0,
+        "errors": [],
+        "created_dt": now,
+        "updated_dt": now,
+    }
+    await job_collection.insert_one(job)
+
+    task = asyncio.get_running_loop().create_task(run_job(job_id, user_id, target_ids))
+    _tasks[job_id] = task
+    task.add_done_callback(lambda _: _tasks.pop(job_id, None))
+    return {k: v for k, v in job.items() if k not in ("_id", "doc_ids")}
+
+async def get_job(job_id: str, user_id: str) -> Optional[dict]:
+    return await job_collection.find_one({"job_id": job_id, "user_id": user_id}, JOB_STATUS_PROJECTION)
+
+def _worker_alive(worker: Optional[str]) -> bool:
+    # worker 가 없는 옛 작업은 끊긴 것으로, 다른 호스트의 작업은 알 수 없으므로 살아 있다고 봄
+    host, _, pid = (worker or "").rpartition(":")
+    if host != socket.gethostname():
+        return bool(worker)
+    # 같은 pid 는 재시작 후 재사용된 것 (컨테이너 PID 1 등) → 이 프로세스의 _tasks 에 없으면 끊긴 작업
+    if not pid.isdigit() or int(pid) == os.getpid():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+async def recover_interrupted_jobs() -> int:
+    """시작 시: 이 호스트에서 실행되다 프로세스가 사라진 queued/running 작업을 interrupted 로 표시"""
+    interrupted = []
+    async for job in job_collection.find({"status": {"$in": UNFINISHED_STATUSES}}, {"_id": 0, "job_id": 1, "worker": 1}):
+        if job["job_id"] not in _tasks and not _worker_alive(job.get("worker")):
+            interrupted.append(job["job_id"])
+    if interrupted:
+        now = datetime.now(tz=tz_kst)
+        await job_collection.update_many(
+            {"job_id": {"$in": interrupted}, "status": {"$in": UNFINISHED_STATUSES}},
+            {"$set": {"status": "interrupted", "finished_dt": now, "updated_dt": now}},
+        )
+        logger.info("jobs_interrupted", count=len(interrupted))
+    return len(interrupted)
+
+async def stop_analysis_jobs():
+    # 종료 시 실행 중인 작업은 취소 (작업 문서는 cancelled 로 남음)
+    tasks = list(_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    _tasks.clear()
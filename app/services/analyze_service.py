@@ -1,39 +1,106 @@
 # ✅ app/services/analyze_service.py
 
+import asyncio
 import hashlib
 import re
-from typing import List, Dict
-from motor.motor_asyncio import AsyncIOMotorClient
-from app.core.config import Settings
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+from pymongo import ReturnDocument, UpdateOne
+from app.core.database import db
+from app.core.config import settings
+from app.core.logger import get_logger
 from app.models.analyze_model import SentenceAnalysis
-from app.services.exaone_client import run_exaone_batch
-import kss
-from nltk.tokenize import sent_tokenize
-from langdetect import detect
-import nltk
-import sys
+from app.services.inference_scheduler import exaone_scheduler
+from app.services.exaone_client import get_model_version, find_keyword_spans, is_error_result
+from app.services.sentence_cache import get_cached_sentences, save_cached_sentences
+from app.utils.lru_cache import LRUCache
+from app.services.sentence_splitter import split_text
+from app.services.split_executor import split_in_pool
+from langdetect import detect, DetectorFactory
+from langdetect.lang_detect_exception import LangDetectException
 
-nltk.download('punkt', quiet=True)
+logger = get_logger("analyze")
+
+# langdetect 는 기본적으로 실행마다 결과가 달라질 수 있음 → 시드 고정
+DetectorFactory.seed = 0
+
+# 프로세스 내 메모: 언어 감지 (샘플 해시 → 언어), 문장 분리 ((언어, 문단 해시) → 문장 목록)
+language_cache = LRUCache(settings.LANG_DETECT_CACHE_SIZE)
+split_cache = LRUCache(settings.SPLIT_CACHE_SIZE)
+
+# 문단 분리 (줄 단위, 빈 줄 제외) ─ 편집된 문단만 다시 분리하기 위한 단위
+def split_paragraphs(text: str) -> List[str]:
+    return [line for line in text.split("\n") if line.strip()]
+
+# 문단 해시 (원문 그대로 ─ 같은 해시면 이전 분리 결과의 원문 문장을 그대로 재사용)
+def hash_paragraph(paragraph: str) -> str:
+    return hashlib.sha256(paragraph.encode("utf-8")).hexdigest()
+
+# 언어 감지용 샘플: 앞쪽 문단부터 LANG_DETECT_SAMPLE_CHARS 자까지 (문서 전체를 넣지 않음)
+def language_sample(text: str) -> str:
+    sample = []
+    length = 0
+    for paragraph in split_paragraphs(text):
+        sample.append(paragraph)
+        length += len(paragraph)
+        if length >= settings.LANG_DETECT_SAMPLE_CHARS:
+            break
+    return "\n".join(sample)[:settings.LANG_DETECT_SAMPLE_CHARS]
+
+# 언어 감지 (샘플 기준, 결과 메모)
+def detect_language(text: str) -> str:
+    sample = language_sample(text)
+    sample_hash = hash_paragraph(sample)
+    lang = language_cache.get(sample_hash)
+    if lang is None:
+        try:
+            lang = detect(sample)
+        except LangDetectException:
+            lang = "unknown"  # 숫자/기호만 있는 등 판별 불가 → 문단을 통째로 한 문장으로
+        language_cache.put(sample_hash, lang)
+    logger.debug("language_detected", lang=lang)
+    return lang
+
+# 감지된 언어 기준 문장 분리 (문단 해시 기준 메모)
+def split_sentences(text: str, lang: str) -> List[str]:
+    key = (lang, hash_paragraph(text))
+    sentences = split_cache.get(key)
+    if sentences is None:
+        sentences = tuple(split_text(text, lang))
+        split_cache.put(key, sentences)
+    return list(sentences)
+
+# 여러 문단을 한 번에 분리 (메모에 없는 문단만 분리 워커 풀로 보냄) → 문단 순서대로 문장 목록
+async def split_sentences_many(paragraphs: List[str], lang: str) -> List[List[str]]:
+    results = [None] * len(paragraphs)
+    keys = [(lang, hash_paragraph(paragraph)) for paragraph in paragraphs]
+    misses = []
+    for i, key in enumerate(keys):
+        cached = split_cache.get(key)
+        if cached is None:
+            misses.append(i)
+        else:
+            results[i] = list(cached)
+
+    if misses:
+        split_results = await split_in_pool([paragraphs[i] for i in misses], lang)
+        for i, sentences in zip(misses, split_results):
+            split_cache.put(keys[i], tuple(sentences))
+            results[i] = list(sentences)
+    return results
 
 # 문장 분리 함수
 def smart_sentence_split(text: str):
-    lang = detect(text)
-    print(f"[LOG] 감지된 언어: {lang}")
-    if lang == "ko":
-        # kss는 문장 끝 구두점과 공백을 비교적 일관되게 처리하지만,
-        # 혹시 모를 상황을 대비하여 분리 후에도 정규화를 적용하는 것이 좋습니다.
-        return kss.split_sentences(text)
-    elif lang == "en":
-        return sent_tokenize(text)
-    else:
-        print(f"[LOG] 분리된 문장: {text}")
-        return [text]
+    return split_sentences(text, detect_language(text))
 
 # MongoDB 연결 설정
-ATLAS_URI = Settings.ATLAS_URI
-client = AsyncIOMotorClient(ATLAS_URI)
-db = client['uploadedbyusers']
+# analysis_cache    : 문서당 1건 ─ 문장 해시 순서(sentence_hashes), 문단 기록, 모델 지문
+#                     (옛 항목은 sentence_analysis 배열을 통째로 가지고 있음 → 읽기만 지원, 저장 시 새 형식으로 전환)
+# analysis_sentences: (doc_id, 문장 해시)당 1건 ─ 문장 분석 결과. 바뀐 문장만 upsert, 빠진 문장만 삭제
 analysis_collection = db["analysis_cache"]
+sentence_collection = db["analysis_sentences"]
+
+tz_kst = timezone(timedelta(hours=9))
 
 # ✅ 문장 텍스트 정규화 함수 개선
 def normalize_sentence_text(text: str) -> str:
@@ -55,46 +122,262 @@ def hash_sentence(text):
     normalized_text = normalize_sentence_text(text)
     return hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
 
+# 이전 분석 상태 조회용 projection (docs 의 blob/본문 등은 가져오지 않음)
+PREV_CACHE_PROJECTION = {"_id": 0, "sentence_hashes": 1, "sentence_analysis": 1, "paragraphs": 1, "model_version": 1}
+PREV_DOC_PROJECTION = {"_id": 0, "sentence_analysis": 1}
+SENTENCE_RECORD_PROJECTION = {"_id": 0, "hash": 1, "model_version": 1, "result": 1}
+
+def sentence_record_id(doc_id: str, sentence_hash: str) -> str:
+    return f"{doc_id}:{sentence_hash}"
+
+# 문장 해시 순서대로 문장 기록 나열 (기록이 없는 해시는 None)
+def order_sentence_records(sentence_hashes: List[str], records: List[Dict]) -> List[Optional[Dict]]:
+    by_hash = {record["hash"]: record for record in records}
+    return [by_hash.get(sentence_hash) for sentence_hash in sentence_hashes]
+
+# 문서의 문장 기록을 해시 순서대로 (백그라운드 재분석 등 analysis_cache 항목을 이미 가진 경우)
+async def load_sentence_records(doc_id: str, sentence_hashes: List[str]) -> List[Optional[Dict]]:
+    records = await sentence_collection.find({"doc_id": doc_id}, SENTENCE_RECORD_PROJECTION).to_list(length=None)
+    return order_sentence_records(sentence_hashes, records)
+
+# analysis_cache 항목 → 이전 분석 상태
+def _state_from_cache(cache_doc: Dict, records: List[Dict], model_version: str) -> Dict:
+    paragraphs = cache_doc.get("paragraphs") or []
+    current = cache_doc.get("model_version") == model_version
+
+    if "sentence_hashes" in cache_doc:
+        sentence_hashes = cache_doc["sentence_hashes"]
+        ordered = order_sentence_records(sentence_hashes, records)
+        # 기록이 빠진 문장이 있으면 (저장 도중 조회 등) 문단 기록과 맞지 않으므로 문장 원문은 쓰지 않음
+        sentences = [] if any(r is None for r in ordered) else [r["result"].get("text") for r in ordered]
+        # 문서 지문과 문장 기록 지문이 모두 현재 모델일 때만 결과 재사용
+        reusable = [
+            (sentence_hash, record["result"])
+            for sentence_hash, record in zip(sentence_hashes, ordered)
+            if current and record is not None and record.get("model_version") == model_version
+        ]
+        return {
+            "sentence_analysis": [result for _, result in reusable],
+            "hashes": [sentence_hash for sentence_hash, _ in reusable],
+            "sentences": sentences,
+            "paragraphs": paragraphs,
+        }
+
+    # 옛 형식: sentence_analysis 배열 (문단 기록이 맞으면 저장된 문장 해시 사용, 아니면 다시 해시)
+    sentence_analysis = cache_doc["sentence_analysis"]
+    sentences = [s.get("text") for s in sentence_analysis]
+    if build_paragraph_map(paragraphs, sentences):
+        hashes = [h for p in paragraphs for h in p["sentence_hashes"]]
+    else:
+        hashes = [hash_sentence(s["text"]) if "text" in s else None for s in sentence_analysis]
+    return {
+        "sentence_analysis": sentence_analysis if current else [],
+        "hashes": hashes if current else [],
+        "sentences": sentences,
+        "paragraphs": paragraphs,
+    }
+
+# 이전 분석 상태 가져오기
+# → {"sentence_analysis": 현재 모델 기준 재사용 가능한 결과, "hashes": 그 결과들의 문장 해시,
+#    "sentences": 이전 문장 원문, "paragraphs": 문단 기록}
+# (모델 지문이 바뀌어도 문장 분리 결과(문단 기록)는 그대로 재사용 가능)
+# analysis_cache → temp_docs → docs 우선순위는 그대로, 조회는 동시에 보냄 (Atlas 왕복 1번 분량)
+async def load_prev_analysis(doc_id: str) -> Dict:
+    has_analysis = {"doc_id": doc_id, "sentence_analysis": {"$exists": True}}
+    cache_doc, records, temp_doc, doc = await asyncio.gather(
+        # 1. analysis_cache + 문장 기록 (읽기만 ─ 열람 시각은 문서를 열 때 touch_analysis 가 갱신)
+        analysis_collection.find_one({"doc_id": doc_id}, PREV_CACHE_PROJECTION),
+        sentence_collection.find({"doc_id": doc_id}, SENTENCE_RECORD_PROJECTION).to_list(length=None),
+        # 2. temp_docs, 3. docs ─ 분석 결과가 있는 문서만, 분석 결과 필드만
+        db["temp_docs"].find_one(has_analysis, PREV_DOC_PROJECTION),
+        db["docs"].find_one(has_analysis, PREV_DOC_PROJECTION),
+    )
+
+    # 1. analysis_cache 우선 (현재 모델 지문과 다르면 stale → 분석 결과는 재사용하지 않음)
+    if cache_doc and ("sentence_hashes" in cache_doc or "sentence_analysis" in cache_doc):
+        model_version = get_model_version()
+        state = _state_from_cache(cache_doc, records, model_version)
+        if cache_doc.get("model_version") != model_version:
+            logger.info("prev_analysis_stale", doc_id=doc_id, cached_version=cache_doc.get("model_version"))
+        else:
+            logger.debug("prev_analysis_loaded", doc_id=doc_id, source="analysis_cache")
+        return state
+
+    for source, found in (("temp_docs", temp_doc), ("docs", doc)):
+        if found and "sentence_analysis" in found:
+            logger.debug("prev_analysis_loaded", doc_id=doc_id, source=source)
+            sentence_analysis = found["sentence_analysis"]
+            hashes = [hash_sentence(s["text"]) if "text" in s else None for s in sentence_analysis]
+            return {"sentence_analysis": sentence_analysis, "hashes": hashes, "sentences": [], "paragraphs": []}
+
+    logger.debug("prev_analysis_missing", doc_id=doc_id)
+    return {"sentence_analysis": [], "hashes": [], "sentences": [], "paragraphs": []}
+
 # 이전 분석 결과 가져오기
 async def get_prev_analysis(doc_id: str) -> List[Dict]:
-    # 1. analysis_cache 우선
-    cache_doc = await analysis_collection.find_one({"doc_id": doc_id})
-    if cache_doc and "sentence_analysis" in cache_doc:
-        print(f"[LOG] analysis_cache에서 이전 분석 결과 로드됨 (doc_id={doc_id})")
-        return cache_doc["sentence_analysis"]
-
-    # 2. temp_docs
-    doc = await db["temp_docs"].find_one({"doc_id": doc_id})
-    if doc and "sentence_analysis" in doc:
-        print(f"[LOG] temp_docs에서 이전 분석 결과 로드됨 (doc_id={doc_id})")
-        return doc["sentence_analysis"]
-
-    # 3. docs
-    doc = await db["docs"].find_one({"doc_id": doc_id})
-    if doc and "sentence_analysis" in doc:
-        print(f"[LOG] docs에서 이전 분석 결과 로드됨 (doc_id={doc_id})")
-        return doc["sentence_analysis"]
-
-    print(f"[LOG] 이전 분석 결과 캐시를 찾을 수 없음 (doc_id={doc_id})")
-    return []
+    return (await load_prev_analysis(doc_id))["sentence_analysis"]
+
+# 문단 기록(문단 해시 → 문장 해시 목록)과 이전 문장 원문으로 {문단 해시: [(문장 원문, 문장 해시), ...]} 복원
+def build_paragraph_map(paragraphs: List[Dict], sentences: List[str]) -> Dict[str, List[Tuple[str, str]]]:
+    # 문단 기록과 문장 목록의 길이가 맞지 않으면 (옛 항목 등) 사용하지 않음
+    if not paragraphs or sum(len(p.get("sentence_hashes", [])) for p in paragraphs) != len(sentences):
+        return {}
+    paragraph_map = {}
+    offset = 0
+    for paragraph in paragraphs:
+        sentence_hashes = paragraph["sentence_hashes"]
+        paragraph_map[paragraph["hash"]] = list(zip(sentences[offset:offset + len(sentence_hashes)], sentence_hashes))
+        offset += len(sentence_hashes)
+    return paragraph_map
+
+# 본문 → [(문장 원문, 문장 해시), ...], 문단 기록
+# 이전과 같은 문단은 분리/해시를 건너뛰고, 바뀐 문단만 다시 분리 (언어 감지도 바뀐 문단이 있을 때만)
+async def split_with_paragraph_diff(contents: str, paragraph_map: Dict[str, List[Tuple[str, str]]]) -> Tuple[List[Tuple[str, str]], List[Dict]]:
+    paragraphs = split_paragraphs(contents)
+    paragraph_hashes = [hash_paragraph(paragraph) for paragraph in paragraphs]
+    changed = [i for i, paragraph_hash in enumerate(paragraph_hashes) if paragraph_hash not in paragraph_map]
+
+    # 바뀐 문단만 모아 한 번에 분리 (긴 문서는 워커 풀에서 병렬)
+    resplit = {}
+    if changed:
+        lang = detect_language(contents)
+        split_results = await split_sentences_many([paragraphs[i] for i in changed], lang)
+        for i, texts in zip(changed, split_results):
+            resplit[i] = [(text, hash_sentence(text)) for text in texts if text.strip()]
+
+    sentences = []
+    paragraph_records = []
+    for i, paragraph_hash in enumerate(paragraph_hashes):
+        paragraph_sentences = resplit[i] if i in resplit else paragraph_map[paragraph_hash]
+        sentences.extend(paragraph_sentences)
+        paragraph_records.append({"hash": paragraph_hash, "sentence_hashes": [h for _, h in paragraph_sentences]})
+    logger.debug("paragraph_diff", paragraphs=len(paragraph_records), resplit=len(changed))
+    return sentences, paragraph_records
+
+# save_analysis 의 expected_version 기본값 (지문과 무관하게 저장)
+ANY_VERSION = object()
+
+# 문서의 문장 기록 {문장 해시: 모델 지문}
+async def _record_versions(doc_id: str) -> Dict[str, Optional[str]]:
+    records = await sentence_collection.find({"doc_id": doc_id}, {"_id": 0, "hash": 1, "model_version": 1}).to_list(length=None)
+    return {record["hash"]: record.get("model_version") for record in records}
+
+# 기록이 없거나 다른 모델로 분석된 문장만 upsert → upsert 한 문장 해시 목록
+async def _upsert_sentence_records(doc_id: str, by_hash: Dict[str, SentenceAnalysis], existing: Dict[str, Optional[str]], model_version: str) -> List[str]:
+    changed = [h for h in by_hash if existing.get(h) != model_version]
+    if changed:
+        await sentence_collection.bulk_write([
+            UpdateOne(
+                {"_id": sentence_record_id(doc_id, sentence_hash)},
+                {"$set": {
+                    "doc_id": doc_id,
+                    "hash": sentence_hash,
+                    "model_version": model_version,
+                    "result": by_hash[sentence_hash].model_dump(exclude={"index"}),
+                }},
+                upsert=True,
+            )
+            for sentence_hash in changed
+        ], ordered=False)
+    return changed
+
 # 분석 결과 저장
-async def save_analysis(doc_id: str, analysis: List[SentenceAnalysis]):
+async def save_analysis(
+    doc_id: str,
+    analysis: List[SentenceAnalysis],
+    expected_version=ANY_VERSION,
+    paragraphs: Optional[List[Dict]] = None,
+    sentence_hashes: Optional[List[str]] = None,
+) -> bool:
     # 실제로는 analysis_cache 컬렉션에 저장 (get_prev_analysis에서 docs, temp_docs 참조)
+    # expected_version 이 주어지면 그 지문일 때만 덮어씀 (백그라운드 재분석이 최신 결과를 덮지 않도록)
+    # (None 이면 지문이 없는 옛 항목과 일치)
+    # sentence_hashes: analysis 와 같은 순서의 문장 해시 (호출 측에서 이미 계산했으면 넘겨서 재해시 생략)
+    if sentence_hashes is None:
+        sentence_hashes = [hash_sentence(a.text) for a in analysis]
+    model_version = get_model_version()
+
+    query = {"doc_id": doc_id}
+    if expected_version is not ANY_VERSION:
+        query["model_version"] = expected_version
+    fields = {
+        "sentence_hashes": sentence_hashes,
+        "model_version": model_version,
+        "last_accessed_dt": datetime.now(tz=tz_kst),
+    }
+    if paragraphs is not None:
+        fields["paragraphs"] = paragraphs  # [{"hash": 문단 해시, "sentence_hashes": [...]}, ...] (문장 순서와 동일)
+    # save_seq: 저장할 때마다 증가 → 같은 문서를 동시에 저장해도 마지막 저장만 문장 기록을 정리
+    saved = await analysis_collection.find_one_and_update(
+        query,
+        {
+            "$set": fields,
+            # 옛 형식 배열은 새 형식으로 전환하며 제거, 저장에 성공했으므로 재분석 실패 기록도 제거
+            "$unset": {"sentence_analysis": "", "reanalysis_attempts": "", "reanalysis_failed_at": "", "reanalysis_failed_version": ""},
+            "$inc": {"save_seq": 1},
+        },
+        projection={"_id": 0, "save_seq": 1},
+        upsert=expected_version is ANY_VERSION,
+        return_document=ReturnDocument.AFTER,
+    )
+    if saved is None:
+        return False
+
+    # 문장 기록: 없거나 다른 모델로 분석된 문장만 upsert
+    # 같은 해시의 문장이 여럿이면 첫 문장의 원문으로 기록 → 기록의 하이라이트 위치도 그 원문 기준이어야 함
+    by_hash = {}
+    for analyzed, sentence_hash in zip(analysis, sentence_hashes):
+        if sentence_hash in by_hash:
+            continue
+        if not spans_match_text(analyzed):
+            analyzed = SentenceAnalysis(**{**analyzed.model_dump(), "highlight_spans": find_keyword_spans(analyzed.text, analyzed.highlighted)})
+        by_hash[sentence_hash] = analyzed
+    upserted = await _upsert_sentence_records(doc_id, by_hash, await _record_versions(doc_id), model_version)
+
+    # 정리
+    # - 그 사이 다른 저장이 없었으면: 최종 sentence_hashes 에 없는 기록 삭제 후, 동시 저장이 지웠을 수 있는 기록을 다시 채움
+    # - 더 나중 저장이 있었으면: 이 저장이 upsert 한 기록 중 최신 해시 목록에 없는 것만 삭제 (나중 저장의 기록은 건드리지 않음)
+    latest = await analysis_collection.find_one({"doc_id": doc_id}, {"_id": 0, "save_seq": 1, "sentence_hashes": 1}) or {}
+    if latest.get("save_seq") == saved["save_seq"]:
+        result = await sentence_collection.delete_many({"doc_id": doc_id, "hash": {"$nin": list(by_hash)}})
+        upserted += await _upsert_sentence_records(doc_id, by_hash, await _record_versions(doc_id), model_version)
+    else:
+        stale = set(upserted) - set(latest.get("sentence_hashes") or [])
+        result = await sentence_collection.delete_many({"_id": {"$in": [sentence_record_id(doc_id, h) for h in stale]}})
+    removed = result.deleted_count
+
+    logger.debug("analysis_saved", doc_id=doc_id, sentences=len(analysis), upserted=len(upserted), removed=removed)
+    return True
+
+# 문서를 열었을 때 최근 접근 시각 갱신 (백그라운드 재분석 우선순위)
+async def touch_analysis(doc_id: str):
     await analysis_collection.update_one(
         {"doc_id": doc_id},
-        {"$set": {"sentence_analysis": [a.model_dump() for a in analysis]}},
-        upsert=True,
+        {"$set": {"last_accessed_dt": datetime.now(tz=tz_kst)}},
+    )
+
+# 전역 문장 캐시 결과 → 현재 문서의 SentenceAnalysis
+def from_sentence_cache(index: int, text: str, result: dict) -> SentenceAnalysis:
+    analysis = SentenceAnalysis(**{**result, "index": index, "text": text})
+    # 정규화 전 원문(공백 등)이 달라졌으면 하이라이트 위치를 현재 문장 기준으로 다시 계산
+    if result.get("text") != text:
+        analysis.highlight_spans = find_keyword_spans(text, analysis.highlighted)
+    return analysis
+
+# 하이라이트 위치가 문장 원문을 가리키는지 (비속어는 대소문자 무시 매칭)
+def spans_match_text(analysis: SentenceAnalysis) -> bool:
+    return all(
+        analysis.text[span.start:span.end].lower() == span.word.lower()
+        for span in analysis.highlight_spans
     )
-    print(f"[LOG] 분석 결과가 analysis_cache에 저장됨 (doc_id={doc_id})") # ✅ 로그 추가
 
 # EXAONE 결과 처리 (변경 없음)
 async def run_exaone(sentences: List[str]) -> List[SentenceAnalysis]:
-    print(f"[LOG] EXAONE 요청 문장 목록: {sentences}")
-    batch_results = run_exaone_batch(sentences)
-    print(f"[LOG] EXAONE 응답: {batch_results}")
+    logger.debug("exaone_request", sentences=len(sentences))
+    # 동시 요청과 묶어 전용 추론 스레드에서 실행 (이벤트 루프 블로킹 X)
+    batch_results = await exaone_scheduler.submit(sentences)
     results = []
     for idx, (sent, result) in enumerate(zip(sentences, batch_results)):
-        print(f"[LOG] 모델 raw 응답 ({idx}): {result}")
         results.append(
             SentenceAnalysis(
                 index=idx,
@@ -102,83 +385,155 @@ async def run_exaone(sentences: List[str]) -> List[SentenceAnalysis]:
                 flag=result.get("flag", False),
                 label=result.get("label", "문제 없음"),
                 highlighted=result.get("highlighted") if isinstance(result.get("highlighted"), list) else [],
+                highlight_spans=result.get("highlight_spans") if isinstance(result.get("highlight_spans"), list) else [],
                 explanation=result.get("explanation") if isinstance(result.get("explanation"), list) else [],
             )
         )
-    print(f"[LOG] 파싱된 결과: {results}")
+    if logger.debug_enabled():
+        logger.debug("exaone_response", sentences=len(results), flagged=sum(r.flag for r in results))
     return results
 
-# 문서 전체 분석
-async def analyze_document(doc_id: str, contents: str) -> List[SentenceAnalysis]:
-    print(f"[LOG] 문서 분석 시작: doc_id={doc_id}, contents 길이={len(contents)}")
-    
-    # 1. 새로운 문장 리스트로 분리 (원본 텍스트 유지)
-    new_sentences_list_raw = smart_sentence_split(contents)
-    # ✅ 분리된 각 문장 텍스트를 해시하기 전 정규화 (이 리스트는 해시 생성에만 사용)
-    # 이 리스트를 직접 사용하는 대신, 원본 텍스트 리스트와 함께 튜플로 저장하여 사용
-    
-    print(f"[LOG] 분리된 새 문장 수 (정규화 전): {len(new_sentences_list_raw)}")
+# EXAONE 으로 한 묶음 분석 후 전역 문장 캐시에 기록
+async def _classify_chunk(chunk: List[Tuple[int, str]], model_version: str) -> List[SentenceAnalysis]:
+    # EXAONE 모델에 보낼 텍스트 리스트는 원문 텍스트
+    updated_exaone_results = await run_exaone([sent_text for _, sent_text in chunk])
+    for (original_idx, original_sent_text), analyzed_sentence in zip(chunk, updated_exaone_results):
+        analyzed_sentence.index = original_idx
+        analyzed_sentence.text = original_sent_text # 분석 결과의 text는 원문 텍스트로 설정
+
+    # 새로 분석한 문장은 전역 문장 캐시에 기록 (index 는 문서마다 다르므로 제외, 오류 결과 제외)
+    await save_cached_sentences(
+        {
+            hash_sentence(analyzed.text): analyzed.model_dump(exclude={"index"})
+            for analyzed in updated_exaone_results
+            if not is_error_result(analyzed.explanation)
+        },
+        model_version,
+    )
+    return updated_exaone_results
+
+# 문장 분류 (스트리밍): 전역 문장 캐시 적중분을 먼저, 이후 EXAONE 배치가 끝나는 순서대로 ("cache"|"model", 결과 목록)
+async def iter_classified(indexed_sentences: List[Tuple[int, str]]) -> AsyncIterator[Tuple[str, List[SentenceAnalysis]]]:
+    if not indexed_sentences:
+        return
+
+    # 1. 전역 문장 캐시: 다른 문서에서 같은 모델로 이미 분석된 문장은 재사용
+    model_version = get_model_version()
+    pending_hashes = [hash_sentence(sent_text) for _, sent_text in indexed_sentences]
+    global_cached = await get_cached_sentences(pending_hashes, model_version)
+    cached_results = []
+    to_analyze = []
+    for (idx, sent_text), sent_hash in zip(indexed_sentences, pending_hashes):
+        if sent_hash in global_cached:
+            cached_results.append(from_sentence_cache(idx, sent_text, global_cached[sent_hash]))
+        else:
+            to_analyze.append((idx, sent_text))
+    logger.debug("sentence_cache_lookup", requested=len(indexed_sentences), reused=len(cached_results))
+    if cached_results:
+        yield "cache", cached_results
+
+    if not to_analyze:
+        return
+
+    # 2. 나머지는 배치 크기로 나눠 동시에 스케줄러에 넣고, 끝나는 배치부터 내보냄
+    batch_size = settings.EXAONE_MAX_BATCH_SIZE
+    tasks = [
+        asyncio.ensure_future(_classify_chunk(to_analyze[i:i + batch_size], model_version))
+        for i in range(0, len(to_analyze), batch_size)
+    ]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield "model", await finished
+    finally:
+        # 클라이언트가 스트림을 끊으면 남은 배치는 취소
+        for task in tasks:
+            task.cancel()
+
+# 문장 분류: 전역 문장 캐시 조회 후, 없는 문장만 EXAONE 으로 분석 → {원래 인덱스: 결과}
+async def classify_sentences(indexed_sentences: List[Tuple[int, str]]) -> Dict[int, SentenceAnalysis]:
+    results = {}
+    async for _, batch in iter_classified(indexed_sentences):
+        for analyzed in batch:
+            results[analyzed.index] = analyzed
+    return results
+
+# 문서 전체 분석 (스트리밍)
+# 이벤트: {"type": "meta", "total"} → {"type": "sentences", "source": "doc_cache"|"cache"|"model", "sentences"} ... → {"type": "done", "total"}
+async def analyze_document_stream(doc_id: str, contents: str) -> AsyncIterator[Dict]:
+    logger.info("analysis_start", doc_id=doc_id, chars=len(contents))
     
-    # 2. 이전 분석 결과 가져오기 및 해시 맵 생성
-    prev_analysis_raw = await get_prev_analysis(doc_id)
-    prev_analysis_map = {}
-    for s_dict in prev_analysis_raw:
-        if "text" in s_dict:
-            try:
-                sa_obj = SentenceAnalysis(**s_dict)
-                # ✅ 캐시된 문장도 해시 키 생성 시 정규화 적용 (이미 되어있음)
-                # prev_analysis_map의 키는 정규화된 텍스트의 해시값
-                prev_analysis_map[hash_sentence(sa_obj.text)] = sa_obj
-            except Exception as e:
-                print(f"[ERROR] 캐시된 문장 데이터 로드 오류: {s_dict}, 오류: {e}", file=sys.stderr)
-                continue
-    print(f"[LOG] 캐시된 이전 문장 수: {len(prev_analysis_map)}")
+    # 1. 이전 분석 상태 (분석 결과 + 문단 기록) 가져오기
+    prev_state = await load_prev_analysis(doc_id)
+
+    # 2. 문단 단위 diff: 바뀐 문단만 다시 분리/해시, 나머지는 이전 문장 원문과 해시 재사용 (원본 텍스트 유지)
+    paragraph_map = build_paragraph_map(prev_state["paragraphs"], prev_state["sentences"])
+    new_sentences, paragraph_records = await split_with_paragraph_diff(contents, paragraph_map)
+    logger.debug("sentences_split", doc_id=doc_id, sentences=len(new_sentences))
+    yield {"type": "meta", "doc_id": doc_id, "total": len(new_sentences)}
+
+    # 3. 이전 분석 결과 해시 맵 생성 (저장된 문장 해시 사용 ─ 재해시 없음, 재사용할 때만 SentenceAnalysis 생성)
+    prev_analysis_map = {
+        prev_hash: s_dict
+        for s_dict, prev_hash in zip(prev_state["sentence_analysis"], prev_state["hashes"])
+        if prev_hash is not None and "text" in s_dict
+    }
     
-    # 3. 최종 결과를 저장할 리스트 (미리 크기만큼 None으로 초기화하여 순서 보장)
-    final_analysis_results = [None] * len(new_sentences_list_raw)
+    # 4. 최종 결과를 저장할 리스트 (미리 크기만큼 None으로 초기화하여 순서 보장)
+    final_analysis_results = [None] * len(new_sentences)
 
-    # 4. 새로 분석해야 할 문장들 (원래 인덱스, 원본 텍스트)
+    # 5. 새로 분석해야 할 문장들 (원래 인덱스, 원본 텍스트)
     to_analyze_indexed_sentences = []
+    reused_results = []
     
-    # 5. 1차 순회: 캐시된 결과 사용 또는 분석 대상에 추가
-    for idx, original_sent_text in enumerate(new_sentences_list_raw):
-        # ✅ 현재 문장의 정규화된 해시값을 사용하여 캐시 조회
-        normalized_sent_hash = hash_sentence(original_sent_text)
-        
+    # 6. 1차 순회: 캐시된 결과 사용(새 인덱스로 재배치) 또는 분석 대상에 추가
+    for idx, (original_sent_text, normalized_sent_hash) in enumerate(new_sentences):
         cached_analysis = prev_analysis_map.get(normalized_sent_hash)
-        
+        reused_analysis = None
         if cached_analysis: # 캐시된 결과가 존재하면 재활용
-            reused_analysis = cached_analysis.model_copy()
-            reused_analysis.index = idx
-            reused_analysis.text = original_sent_text # 재활용된 문장의 text는 원본 텍스트로 유지
+            try:
+                # 재활용된 문장의 text는 원본 텍스트로 유지 (원문이 다르면 하이라이트 위치 재계산)
+                reused_analysis = from_sentence_cache(idx, original_sent_text, cached_analysis)
+            except Exception as e:
+                logger.warning("cached_sentence_invalid", doc_id=doc_id, error=e)
+
+        if reused_analysis is not None:
             final_analysis_results[idx] = reused_analysis
-            print(f"[DEBUG] 재활용된 문장: {idx} (내용: {original_sent_text[:30]}...)")
+            reused_results.append(reused_analysis)
         else:
             # 새로운 문장이거나 내용이 변경된 문장 -> 분석 대상에 추가 (원문 텍스트 사용)
             to_analyze_indexed_sentences.append((idx, original_sent_text))
-            print(f"[DEBUG] 분석 대상 문장: {idx} (내용: {original_sent_text[:30]}...)")
-
-    print(f"[LOG] 재분석이 필요한 문장 수: {len(to_analyze_indexed_sentences)}")
-
-    # 6. 2차 순회: 변경되거나 새로 추가된 문장만 EXAONE으로 분석
-    if to_analyze_indexed_sentences:
-        # EXAONE 모델에 보낼 텍스트 리스트는 원문 텍스트
-        sentences_for_exaone = [sent_text for _, sent_text in to_analyze_indexed_sentences]
-        updated_exaone_results = await run_exaone(sentences_for_exaone)
-        
-        # 분석 결과를 최종 결과 리스트의 올바른 위치에 삽입
-        for i, (original_idx, original_sent_text) in enumerate(to_analyze_indexed_sentences):
-            analyzed_sentence = updated_exaone_results[i]
-            analyzed_sentence.index = original_idx
-            analyzed_sentence.text = original_sent_text # 분석 결과의 text는 원문 텍스트로 설정
-            final_analysis_results[original_idx] = analyzed_sentence
-    
-    # 7. None 값이 남아있으면 오류 (모든 인덱스에 결과가 채워져야 함)
+
+    # 캐시된 문장은 모델을 기다리지 않고 바로 내보냄
+    if reused_results:
+        yield {"type": "sentences", "source": "doc_cache", "sentences": reused_results}
+
+    logger.debug("doc_cache_lookup", doc_id=doc_id, cached=len(prev_analysis_map), reused=len(reused_results), to_classify=len(to_analyze_indexed_sentences))
+
+    # 7. 전역 문장 캐시 → EXAONE 순으로 변경되거나 새로 추가된 문장만 분석 (끝나는 배치부터)
+    async for source, batch in iter_classified(to_analyze_indexed_sentences):
+        for analyzed_sentence in batch:
+            final_analysis_results[analyzed_sentence.index] = analyzed_sentence
+        yield {"type": "sentences", "source": source, "sentences": batch}
+
+    # 8. None 값이 남아있으면 오류 (모든 인덱스에 결과가 채워져야 함)
     if any(item is None for item in final_analysis_results):
-        print(f"[ERROR] analyze_document: 일부 문장이 처리되지 않았습니다. {final_analysis_results.count(None)}개 누락.", file=sys.stderr)
+        logger.error("analysis_incomplete", doc_id=doc_id, missing=final_analysis_results.count(None))
         raise RuntimeError("문서 분석 중 예상치 못한 누락 발생: 모든 문장이 처리되지 않았습니다.")
 
-    # 8. 최종 결과 저장 (원문 텍스트를 포함한 최종 결과 저장)
-    await save_analysis(doc_id, final_analysis_results)
-    print(f"[LOG] 문서 분석 완료 및 결과 저장. 최종 문장 수: {len(final_analysis_results)}")
-    return final_analysis_results
\ No newline at end of file
+    # 9. 최종 결과 + 문단 기록 저장 (원문 텍스트를 포함한 최종 결과 저장)
+    await save_analysis(
+        doc_id,
+        final_analysis_results,
+        paragraphs=paragraph_records,
+        sentence_hashes=[sent_hash for _, sent_hash in new_sentences],
+    )
+    logger.info("analysis_done", doc_id=doc_id, sentences=len(final_analysis_results), reused=len(reused_results))
+    yield {"type": "done", "doc_id": doc_id, "total": len(final_analysis_results)}
+
+# 문서 전체 분석 (한 번에 반환)
+async def analyze_document(doc_id: str, contents: str) -> List[SentenceAnalysis]:
+    final_analysis_results = []
+    async for event in analyze_document_stream(doc_id, contents):
+        if event["type"] == "sentences":
+            final_analysis_results.extend(event["sentences"])
+    return sorted(final_analysis_results, key=lambda a: a.index)
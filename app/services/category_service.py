@@ -1,16 +1,13 @@
 # app/services/category_service.py
 
-import os
-import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.database import db
+from app.core.config import settings
+from app.services.sequence_service import next_sequence, parse_id_number, format_id
 
 # MongoDB 설정
-MONGO_URI = os.getenv("ATLAS_URI")
-client = AsyncIOMotorClient(MONGO_URI)
-db = client["uploadedbyusers"]
 collection = db["categories"]
 doc_collection = db["docs"]
 
@@ -20,14 +17,6 @@ tz_kst = timezone(timedelta(hours=9))
 
 # ===== 유틸 =====
 
-def build_next_category_id(current_id: Optional[str]) -> str:
-    if current_id:
-        match = re.search(r"category_(\d{8})", current_id)
-        next_number = int(match.group(1)) + 1 if match else 1
-    else:
-        next_number = 1
-    return f"category_{next_number:08d}"
-
 def create_path(label: str) -> str:
     return f"/dashboard/{label.lower()}"
 
@@ -35,13 +24,17 @@ def create_path(label: str) -> str:
 # ===== 기능 =====
 
 # 카테고리 ID 생성
-async def get_next_category_id():
+async def get_latest_category_number() -> int:
     latest = await collection.find_one(
         {"category_id": {"$regex": "^category_\\d{8}$"}},
+        {"category_id": 1},
         sort=[("category_id", -1)]
     )
-    current_id = latest["category_id"] if latest else None
-    return build_next_category_id(current_id)
+    return parse_id_number(latest["category_id"] if latest else None, "category")
+
+async def get_next_category_id():
+    number = await next_sequence("category_id", seed=get_latest_category_number, block_size=settings.ID_BLOCK_SIZE)
+    return format_id("category", number)
 
 # 카테고리 조회
 async def get_categories(user_id: str):
@@ -1,18 +1,13 @@
 # app/services/chat_service.py
 
-import os
-import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.database import db
 from app.models.chat_model import ChatSendRequest
-from app.core.config import Settings
+from app.services.sequence_service import next_sequence, parse_id_number, format_id
 
 # MongoDB 설정
-ATLAS_URI = Settings.ATLAS_URI
-client = AsyncIOMotorClient(ATLAS_URI)
-db = client['uploadedbyusers']
 collection = db['chat_qas']
 
 # 시간대 설정
@@ -32,17 +27,17 @@ async def get_curr_chat_id(doc_id: str):
 
 
 async def get_next_chat_id(doc_id: str):
-    # 해당 doc_id에서 chat_id 중 가장 큰 값을 찾음
-    latest = await collection.find_one(
-        {"doc_id": doc_id, "chat_id": {"$regex": "^chat_\\d{8}$"}},
-        sort=[("chat_id", -1)]
-    )
-    if latest and "chat_id" in latest:
-        match = re.search(r"chat_(\d{8})", latest["chat_id"])
-        next_number = int(match.group(1)) + 1 if match else 1
-    else:
-        next_number = 1
-    return f"chat_{next_number:08d}"
+    # chat_id 는 문서별 시퀀스 (counters 의 chat:{doc_id})
+    async def latest_chat_number() -> int:
+        latest = await collection.find_one(
+            {"doc_id": doc_id, "chat_id": {"$regex": "^chat_\\d{8}$"}},
+            {"chat_id": 1},
+            sort=[("chat_id", -1)]
+        )
+        return parse_id_number(latest.get("chat_id") if latest else None, "chat")
+
+    number = await next_sequence(f"chat:{doc_id}", seed=latest_chat_number)
+    return format_id("chat", number)
 
 
 def convert_chat_qa(doc: dict) -> dict:
@@ -0,0 +1,68 @@
+# app/services/content_cache.py
+# 파일 내용 해시(sha256) 기준으로 추출 본문/토픽을 재사용하는 캐시
+
+import hashlib
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+
+from app.core.database import db
+
+# ====== 설정 ======
+collection = db['content_cache']
+
+tz_kst = timezone(timedelta(hours=9))
+
+# 프로세스 단위 적중 통계
+CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+# ====== [공통 유틸 함수] ======
+
+def hash_content(data) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data or b"").hexdigest()
+
+def get_cache_stats() -> dict:
+    total = CACHE_STATS["hits"] + CACHE_STATS["misses"]
+    return {
+        **CACHE_STATS,
+        "hit_rate": round(CACHE_STATS["hits"] / total, 4) if total else 0.0,
+    }
+
+
+# ====== [캐시 조회/저장] ======
+
+async def get_cached_content(content_hash: str) -> Optional[dict]:
+    cached = await collection.find_one_and_update(
+        {"_id": content_hash},
+        {"$inc": {"hit_count": 1}, "$set": {"last_hit_dt": datetime.now(tz=tz_kst)}},
+    )
+    if cached:
+        CACHE_STATS["hits"] += 1
+    else:
+        CACHE_STATS["misses"] += 1
+    return cached
+
+async def save_cached_content(content_hash: str, file_type: str, contents: str):
+    # 같은 파일이 동시에 올라와도 먼저 저장된 결과를 유지
+    await collection.update_one(
+        {"_id": content_hash},
+        {"$setOnInsert": {
+            "file_type": file_type,
+            "contents": contents,
+            "text_hash": hash_content(contents),
+            "hit_count": 0,
+            "created_dt": datetime.now(tz=tz_kst),
+        }},
+        upsert=True,
+    )
+
+async def update_cached_topic(content_hash: Optional[str], contents: str, topic_id: int, hashtag: list):
+    # 편집으로 본문이 바뀐 문서의 토픽은 원본 파일 캐시에 기록하지 않음
+    if not content_hash:
+        return
+    await collection.update_one(
+        {"_id": content_hash, "text_hash": hash_content(contents)},
+        {"$set": {"topic_id": topic_id, "hashtag": hashtag}},
+    )
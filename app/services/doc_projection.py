@@ -0,0 +1,35 @@
+# app/services/doc_projection.py
+# docs / temp_docs 조회용 projection 모음
+# - 목록(대시보드/휴지통): 가벼운 요약 + 본문 앞부분 preview 만
+# - 에디터: 본문 포함, blob 제외
+# - 다운로드만 원본 파일을 읽음 (GridFS / 레거시 file_blob)
+
+PREVIEW_LENGTH = 200
+
+# contents 가 문자열일 때만 앞부분을 잘라 preview 로 (레거시 bytes 본문은 빈 문자열)
+_PREVIEW_EXPR = {
+    "$cond": [
+        {"$eq": [{"$type": "$contents"}, "string"]},
+        {"$substrCP": ["$contents", 0, PREVIEW_LENGTH]},
+        "",
+    ]
+}
+
+DOC_SUMMARY_PROJECTION = {
+    "_id": 0,
+    "doc_id": 1,
+    "user_id": 1,
+    "title": 1,
+    "file_type": 1,
+    "category_id": 1,
+    "topic_id": 1,
+    "hashtag": 1,
+    "created_dt": 1,
+    "updated_dt": 1,
+    "delete_yn": 1,
+    "preview": _PREVIEW_EXPR,
+}
+
+DOC_EDITOR_PROJECTION = {"_id": 0, "file_blob": 0, "file_id": 0}
+
+DOC_EXISTS_PROJECTION = {"_id": 1}
@@ -1,27 +1,41 @@
 # app/services/document_service.py
 
-import os
-import re
+import json
+import base64
 from typing import Optional
 from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException
-from motor.motor_asyncio import AsyncIOMotorClient
+from gridfs.errors import NoFile
+from app.core.database import db, get_blob_bucket
 from app.models.document_model import Doc
-from app.services.hwp_extractor import extract_text_from_hwp
-from app.services.hwpx_extractor import extract_text_from_hwpx
+from app.services.extract_executor import extract_text, ExtractionQueueFull
 from app.services.doc_topic import embed_openai
+from app.services.content_cache import hash_content, get_cached_content, save_cached_content, update_cached_topic
+from app.services.sequence_service import next_sequence, parse_id_number, format_id
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.services.doc_projection import DOC_SUMMARY_PROJECTION, DOC_EDITOR_PROJECTION, DOC_EXISTS_PROJECTION
 # ====== 설정 ======
-ATLAS_URI = os.getenv("ATLAS_URI")
-client = AsyncIOMotorClient(ATLAS_URI)
-db = client['uploadedbyusers']
 collection = db['docs']
 temp_collection = db['temp_docs']
 
 DELETE_YES = "y"
 DELETE_NO = "n"
+logger = get_logger("document")
 tz_kst = timezone(timedelta(hours=9))
 
+# 대시보드 페이지네이션
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+SORT_OPTIONS = {
+    "updated_desc": ("updated_dt", -1),
+    "updated_asc": ("updated_dt", 1),
+    "created_desc": ("created_dt", -1),
+    "created_asc": ("created_dt", 1),
+    "title_asc": ("title", 1),
+}
+
 
 # ====== [공통 유틸 함수] ======
 
@@ -31,45 +45,119 @@ def to_kst(dt: Optional[datetime]) -> Optional[str]:
     return None
 
 def serialize_doc(doc):
+    # DOC_SUMMARY_PROJECTION 으로 읽은 목록용 요약 (본문 대신 preview)
     return {
         "doc_id": str(doc.get("doc_id")),
         "user_id": doc["user_id"],
         "title": doc["title"],
-        "contents": doc["contents"],
+        "preview": doc.get("preview", ""),
         "created_dt": to_kst(doc.get("created_dt")),
         "updated_dt": to_kst(doc.get("updated_dt")),
         "file_type": doc["file_type"],
         "category_id": doc.get("category_id", ""),
+        "topic_id": doc.get("topic_id"),
+        "hashtag": doc.get("hashtag", []),
         "delete_yn": doc.get("delete_yn", DELETE_NO),
     }
 
-def build_next_doc_id(current_id: Optional[str]) -> str:
-    if current_id:
-        match = re.search(r"doc_(\d{8})", current_id)
-        next_number = int(match.group(1)) + 1 if match else 1
+def encode_cursor(value, doc_id: str) -> str:
+    if isinstance(value, datetime):
+        payload = {"t": "dt", "v": value.isoformat(), "id": doc_id}
     else:
-        next_number = 1
-    return f"doc_{next_number:08d}"
+        payload = {"t": "raw", "v": value, "id": doc_id}
+    return base64.urlsafe_b64encode(json.dumps(payload, ensure_ascii=False).encode("utf-8")).decode("ascii")
 
-async def get_next_doc_id():
+def decode_cursor(cursor: str):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+        value = payload["v"]
+        if payload["t"] == "dt" and value is not None:
+            value = datetime.fromisoformat(value)
+        return value, payload["id"]
+    except Exception:
+        raise ValueError("잘못된 cursor 입니다.")
+
+def build_keyset_filter(field: str, direction: int, value, doc_id: str) -> dict:
+    # (field, doc_id) 순서쌍 기준으로 cursor 다음 위치부터 조회
+    # Mongo 정렬에서 null(필드 없음)은 가장 작은 값 취급
+    op = "$lt" if direction < 0 else "$gt"
+    same_value = {field: value, "doc_id": {op: doc_id}}
+    if value is None:
+        if direction < 0:
+            return same_value
+        return {"$or": [same_value, {field: {"$ne": None}}]}
+    conditions = [{field: {op: value}}, same_value]
+    if direction < 0:
+        conditions.append({field: None})
+    return {"$or": conditions}
+
+async def get_latest_doc_number() -> int:
+    # counters 최초 생성 시에만 사용 (기존 문서 번호 이어가기)
     latest_doc = await collection.find_one(
         {"doc_id": {"$regex": "^doc_\\d{8}$"}},
+        {"doc_id": 1},
         sort=[("doc_id", -1)]
     )
-    current_id = latest_doc["doc_id"] if latest_doc else None
-    return build_next_doc_id(current_id)
+    return parse_id_number(latest_doc["doc_id"] if latest_doc else None, "doc")
+
+async def get_next_doc_id():
+    number = await next_sequence("doc_id", seed=get_latest_doc_number, block_size=settings.ID_BLOCK_SIZE)
+    return format_id("doc", number)
 
 
 # ======================== 대시보드 ========================
 
-async def get_documents(user_id: str, category_id: Optional[str] = None):
+def _dashboard_query(user_id: str, category_id: Optional[str], topic_id: Optional[int], sort: str):
+    if sort not in SORT_OPTIONS:
+        raise ValueError(f"지원하지 않는 정렬입니다: {sort}")
     query = {"user_id": user_id, "delete_yn": DELETE_NO}
     if category_id:
         query["category_id"] = category_id
+    if topic_id is not None:
+        query["topic_id"] = topic_id
+    return query, SORT_OPTIONS[sort]
 
-    docs = await collection.find(query).to_list(length=None)
+async def get_all_documents(
+    user_id: str,
+    category_id: Optional[str] = None,
+    topic_id: Optional[int] = None,
+    sort: str = "updated_desc",
+):
+    # 페이지네이션 이전 응답 형식 (전체 목록을 배열로) ─ limit/cursor 를 보내지 않는 기존 클라이언트용
+    query, (field, direction) = _dashboard_query(user_id, category_id, topic_id, sort)
+    docs = await collection.find(query, DOC_SUMMARY_PROJECTION) \
+        .sort([(field, direction), ("doc_id", direction)]) \
+        .to_list(length=None)
     return [serialize_doc(doc) for doc in docs]
 
+async def get_documents(
+    user_id: str,
+    category_id: Optional[str] = None,
+    topic_id: Optional[int] = None,
+    sort: str = "updated_desc",
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+):
+    query, (field, direction) = _dashboard_query(user_id, category_id, topic_id, sort)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor:
+        value, last_doc_id = decode_cursor(cursor)
+        query.update(build_keyset_filter(field, direction, value, last_doc_id))
+
+    docs = await collection.find(query, DOC_SUMMARY_PROJECTION) \
+        .sort([(field, direction), ("doc_id", direction)]) \
+        .limit(limit + 1) \
+        .to_list(length=limit + 1)
+
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    next_cursor = encode_cursor(docs[-1].get(field), docs[-1]["doc_id"]) if has_more else None
+    return {
+        "items": [serialize_doc(doc) for doc in docs],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
+
 async def update_document_title(doc_id: str, user_id: str, new_title: str) -> bool:
     result = await collection.update_one(
         {"doc_id": doc_id, "user_id": user_id},
@@ -77,19 +165,53 @@ async def update_document_title(doc_id: str, user_id: str, new_title: str) -> bo
     )
     return result.modified_count > 0
 
-async def update_document_topic(doc_id: str, user_id: str, topic_id: int, hashtag: list) -> None:
+async def update_document_topic(doc_id: str, user_id: str, topic_id: int, hashtag: list,
+                                content_hash: Optional[str] = None, contents: Optional[str] = None) -> None:
     await collection.update_one(
         {"doc_id": doc_id, "user_id": user_id},
         {"$set": {"topic_id": topic_id, "hashtag": hashtag}}
     )
+    if content_hash and contents:
+        await update_cached_topic(content_hash, contents, topic_id, hashtag)
 
 async def download_file(doc_id: str, user_id: str):
-    doc = await temp_collection.find_one({"doc_id": doc_id, "user_id": user_id}) or \
-          await collection.find_one({"doc_id": doc_id, "user_id": user_id})
+    query = {"doc_id": doc_id, "user_id": user_id}
+    doc = await temp_collection.find_one(query, {"_id": 0})
     if doc:
-        doc.pop("_id", None)
+        return doc
+    doc = await collection.find_one(query, {"_id": 0, "file_blob": 0})
+    if doc and not doc.get("file_id"):
+        # GridFS 이전에 업로드된 문서: 인라인 blob 을 그대로 사용
+        doc = await collection.find_one(query, {"_id": 0})
     return doc
 
+async def open_file_stream(doc: dict, chunk_size: int = 255 * 1024):
+    """다운로드 본문을 청크 단위로 내보내는 async iterator 반환 (GridFS 는 미리 열어 404/에러를 먼저 확인)"""
+    file_id = doc.get("file_id")
+    if file_id:
+        try:
+            grid_out = await get_blob_bucket().open_download_stream(file_id)
+        except NoFile:
+            logger.warning("blob_missing", doc_id=doc.get("doc_id"), file_id=str(file_id))
+            raise HTTPException(status_code=404, detail="원본 파일을 찾을 수 없습니다.")
+
+        async def gridfs_chunks():
+            while True:
+                chunk = await grid_out.readchunk()
+                if not chunk:
+                    break
+                yield chunk
+        return gridfs_chunks()
+
+    data = doc.get("file_blob") or doc.get("contents") or b""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    async def memory_chunks():
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+    return memory_chunks()
+
 async def delete_file(doc_id: str, user_id: str):
     result = await collection.update_one(
         {"doc_id": doc_id, "user_id": user_id},
@@ -102,37 +224,68 @@ async def delete_file(doc_id: str, user_id: str):
 
 async def upload_file(file: Doc):
     file_dict = file.model_dump()
+    file_blob = file_dict.pop("file_blob", None) or b""
+    content_hash = hash_content(file_blob)
+    file_dict["content_hash"] = content_hash
     contents = ""
-    try:
-        if file.file_type == "hwp":
-            contents = extract_text_from_hwp(file.file_blob)
-        elif file.file_type == "hwpx":
-            contents = extract_text_from_hwpx(file.file_blob)
-    except Exception as e:
-        print(f"[upload_file] 파일 파싱 실패: {e}")
+    parse_error = None
+
+    cached = await get_cached_content(content_hash)
+    if cached:
+        # 같은 파일을 다시 올린 경우: 추출/임베딩/토픽 분석을 모두 건너뜀
+        # (문장 분석은 다른 사용자의 문서를 복사하지 않음 → 첫 분석 시 본문 문장 해시로 전역 문장 캐시에서 재사용)
+        contents = cached.get("contents", "")
+        if cached.get("topic_id") is not None:
+            file_dict["topic_id"] = cached["topic_id"]
+            file_dict["hashtag"] = cached.get("hashtag", [])
+    else:
+        try:
+            # 업로드당 한 번만, 이벤트 루프 밖(추출 풀)에서 파싱
+            contents = await extract_text(file.file_type, file_blob)
+        except ExtractionQueueFull:
+            raise
+        except Exception as e:
+            logger.warning("parse_failed", doc_id=file.doc_id, file_type=file.file_type, error=str(e))
+            parse_error = str(e)
+        if parse_error is None and contents:
+            await save_cached_content(content_hash, file.file_type, contents)
+
     file_dict["contents"] = contents
-    result = await collection.insert_one(file_dict)
+    # 대시보드 정렬(updated_dt) 기준이 비지 않도록 업로드 시각으로 채움
+    file_dict["updated_dt"] = file_dict.get("updated_dt") or file_dict["created_dt"]
+    file_dict["file_id"] = await get_blob_bucket().upload_from_stream(
+        f"{file.title}.{file.file_type}",
+        file_blob,
+        metadata={"doc_id": file.doc_id, "user_id": file.user_id, "content_hash": content_hash},
+    )
+    try:
+        result = await collection.insert_one(file_dict)
+    except Exception:
+        await _delete_orphan_blob(file_dict["file_id"])
+        raise
     if result.inserted_id:
-        return {"message": "Doc registered successfully", "doc_id": file_dict["doc_id"]}
+        return {"message": "Doc registered successfully", "doc_id": file_dict["doc_id"], "parse_error": parse_error}
+    await _delete_orphan_blob(file_dict["file_id"])
     return {"message": "Failed to register doc"}
 
+async def _delete_orphan_blob(file_id):
+    # 문서 등록에 실패하면 먼저 올린 GridFS blob 을 참조하는 문서가 없으므로 지움
+    try:
+        await get_blob_bucket().delete(file_id)
+    except Exception as e:
+        logger.warning("blob_delete_failed", file_id=str(file_id), error=str(e))
+
 
 # ======================== 챗봇/에디터 ========================
 
 async def has_temp_doc(doc_id: str, user_id: str) -> bool:
-    return await temp_collection.find_one({"doc_id": doc_id, "user_id": user_id}) is not None
+    return await temp_collection.find_one({"doc_id": doc_id, "user_id": user_id}, DOC_EXISTS_PROJECTION) is not None
 
 async def get_temp_doc(doc_id: str, user_id: str):
-    doc = await temp_collection.find_one({"doc_id": doc_id, "user_id": user_id})
-    if doc:
-        doc.pop("_id", None)
-    return doc
+    return await temp_collection.find_one({"doc_id": doc_id, "user_id": user_id}, DOC_EDITOR_PROJECTION)
 
 async def get_doc(doc_id: str, user_id: str):
-    doc = await collection.find_one({"doc_id": doc_id, "user_id": user_id})
-    if doc:
-        doc.pop("_id", None)
-    return doc
+    return await collection.find_one({"doc_id": doc_id, "user_id": user_id}, DOC_EDITOR_PROJECTION)
 
 async def delete_temp_doc(doc_id: str, user_id: str):
     await temp_collection.delete_one({"doc_id": doc_id, "user_id": user_id})
@@ -140,9 +293,9 @@ async def delete_temp_doc(doc_id: str, user_id: str):
 async def update_temp_doc(doc_id: str, user_id: str, update_data: dict):
     now = datetime.now(tz=tz_kst)
     update_data["updated_dt"] = now
-    doc = await temp_collection.find_one({"doc_id": doc_id, "user_id": user_id})
+    doc = await temp_collection.find_one({"doc_id": doc_id, "user_id": user_id}, DOC_EXISTS_PROJECTION)
     if not doc:
-        origin = await collection.find_one({"doc_id": doc_id, "user_id": user_id})
+        origin = await collection.find_one({"doc_id": doc_id, "user_id": user_id}, DOC_EDITOR_PROJECTION)
         if not origin:
             return None
         base_doc = {
@@ -162,13 +315,13 @@ async def update_temp_doc(doc_id: str, user_id: str, update_data: dict):
 
 async def finalize_temp_doc(doc_id: str, user_id: str):
     # 1. 임시 저장된 문서를 가져옵니다.
-    temp_doc = await temp_collection.find_one({"doc_id": doc_id, "user_id": user_id})
+    temp_doc = await temp_collection.find_one({"doc_id": doc_id, "user_id": user_id}, {"title": 1, "contents": 1})
     if not temp_doc:
         # 임시 저장된 내용이 없으면 저장할 것도 없으므로 종료합니다.
         return {"success": True, "message": "No temporary document to finalize."}
 
     # 2. 원본 문서를 가져옵니다.
-    origin_doc = await collection.find_one({"doc_id": doc_id, "user_id": user_id})
+    origin_doc = await collection.find_one({"doc_id": doc_id, "user_id": user_id}, {"title": 1, "contents": 1})
     if not origin_doc:
         # 원본이 없는 비정상적인 경우
         raise HTTPException(status_code=403, detail="Forbidden: You do not own this document.")
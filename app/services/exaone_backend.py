@@ -0,0 +1,161 @@
+# app/services/exaone_backend.py
+# EXAONE + LoRA 분류기의 CPU 추론 백엔드 (EXAONE_BACKEND 로 선택)
+# - torch     : PeftModel 그대로 (기본값)
+# - quantized : LoRA 병합(merge_and_unload) 후 Linear 레이어 동적 int8 양자화
+# - onnx      : LoRA 병합 후 ONNX 로 내보내 onnxruntime 으로 실행 (onnxruntime 설치 필요)
+# 어떤 백엔드든 시작 시 PyTorch 경로와 예측 일치율을 비교해, 기준 미달이면 torch 로 되돌린다.
+import gc
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+import torch
+
+from app.core.logger import get_logger
+
+logger = get_logger("exaone")
+
+BACKENDS = ("torch", "quantized", "onnx")
+
+# 패리티 검사용 고정 문장 (HIGHLIGHT_EXAMPLES 키워드 문장과 함께 사용)
+PARITY_SENTENCES = [
+    "정부는 내년 예산안을 국회에 제출했다.",
+    "이번 정책은 국민 모두를 위한 것이라고 장관은 말했다.",
+    "전문가들은 이 조치가 시장에 큰 혼란을 가져올 것이라고 경고했다.",
+    "모든 언론이 이 사실을 숨기고 있다.",
+    "그 정치인은 말도 안 되는 거짓말만 늘어놓았다.",
+    "지역 주민들은 새로운 공원이 생긴다는 소식에 반가워했다.",
+    "이 제품을 쓰지 않는 사람은 시대에 뒤처진 것이다.",
+    "경찰은 사건 경위를 조사 중이라고 밝혔다.",
+]
+
+Runner = Callable[[Dict[str, torch.Tensor]], torch.Tensor]
+
+
+def torch_runner(model) -> Runner:
+    def run(inputs: Dict[str, torch.Tensor]) -> torch.Tensor:
+        with torch.no_grad():
+            return model(**inputs).logits
+    return run
+
+
+def _parity_inputs(tokenizer, sentences: List[str]) -> Dict[str, torch.Tensor]:
+    return dict(tokenizer(sentences, return_tensors="pt", padding=True, truncation=True, max_length=128))
+
+
+# ===== 백엔드별 생성 =====
+
+def _build_quantized(merged_model):
+    # 복사본을 양자화 → 패리티 미달이면 fp32 병합 모델로 되돌릴 수 있도록 원본은 build_backend 가 정리
+    quantized = torch.quantization.quantize_dynamic(merged_model, {torch.nn.Linear}, dtype=torch.qint8)
+    quantized.eval()
+    return quantized
+
+
+def _onnx_is_stale(onnx_path: str, model_dir: str) -> bool:
+    if not os.path.exists(onnx_path):
+        return True
+    onnx_mtime = os.path.getmtime(onnx_path)
+    for name in os.listdir(model_dir):
+        path = os.path.join(model_dir, name)
+        if os.path.isfile(path) and os.path.getmtime(path) > onnx_mtime:
+            return True
+    return False
+
+
+def _build_onnx(merged_model, tokenizer, onnx_path: str, model_dir: str) -> Runner:
+    import onnxruntime as ort  # 선택 의존성: onnx 백엔드를 쓸 때만 필요
+
+    if _onnx_is_stale(onnx_path, model_dir):
+        logger.info("onnx_export_started", path=onnx_path)
+        os.makedirs(os.path.dirname(onnx_path), exist_ok=True)
+        sample = tokenizer(["샘플 문장입니다."], return_tensors="pt", padding=True)
+        torch.onnx.export(
+            merged_model,
+            (sample["input_ids"], sample["attention_mask"]),
+            onnx_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"},
+            },
+            opset_version=17,
+        )
+        logger.info("onnx_export_done", path=onnx_path)
+
+    session = ort.InferenceSession(onnx_path, providers=["CPUExecutionProvider"])
+    input_names = {i.name for i in session.get_inputs()}
+
+    def run(inputs: Dict[str, torch.Tensor]) -> torch.Tensor:
+        feed = {k: v.cpu().numpy() for k, v in inputs.items() if k in input_names}
+        logits = session.run(["logits"], feed)[0]
+        return torch.from_numpy(logits)
+    return run
+
+
+# ===== 패리티 검사 =====
+
+def check_parity(ref_logits: torch.Tensor, candidate: Runner, inputs: Dict[str, torch.Tensor]) -> Tuple[float, float]:
+    """(argmax 일치율, 최대 logit 차이) 반환"""
+    ref_logits = ref_logits.float()
+    cand_logits = candidate(inputs).float()
+    agreement = (ref_logits.argmax(dim=-1) == cand_logits.argmax(dim=-1)).float().mean().item()
+    max_diff = (ref_logits - cand_logits).abs().max().item()
+    return agreement, max_diff
+
+
+def build_backend(
+    model,
+    tokenizer,
+    device,
+    backend: str,
+    onnx_path: str,
+    model_dir: str,
+    min_agreement: float,
+    extra_sentences: Optional[List[str]] = None,
+):
+    """
+    요청된 백엔드를 만들어 (model, runner, 실제 적용된 백엔드 이름) 을 반환.
+    model 은 runner 가 실제로 쓰는 torch 모델만 남긴다 (quantized: int8 모델, onnx: None)
+    → fp32 가중치가 int8 복사본 / ONNX 세션과 함께 메모리에 남지 않음.
+    실패하거나 패리티 기준 미달이면 PyTorch 경로로 되돌린다.
+    """
+    backend = (backend or "torch").lower()
+    if backend not in BACKENDS:
+        logger.error("unknown_backend", backend=backend, fallback="torch")
+        return model, torch_runner(model), "torch"
+    if backend == "torch":
+        return model, torch_runner(model), "torch"
+    if device.type != "cpu":
+        logger.info("backend_cpu_only", backend=backend, device=device, fallback="torch")
+        return model, torch_runner(model), "torch"
+
+    # 병합 전에 PyTorch(PeftModel) 기준 결과를 만들어 둔다
+    parity_inputs = _parity_inputs(tokenizer, PARITY_SENTENCES + list(extra_sentences or []))
+    reference_logits = torch_runner(model)(parity_inputs)
+
+    merged = model
+    try:
+        merged = model.merge_and_unload()
+        merged.eval()
+        if backend == "quantized":
+            runtime_model = _build_quantized(merged)
+            runner = torch_runner(runtime_model)
+        else:
+            runtime_model = None
+            runner = _build_onnx(merged, tokenizer, onnx_path, model_dir)
+    except Exception as e:
+        logger.exception("backend_build_failed", backend=backend, error=str(e), fallback="torch")
+        # merge_and_unload 이후라도 병합된 모델은 PyTorch 경로와 동일한 결과를 낸다
+        return merged, torch_runner(merged), "torch"
+
+    agreement, max_diff = check_parity(reference_logits, runner, parity_inputs)
+    logger.info("backend_parity", backend=backend, agreement=agreement, max_diff=max_diff)
+    if agreement < min_agreement:
+        logger.error("backend_parity_failed", backend=backend, min_agreement=min_agreement, fallback="torch")
+        return merged, torch_runner(merged), "torch"
+    # 통과 → fp32 병합 모델은 더 이상 참조하지 않음
+    del merged
+    gc.collect()
+    return runtime_model, runner, backend
@@ -1,9 +1,9 @@
 # ✅ app/services/exaone_client.py
 import torch
 import os
+import hashlib
 import sys
 import json
-import re
 import chardet
 import pandas as pd
 from typing import List, Dict
@@ -22,9 +22,16 @@ if HOME_DIR not in sys.path:
 
 
 from finetune.utils.prompt_parser import parse_labels_from_prompt_file
+from app.utils.aho_corasick import AhoCorasick, is_word_boundary
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.services.exaone_backend import build_backend, torch_runner
+
+logger = get_logger("exaone")
 
 # 모델 경로 설정
 FINETUNED_MODEL_PATH = os.path.join(HOME_DIR, "ai", "finetuned_exaone_v6") 
+ONNX_MODEL_PATH = settings.EXAONE_ONNX_PATH or os.path.join(FINETUNED_MODEL_PATH, "onnx", "model.onnx")
 BASE_MODEL_PATH = os.path.join(HOME_DIR, "ai", "exaone_small")
 PROMPT_TEMPLATE_FILE = os.path.join(HOME_DIR, "finetune", "prompt_definitions", "classification_prompt.txt")
 SLANGS_FOLDER_PATH = os.path.join(HOME_DIR, "finetune", "slangs")
@@ -33,21 +40,24 @@ HIGHLIGHT_EXAMPLE_PATH = os.path.join(HOME_DIR, "finetune", "label_highlight_exa
 # 글로벌 변수
 LABEL_EXPLANATIONS = {}
 ALL_BADWORDS = set()
+BADWORD_MATCHER = None  # ALL_BADWORDS 로 만든 Aho-Corasick 오토마톤 (load_dependencies 에서 1회 생성)
 HIGHLIGHT_EXAMPLES = {}
-tokenizer, model, device = None, None, None
+tokenizer, model, device = None, None, None  # model: 실행 중인 torch 모델 (onnx 백엔드면 None)
+ID2LABEL = {}
+MODEL_VERSION = None  # 모델 지문 (load_dependencies 에서 계산) ─ 분석 캐시 무효화 기준
+backend_runner, EXAONE_BACKEND = None, "torch"  # inputs -> logits (torch / quantized / onnx)
 
 def load_dependencies():
-    global tokenizer, model, device, LABEL_EXPLANATIONS, ALL_BADWORDS, HIGHLIGHT_EXAMPLES
+    global tokenizer, model, device, ID2LABEL, backend_runner, EXAONE_BACKEND, MODEL_VERSION, LABEL_EXPLANATIONS, ALL_BADWORDS, BADWORD_MATCHER, HIGHLIGHT_EXAMPLES
 
-    print("[INFO] EXAONE 클라이언트 의존성 로딩 시작...")
+    logger.info("dependencies_loading")
 
     try:
         LABEL_EXPLANATIONS = parse_labels_from_prompt_file(PROMPT_TEMPLATE_FILE)
         # ✅ '욕설' 라벨에 대한 수동 설명 추가 제거. prompt_parser에 전적으로 의존.
-        print("[INFO] 라벨 설명 로드 완료.")
-        print(f"[INFO] 로드된 라벨 설명 키: {LABEL_EXPLANATIONS.keys()}")
+        logger.info("label_explanations_loaded", labels=len(LABEL_EXPLANATIONS))
     except Exception as e:
-        print(f"[ERROR] 라벨 설명 로드 실패: {e}")
+        logger.error("label_explanations_failed", error=e)
         raise RuntimeError(f"라벨 설명 로드 실패: {e}")
 
     try:
@@ -61,21 +71,27 @@ def load_dependencies():
         for col in slang_df.columns:
             slang_words.update(slang_df[col].dropna().astype(str).str.strip())
         ALL_BADWORDS = slang_words | lol_words
-        print("[INFO] 비속어 사전 로드 완료.")
-        print(f"[INFO] 로드된 비속어 수: {len(ALL_BADWORDS)}")
+        BADWORD_MATCHER = AhoCorasick(ALL_BADWORDS)
+        logger.info("badwords_loaded", count=len(ALL_BADWORDS))
     except Exception as e:
-        print(f"[ERROR] 비속어 사전 로드 실패: {e}")
+        logger.error("badwords_failed", error=e)
         raise RuntimeError(f"비속어 사전 로드 실패: {e}")
 
     try:
-        print(f"[INFO] 분류 모델 로드 중: {FINETUNED_MODEL_PATH}...")
+        logger.info("model_loading", path=FINETUNED_MODEL_PATH)
         with open(os.path.join(FINETUNED_MODEL_PATH, "id2label.json"), 'r') as f:
             id2label = {int(k): v for k, v in json.load(f).items()}
+        ID2LABEL = id2label
         with open(os.path.join(FINETUNED_MODEL_PATH, "label2id.json"), 'r') as f:
             label2id = json.load(f)
         with open(HIGHLIGHT_EXAMPLE_PATH, 'r', encoding='utf-8') as f:
             HIGHLIGHT_EXAMPLES.update(json.load(f))
-        print(f"[INFO] 로드된 HIGHLIGHT_EXAMPLES: {HIGHLIGHT_EXAMPLES.keys()}")
+        logger.info("highlight_examples_loaded", labels=len(HIGHLIGHT_EXAMPLES))
+
+        MODEL_VERSION = compute_model_fingerprint(
+            FINETUNED_MODEL_PATH, id2label, LABEL_EXPLANATIONS, ALL_BADWORDS, HIGHLIGHT_EXAMPLES
+        )
+        logger.info("model_fingerprint", version=MODEL_VERSION)
 
         tokenizer = AutoTokenizer.from_pretrained(FINETUNED_MODEL_PATH, local_files_only=True)
         # [START]/[END] 토큰 추가 로직은 train_model.py에서만.
@@ -92,56 +108,138 @@ def load_dependencies():
         device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         model.to(device)
         model.eval()
-        print(f"[INFO] 모델 로드 완료. (Device: {device})")
-        print(f"[INFO] 모델의 id2label: {model.config.id2label}")
+        backend_runner = torch_runner(model)
+        logger.info("model_loaded", device=device, labels=len(model.config.id2label))
     except Exception as e:
-        print(f"[ERROR] 파인튜닝된 분류 모델 로드 실패: {e}")
-        tokenizer, model = None, None
+        logger.error("model_load_failed", error=e)
+        tokenizer, model, backend_runner = None, None, None
         raise RuntimeError(f"분류 모델 로드 실패: {e}") 
 
-def contains_badword(content: str, badword_set: set) -> List[str]:
-    found_words = []
-    if isinstance(content, str):
-        for word in badword_set:
-            if re.search(r'\b' + re.escape(word) + r'\b', content, re.IGNORECASE):
-                found_words.append(word)
-    return found_words
+    # 선택 백엔드 (양자화 / ONNX). 실패·패리티 미달 시 build_backend 가 torch 로 되돌림
+    if settings.EXAONE_BACKEND != "torch":
+        highlight_sentences = [kw for kws in HIGHLIGHT_EXAMPLES.values() for kw in kws[:1]]
+        model, backend_runner, EXAONE_BACKEND = build_backend(
+            model, tokenizer, device, settings.EXAONE_BACKEND,
+            onnx_path=ONNX_MODEL_PATH,
+            model_dir=FINETUNED_MODEL_PATH,
+            min_agreement=settings.EXAONE_PARITY_MIN_AGREEMENT,
+            extra_sentences=highlight_sentences,
+        )
+    logger.info("inference_backend", backend=EXAONE_BACKEND)
+
+# 모델 미로드/추론 예외 시 반환되는 대체 결과의 설명 (캐시에 남기면 안 됨)
+ERROR_EXPLANATIONS = ("모델 로드 실패", "분석 오류")
+
+def is_error_result(explanation: List[str]) -> bool:
+    return any(e in ERROR_EXPLANATIONS for e in explanation or [])
+
+def compute_model_fingerprint(model_path: str, id2label: dict, label_explanations: dict, badwords: set, highlight_examples: dict) -> str:
+    """
+    분류 결과에 영향을 주는 요소(모델 경로, 라벨 집합, 라벨 설명, 비속어 사전, 하이라이트 예시)의 지문.
+    하나라도 바뀌면 기존 분석 캐시는 stale 로 취급된다.
+    """
+    payload = json.dumps(
+        {
+            "model_path": os.path.basename(os.path.normpath(model_path)),
+            "id2label": {str(k): v for k, v in id2label.items()},
+            "label_explanations": label_explanations,
+            "badwords": sorted(badwords),
+            "highlight_examples": highlight_examples,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+def is_model_loaded() -> bool:
+    return backend_runner is not None and MODEL_VERSION is not None
+
+def get_model_version() -> str:
+    # 분석 캐시 키/스탬프에 쓰이는 모델 지문 (로드 전에는 모델 디렉터리 이름)
+    return MODEL_VERSION or os.path.basename(FINETUNED_MODEL_PATH)
+
+def find_badword_spans(content: str, matcher: AhoCorasick = None) -> List[Dict]:
+    """
+    문장을 한 번만 훑어 비속어 출현 위치를 모두 반환: [{"word", "start", "end"}, ...]
+    (기존 re.search(r'\b단어\b', IGNORECASE) 와 같은 단어 경계 / 대소문자 규칙)
+    """
+    matcher = matcher or BADWORD_MATCHER
+    if not isinstance(content, str) or matcher is None:
+        return []
+    return [
+        {"word": word, "start": start, "end": end}
+        for start, end, word in matcher.iter_matches(content)
+        if is_word_boundary(content, start) and is_word_boundary(content, end)
+    ]
+
+def contains_badword(content: str, badword_set: set = None) -> List[str]:
+    # 전역 사전이면 미리 만든 오토마톤 사용, 다른 사전이 넘어오면 그때 생성
+    matcher = None
+    if badword_set is not None and badword_set is not ALL_BADWORDS:
+        matcher = AhoCorasick(badword_set)
+    found_words = {}
+    for span in find_badword_spans(content, matcher):
+        found_words.setdefault(span["word"], None)
+    return list(found_words)
+
+def find_keyword_spans(content: str, keywords: List[str]) -> List[Dict]:
+    spans = []
+    for keyword in keywords:
+        if not keyword:
+            continue
+        start = content.find(keyword)
+        while start != -1:
+            spans.append({"word": keyword, "start": start, "end": start + len(keyword)})
+            start = content.find(keyword, start + 1)
+    return sorted(spans, key=lambda span: (span["start"], span["end"]))
+
+def predict_label_ids(sentences: List[str], batch_size: int = None) -> List[int]:
+    """
+    토큰 길이순으로 정렬해 batch_size 단위로 끊어 추론 → 원래 순서로 복원.
+    배치마다 그 배치의 최장 문장까지만 패딩하므로 긴 문장 하나가 전체 배치를 128 토큰으로 늘리지 않음.
+    """
+    batch_size = max(1, batch_size or settings.EXAONE_BATCH_SIZE)
+    encoded = tokenizer(sentences, truncation=True, max_length=128)
+    order = sorted(range(len(sentences)), key=lambda i: len(encoded["input_ids"][i]))
+
+    predicted_ids = [None] * len(sentences)
+    for start in range(0, len(order), batch_size):
+        chunk = order[start:start + batch_size]
+        features = [{key: encoded[key][i] for key in encoded.keys()} for i in chunk]
+        inputs = tokenizer.pad(features, return_tensors="pt")
+        inputs = {k: v.to(device) for k, v in inputs.items()}
+        logits = backend_runner(inputs)
+        for i, pred_id in zip(chunk, torch.argmax(logits, dim=-1).tolist()):
+            predicted_ids[i] = pred_id
+    return predicted_ids
 
 def run_exaone_batch(sentences: List[str]) -> List[Dict]:
-    print(f"[DEBUG] run_exaone_batch 호출됨. 입력 문장 수: {len(sentences)}")
-    if not tokenizer or not model:
-        print("[ERROR] 모델이 로드되지 않았습니다. run_exaone_batch 종료.", file=sys.stderr)
+    logger.debug("batch_start", sentences=len(sentences))
+    if not tokenizer or backend_runner is None:
+        logger.error("model_not_loaded", sentences=len(sentences))
         return [{"flag": False, "highlighted": [], "explanation": ["모델 로드 실패"]}] * len(sentences)
 
     all_results = []
+    debug_enabled = logger.debug_enabled()  # 문장마다 로그 인자를 만들지 않도록 한 번만 확인
     try:
-        inputs = tokenizer(sentences, return_tensors="pt", padding=True, truncation=True, max_length=128)
-        inputs = {k: v.to(device) for k, v in inputs.items()}
-        print(f"[DEBUG] 토크나이징 완료. 입력 ID Shape: {inputs['input_ids'].shape}")
-        with torch.no_grad():
-            outputs = model(**inputs)
-            logits = outputs.logits
-            predicted_ids = torch.argmax(logits, dim=-1)
-        print(f"[DEBUG] 모델 추론 완료. 예측 ID: {predicted_ids.tolist()}")
+        predicted_ids = predict_label_ids(sentences)
 
         for i, sent in enumerate(sentences):
-            pred_id = predicted_ids[i].item()
-            label_name = model.config.id2label[pred_id]
+            pred_id = predicted_ids[i]
+            label_name = ID2LABEL[pred_id]
             
             current_highlighted_list = []
+            current_highlight_spans = []
             final_label_name = label_name 
 
-            print(f"\n--- 문장 {i+1} 분석 시작 ---")
-            print(f"[DEBUG] 원문: '{sent}'")
-            print(f"[DEBUG] 모델 예측 라벨 ID: {pred_id}, 이름: '{label_name}'")
-
             # 1. 비속어 감지 (최우선 처리)
-            detected_badwords = contains_badword(sent, ALL_BADWORDS)
-            print(f"[DEBUG] 비속어 사전 감지 결과: {detected_badwords}")
+            badword_spans = find_badword_spans(sent)
+            detected_badwords = list(dict.fromkeys(span["word"] for span in badword_spans))
             if detected_badwords:
                 final_label_name = "부정적 표현" 
-                current_highlighted_list = list(set(detected_badwords)) 
-                print(f"[DEBUG] 비속어 감지! 최종 라벨 '{final_label_name}'로 강제 설정. 하이라이트: {current_highlighted_list}")
+                current_highlighted_list = detected_badwords
+                current_highlight_spans = badword_spans
             else:
                 # 2. 모델 예측 라벨이 '문제 없음'이 아닐 경우, 해당 라벨의 하이라이트 예시 확인
                 if final_label_name != "문제 없음":
@@ -150,8 +248,7 @@ def run_exaone_batch(sentences: List[str]) -> List[Dict]:
                         if keyword in sent: 
                             current_highlighted_list.append(keyword)
                     current_highlighted_list = list(set(current_highlighted_list))
-                    if current_highlighted_list:
-                        print(f"[DEBUG] 모델 예측 라벨 '{final_label_name}'에 따른 하이라이트: {current_highlighted_list}")
+                    current_highlight_spans = find_keyword_spans(sent, current_highlighted_list)
 
             is_flagged = final_label_name != "문제 없음"
             
@@ -167,22 +264,24 @@ def run_exaone_batch(sentences: List[str]) -> List[Dict]:
                     # ✅ 라벨 이름과 설명을 조합하여 explanation 리스트에 추가
                     final_explanation_list.append(f"{final_label_name}: {explanation_from_map}")
 
-            print(f"[DEBUG] 최종 is_flagged: {is_flagged}")
-            print(f"[DEBUG] 최종 적용 라벨: '{final_label_name}'")
-            print(f"[DEBUG] 최종 설명: '{final_explanation_list}'")
-            print(f"[DEBUG] 최종 하이라이트 리스트: {current_highlighted_list}")
+            if debug_enabled:
+                logger.debug(
+                    "sentence_classified", sample=settings.LOG_DEBUG_SAMPLE_RATE,
+                    predicted=label_name, label=final_label_name, badwords=len(detected_badwords),
+                    highlights=len(current_highlighted_list), chars=len(sent),  # 사용자 원문은 기록하지 않음
+                )
 
             all_results.append({
                 "flag": is_flagged,
                 "highlighted": current_highlighted_list,
+                "highlight_spans": current_highlight_spans, # 원문 내 하이라이트 위치 (start/end offset)
                 "explanation": final_explanation_list, # 수정된 explanation 리스트 사용
                 "label": final_label_name # ✅ 최종 라벨 이름을 딕셔너리에 추가
             })
-        print("\n[DEBUG] run_exaone_batch 모든 문장 처리 완료.")
+        if debug_enabled:
+            logger.debug("batch_done", sentences=len(all_results), flagged=sum(r["flag"] for r in all_results))
         return all_results
 
     except Exception as e:
-        print(f"[ERROR] 문장 분석 오류 발생: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        logger.exception("batch_failed", sentences=len(sentences), error=e)
         return [{"flag": False, "highlighted": [], "explanation": ["분석 오류"]}] * len(sentences)
@@ -0,0 +1,96 @@
+# app/services/extract_executor.py
+# 업로드 본문 추출을 이벤트 루프 밖(프로세스 풀)에서 실행한다.
+# 각 워커 프로세스는 시작 시 JVM을 한 번만 띄우고 계속 재사용한다.
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger("extract")
+
+_executor: Optional[ProcessPoolExecutor] = None
+_pending = 0  # 실행 중 + 대기 중인 추출 작업 수 (이벤트 루프 단일 스레드에서만 갱신)
+
+
+class ExtractionQueueFull(Exception):
+    """추출 대기열이 가득 차서 요청을 받을 수 없음 (→ 503 응답)"""
+
+
+# ===== 워커 프로세스 측 =====
+
+def _init_worker():
+    from app.services.jvm_extractor import start_jvm
+    start_jvm()
+
+
+def _warmup() -> bool:
+    return True
+
+
+def _extract(file_type: str, file_bytes: bytes) -> str:
+    from app.services.jvm_extractor import extract_hwp_bytes, extract_hwpx_bytes
+    if file_type == "hwp":
+        return extract_hwp_bytes(file_bytes)
+    if file_type == "hwpx":
+        return extract_hwpx_bytes(file_bytes)
+    raise ValueError(f"지원하지 않는 파일 형식: {file_type}")
+
+
+# ===== 풀 수명 관리 =====
+
+def get_extract_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # JVM/torch 스레드를 가진 부모를 fork 하지 않도록 spawn 사용
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.EXTRACT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _executor
+
+
+def start_extract_executor():
+    executor = get_extract_executor()
+    # 워커(와 JVM)를 미리 띄워 첫 업로드가 기동 비용을 내지 않도록 함
+    for _ in range(settings.EXTRACT_WORKERS):
+        executor.submit(_warmup)
+    logger.info("extract_pool_started", workers=settings.EXTRACT_WORKERS, queue_limit=settings.EXTRACT_QUEUE_LIMIT)
+
+
+def shutdown_extract_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+# ===== 추출 요청 =====
+
+def ensure_extract_capacity():
+    """대기열이 가득 찼으면 ExtractionQueueFull (doc_id 발급 전에 확인해 503 마다 ID 가 소모되지 않도록)"""
+    if _pending >= settings.EXTRACT_QUEUE_LIMIT:
+        raise ExtractionQueueFull(f"추출 대기열 초과 (pending={_pending})")
+
+
+async def extract_text(file_type: str, file_bytes: bytes) -> str:
+    global _pending
+    ensure_extract_capacity()
+    _pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        executor = get_extract_executor()
+        try:
+            return await loop.run_in_executor(executor, _extract, file_type, file_bytes)
+        except BrokenProcessPool:
+            # 워커(JVM)가 죽으면 풀 전체가 깨짐 → 새 풀로 한 번만 재시도
+            # (동시에 실패한 다른 요청이 이미 새 풀을 만들었으면 그대로 사용)
+            if _executor is executor:
+                shutdown_extract_executor()
+            return await loop.run_in_executor(get_extract_executor(), _extract, file_type, file_bytes)
+    finally:
+        _pending -= 1
@@ -0,0 +1,162 @@
+# app/services/index_registry.py
+# 서비스 쿼리가 사용하는 Mongo 인덱스 목록 + 시작 시 보장(ensure) + explain() 점검
+#
+# CLI:
+#   python -m app.services.index_registry            # 인덱스 생성(멱등)
+#   python -m app.services.index_registry --explain  # 각 서비스 쿼리 explain, COLLSCAN 보고
+
+import sys
+import asyncio
+import argparse
+from typing import Dict, List, Tuple
+
+from app.core.database import db
+from app.core.logger import get_logger
+
+logger = get_logger("index_registry")
+
+# ===== 인덱스 목록 =====
+# {컬렉션: [(키 목록, 인덱스 이름), ...]}  ─ 이름을 고정해 두어야 재실행해도 중복 생성되지 않음
+INDEXES: Dict[str, List[Tuple[list, str]]] = {
+    "docs": [
+        ([("doc_id", 1), ("user_id", 1)], "doc_user"),
+        ([("user_id", 1), ("delete_yn", 1), ("category_id", 1), ("updated_dt", -1), ("doc_id", -1)], "user_delete_category_updated"),
+        ([("user_id", 1), ("delete_yn", 1), ("updated_dt", -1), ("doc_id", -1)], "user_delete_updated"),
+        ([("user_id", 1), ("delete_yn", 1), ("topic_id", 1), ("updated_dt", -1), ("doc_id", -1)], "user_delete_topic_updated"),
+        # created/title 정렬 (카테고리·토픽 필터와 함께 쓰면 이 인덱스로 정렬하고 필터는 FETCH 단계에서 적용)
+        ([("user_id", 1), ("delete_yn", 1), ("created_dt", -1), ("doc_id", -1)], "user_delete_created"),
+        ([("user_id", 1), ("delete_yn", 1), ("title", 1), ("doc_id", 1)], "user_delete_title"),
+        ([("delete_yn", 1)], "delete_yn"),
+        ([("category_id", 1)], "category"),
+    ],
+    "temp_docs": [
+        ([("doc_id", 1), ("user_id", 1)], "doc_user"),
+        ([("user_id", 1)], "user"),
+    ],
+    "chat_qas": [
+        ([("doc_id", 1), ("created_dt", 1)], "doc_created"),
+        ([("doc_id", 1), ("chat_id", -1)], "doc_chat"),
+    ],
+    "users": [
+        ([("user_email", 1), ("provider", 1)], "email_provider"),
+        ([("user_id", 1)], "user"),
+    ],
+    "categories": [
+        ([("user_id", 1)], "user"),
+        ([("category_id", 1)], "category"),
+    ],
+    "analysis_cache": [
+        ([("doc_id", 1)], "doc"),
+        ([("model_version", 1), ("reanalysis_attempts", 1), ("last_accessed_dt", -1)], "version_attempts_accessed"),
+    ],
+    "analysis_sentences": [
+        ([("doc_id", 1)], "doc"),
+    ],
+    "sentence_cache": [
+        ([("model_version", 1)], "version"),
+    ],
+    "analysis_jobs": [
+        ([("job_id", 1), ("user_id", 1)], "job_user"),
+    ],
+}
+
+# ===== explain 점검 대상 쿼리 =====
+# (이름, 컬렉션, filter, sort)
+QUERY_SAMPLES = [
+    ("documents.dashboard", "docs", {"user_id": "user_00000000", "delete_yn": "n"}, [("updated_dt", -1), ("doc_id", -1)]),
+    ("documents.dashboard_category", "docs", {"user_id": "user_00000000", "delete_yn": "n", "category_id": "category_00000000"}, [("updated_dt", -1), ("doc_id", -1)]),
+    ("documents.dashboard_topic", "docs", {"user_id": "user_00000000", "delete_yn": "n", "topic_id": 0}, [("updated_dt", -1), ("doc_id", -1)]),
+    ("documents.dashboard_created", "docs", {"user_id": "user_00000000", "delete_yn": "n"}, [("created_dt", 1), ("doc_id", 1)]),
+    ("documents.dashboard_title", "docs", {"user_id": "user_00000000", "delete_yn": "n"}, [("title", 1), ("doc_id", 1)]),
+    ("documents.get_doc", "docs", {"doc_id": "doc_00000000", "user_id": "user_00000000"}, None),
+    ("documents.get_temp_doc", "temp_docs", {"doc_id": "doc_00000000", "user_id": "user_00000000"}, None),
+    ("ai.retrieve_document", "docs", {"doc_id": "doc_00000000"}, None),
+    ("trash.list", "docs", {"user_id": "user_00000000", "delete_yn": "y"}, None),
+    ("trash.delete_all", "docs", {"delete_yn": "y"}, None),
+    ("chat.history", "chat_qas", {"doc_id": "doc_00000000"}, [("created_dt", 1)]),
+    ("chat.current_chat_id", "chat_qas", {"doc_id": "doc_00000000", "chat_id": {"$regex": "^chat_\\d{8}$"}}, [("chat_id", -1)]),
+    ("user.find_by_email", "users", {"user_email": "a@b.c", "provider": "google"}, None),
+    ("user.find_by_id", "users", {"user_id": "user_00000000"}, None),
+    ("user.delete_temp_docs", "temp_docs", {"user_id": "user_00000000"}, None),
+    ("category.list", "categories", {"user_id": "user_00000000"}, None),
+    ("category.update", "categories", {"category_id": "category_00000000"}, None),
+    ("category.detach_docs", "docs", {"category_id": "category_00000000"}, None),
+    ("analyze.prev_analysis", "analysis_cache", {"doc_id": "doc_00000000"}, None),
+    ("analyze.prev_sentences", "analysis_sentences", {"doc_id": "doc_00000000"}, None),
+    ("reanalysis.stale", "analysis_cache", {"model_version": {"$ne": "0000000000000000"}, "reanalysis_attempts": {"$not": {"$gte": 3}}}, [("reanalysis_attempts", 1), ("last_accessed_dt", -1), ("doc_id", 1)]),
+    ("analysis_job.status", "analysis_jobs", {"job_id": "job_00000000", "user_id": "user_00000000"}, None),
+    ("reanalysis.purge_sentences", "sentence_cache", {"model_version": {"$ne": "0000000000000000"}}, None),
+]
+
+
+# ===== 인덱스 보장 =====
+
+async def ensure_indexes(database=None) -> Dict[str, List[str]]:
+    """INDEXES 를 멱등하게 생성. 실패한 인덱스는 건너뛰고 로그만 남김."""
+    database = db if database is None else database
+    created = {}
+    for coll_name, specs in INDEXES.items():
+        created[coll_name] = []
+        for keys, name in specs:
+            try:
+                await database[coll_name].create_index(keys, name=name)
+                created[coll_name].append(name)
+            except Exception as e:
+                logger.error("index_create_failed", collection=coll_name, index=name, error=str(e))
+    logger.info("indexes_ensured", **{coll_name: len(names) for coll_name, names in created.items()})
+    return created
+
+
+# ===== explain 점검 =====
+
+def _collect_stages(plan) -> List[str]:
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(_collect_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_collect_stages(item))
+    return stages
+
+async def explain_queries(database=None) -> List[dict]:
+    database = db if database is None else database
+    report = []
+    for name, coll_name, query, sort in QUERY_SAMPLES:
+        cursor = database[coll_name].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        try:
+            explain = await cursor.limit(1).explain()
+            stages = _collect_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+            report.append({
+                "name": name,
+                "collection": coll_name,
+                "stages": stages,
+                "collscan": "COLLSCAN" in stages,
+            })
+        except Exception as e:
+            report.append({"name": name, "collection": coll_name, "error": str(e), "collscan": None})
+    return report
+
+
+async def _main(args):
+    await ensure_indexes()
+    if args.explain:
+        report = await explain_queries()
+        for row in report:
+            if row.get("error"):
+                print(f"⚠️  {row['name']:<32} {row['collection']:<16} 오류: {row['error']}")
+            else:
+                mark = "❌ COLLSCAN" if row["collscan"] else "✅"
+                print(f"{mark:<11} {row['name']:<32} {row['collection']:<16} {' > '.join(row['stages'])}")
+        if any(row["collscan"] for row in report):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mongo 인덱스 보장 / explain 점검")
+    parser.add_argument("--explain", action="store_true", help="서비스 쿼리 explain 후 COLLSCAN 보고")
+    asyncio.run(_main(parser.parse_args()))
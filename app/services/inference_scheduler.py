@@ -0,0 +1,140 @@
+# app/services/inference_scheduler.py
+# EXAONE 분류기 마이크로 배칭 스케줄러
+# - 동시에 들어온 analyze 요청들의 문장을 모아 (max_wait_ms 동안) 하나의 배치 묶음으로 처리
+# - 길이순으로 정렬 후 max_batch_size 단위로 잘라 비슷한 길이끼리 배치 (패딩 낭비 감소)
+# - 모델 추론은 전용 스레드 1개에서 실행 → 이벤트 루프를 막지 않음
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.services.exaone_client import run_exaone_batch
+
+logger = get_logger("scheduler")
+
+
+class InferenceScheduler:
+    def __init__(self, infer_fn: Callable[[List[str]], List[Dict]], max_batch_size: int, max_wait_ms: int):
+        self.infer_fn = infer_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0, max_wait_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ===== 수명 관리 =====
+
+    def start(self):
+        if self._task is not None and not self._task.done():
+            return
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="exaone-infer")
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("scheduler_started", max_batch_size=self.max_batch_size, max_wait_ms=int(self.max_wait * 1000))
+
+    async def stop(self):
+        # 취소 시 _run 이 처리 중이던 요청의 future 에도 예외를 넣으므로 호출 측이 영원히 기다리지 않음
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                _fail(future, RuntimeError("추론 스케줄러가 종료되었습니다."))
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    # ===== 요청 =====
+
+    async def submit(self, sentences: List[str]) -> List[Dict]:
+        """문장 목록을 큐에 넣고, 입력 순서대로 정렬된 결과를 기다린다."""
+        if not sentences:
+            return []
+        if self._task is None or self._task.done():
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((list(sentences), future))
+        return await future
+
+    # ===== 워커 =====
+
+    async def _collect(self, requests: List[Tuple[List[str], asyncio.Future]]):
+        # requests 에 바로 채움 → 모으는 도중 취소되어도 큐에서 꺼낸 요청을 _run 이 실패 처리할 수 있음
+        loop = asyncio.get_running_loop()
+        requests.append(await self._queue.get())
+        count = len(requests[0][0])
+        deadline = loop.time() + self.max_wait
+        while count < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                request = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            requests.append(request)
+            count += len(request[0])
+
+    async def _process(self, requests: List[Tuple[List[str], asyncio.Future]]):
+        loop = asyncio.get_running_loop()
+        results = [[None] * len(sentences) for sentences, _ in requests]
+        failed = {}
+
+        # (요청 번호, 문장 번호, 문장) 을 길이순 정렬 → 비슷한 길이끼리 배치
+        items = [
+            (req_idx, sent_idx, text)
+            for req_idx, (sentences, _) in enumerate(requests)
+            for sent_idx, text in enumerate(sentences)
+        ]
+        items.sort(key=lambda item: len(item[2]))
+
+        for start in range(0, len(items), self.max_batch_size):
+            batch = items[start:start + self.max_batch_size]
+            try:
+                outputs = await loop.run_in_executor(self._executor, self.infer_fn, [text for _, _, text in batch])
+            except Exception as e:
+                for req_idx, _, _ in batch:
+                    failed[req_idx] = e
+                continue
+            for (req_idx, sent_idx, _), output in zip(batch, outputs):
+                results[req_idx][sent_idx] = output
+
+        for req_idx, (_, future) in enumerate(requests):
+            if future.done():  # 요청 측이 먼저 취소된 경우
+                continue
+            if req_idx in failed:
+                future.set_exception(failed[req_idx])
+            else:
+                future.set_result(results[req_idx])
+
+    async def _run(self):
+        while True:
+            requests = []
+            try:
+                await self._collect(requests)
+                await self._process(requests)
+            except asyncio.CancelledError:
+                for _, future in requests:
+                    _fail(future, RuntimeError("추론 스케줄러가 종료되었습니다."))
+                raise
+            except Exception as e:
+                for _, future in requests:
+                    _fail(future, e)
+
+
+def _fail(future: asyncio.Future, error: Exception):
+    if not future.done():  # 요청 측이 먼저 취소된 경우는 건너뜀
+        future.set_exception(error)
+
+
+exaone_scheduler = InferenceScheduler(
+    run_exaone_batch,
+    max_batch_size=settings.EXAONE_MAX_BATCH_SIZE,
+    max_wait_ms=settings.EXAONE_MAX_WAIT_MS,
+)
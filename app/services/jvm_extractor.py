@@ -0,0 +1,115 @@
+# app/services/jvm_extractor.py
+# hwplib / hwpxlib 을 한 번 띄운 JVM 위에서 재사용하는 본문 추출기
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+import jpype
+
+from app.core.logger import get_logger
+
+logger = get_logger("extract")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+HWP_JAR_PATH = os.path.join(BASE_DIR, "python-hwplib-main", "hwplib-1.1.8.jar")
+HWPX_JAR_PATH = os.path.join(BASE_DIR, "python-hwpxlib-main", "hwpxlib-1.0.5.jar")
+
+_jvm_lock = threading.Lock()
+
+
+# ===== JVM 수명 관리 =====
+
+def start_jvm():
+    """두 jar를 classpath에 올린 JVM을 프로세스당 한 번만 띄운다 (JPype는 재시작 불가)."""
+    if jpype.isJVMStarted():
+        return
+    with _jvm_lock:
+        if jpype.isJVMStarted():
+            return
+        jpype.startJVM(
+            jpype.getDefaultJVMPath(),
+            classpath=[HWP_JAR_PATH, HWPX_JAR_PATH],
+            convertStrings=True,
+        )
+        logger.info("jvm_started")
+
+
+def shutdown_jvm():
+    if jpype.isJVMStarted():
+        jpype.shutdownJVM()
+
+
+# ===== 입력 변환 =====
+
+def _to_java_stream(file_bytes: bytes):
+    # 파이썬 bytes -> byte[] -> ByteArrayInputStream (디스크를 거치지 않음)
+    byte_array = jpype.JArray(jpype.JByte)(file_bytes)
+    return jpype.JClass("java.io.ByteArrayInputStream")(byte_array)
+
+
+@contextmanager
+def _in_memory_path(file_bytes: bytes, suffix: str):
+    """
+    hwpxlib 1.0.5 의 HWPXReader 는 File/경로만 받으므로(내부에서 ZipFile 사용)
+    memfd(익명 메모리 파일)를 만들어 /proc/self/fd 경로로 넘긴다.
+    memfd 를 쓸 수 없는 플랫폼에서만 임시파일로 대체한다.
+    """
+    if hasattr(os, "memfd_create") and os.path.isdir("/proc/self/fd"):
+        fd = os.memfd_create(f"upload{suffix}", os.MFD_CLOEXEC)
+        try:
+            os.write(fd, file_bytes)
+            yield f"/proc/self/fd/{fd}"
+        finally:
+            os.close(fd)
+        return
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        tmp.write(file_bytes)
+        tmp_path = tmp.name
+    try:
+        yield tmp_path
+    finally:
+        os.remove(tmp_path)
+
+
+# ===== 본문 추출 =====
+
+def extract_hwp_bytes(file_bytes: bytes) -> str:
+    start_jvm()
+    HWPReader_ = jpype.JClass("kr.dogfoot.hwplib.reader.HWPReader")
+    TextExtractMethod_ = jpype.JClass("kr.dogfoot.hwplib.tool.textextractor.TextExtractMethod")
+    TextExtractor_ = jpype.JClass("kr.dogfoot.hwplib.tool.textextractor.TextExtractor")
+
+    parser_obj = HWPReader_.fromInputStream(_to_java_stream(file_bytes))
+
+    extract_methods = [
+        TextExtractMethod_.InsertControlTextBetweenParagraphText,
+        TextExtractMethod_.AppendControlTextAfterParagraphText,
+    ]
+    for method in extract_methods:
+        hwp_text = TextExtractor_.extract(parser_obj, method)
+        if hwp_text.strip():
+            return hwp_text
+    return ""
+
+
+def extract_hwpx_bytes(file_bytes: bytes) -> str:
+    start_jvm()
+    HWPXReader_ = jpype.JClass("kr.dogfoot.hwpxlib.reader.HWPXReader")
+    TextExtractMethod_ = jpype.JClass("kr.dogfoot.hwpxlib.tool.textextractor.TextExtractMethod")
+    TextExtractor_ = jpype.JClass("kr.dogfoot.hwpxlib.tool.textextractor.TextExtractor")
+    TextMarks_ = jpype.JClass("kr.dogfoot.hwpxlib.tool.textextractor.TextMarks")
+
+    with _in_memory_path(file_bytes, ".hwpx") as path:
+        parser_obj = HWPXReader_.fromFilepath(path)
+
+    extract_methods = [
+        TextExtractMethod_.InsertControlTextBetweenParagraphText,
+        TextExtractMethod_.AppendControlTextAfterParagraphText,
+    ]
+    for method in extract_methods:
+        hwpx_text = TextExtractor_.extract(parser_obj, method, True, TextMarks_())
+        if hwpx_text.strip():
+            return hwpx_text.replace(". ", ".\n").replace("? ", "?\n").replace("! ", "!\n")
+    return ""
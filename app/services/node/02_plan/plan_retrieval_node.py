@@ -11,10 +11,13 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 from langchain_core.output_parsers.openai_tools import PydanticToolsParser
 from graph_state import GraphState
+from app.core.logger import get_logger
 
 # 환경 변수 로드
 load_dotenv()
 
+logger = get_logger("graph")
+
 # --- 정당명 타입 정의 ---
 PartyType = Literal["더불어민주당", "국민의힘", "개혁신당", "조국혁신당"]
 
@@ -61,7 +64,7 @@ class RetrievalPlan(BaseModel):
 # --- 노드 함수 ---
 def plan_retrieval_node(state: GraphState) -> GraphState:
     """LLM의 Tool Calling 기능을 사용하여 구조화된 검색 전략을 계획합니다."""
-    print("--- 노드 실행: 1. plan_retrieval (bind_tools 방식 적용) ---")
+    logger.debug("node_start", node="plan_retrieval")
 
     planner_prompt_template = """
     You are a 'retrieval strategist' tasked with analyzing the user's question to determine the optimal document search strategy.
@@ -6,6 +6,9 @@ from langchain.memory import ConversationSummaryMemory
 from app.models.chat_model import ChatSendRequest
 from app.services.chat_service import save_chat_qa, get_chat_history_for_prompt
 from langchain_core.prompts import ChatPromptTemplate
+from app.core.logger import get_logger
+
+logger = get_logger("graph")
 
 # 세션별 메모리 캐시 (doc_id 기반)
 MEMORY_POOL: Dict[str, ConversationSummaryMemory] = {}
@@ -16,7 +19,7 @@ llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
 
 
 async def load_context_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    print("--- 노드 실행: load_context_node (LLM summary 기반) ---")
+    logger.debug("node_start", node="load_context")
     doc_id = state.get("doc_id")
     question = state.get("question", "")
     if not doc_id:
@@ -57,16 +60,16 @@ async def load_context_node(state: Dict[str, Any]) -> Dict[str, Any]:
         return {**state, "context": summary.content.strip()}
 
     except Exception as e:
-        print("❌ load_context_node 오류:", e)
+        logger.error("node_failed", node="load_context", error=e)
         return {**state, "context": ""}
 
 
 
 async def save_chathistory_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    print("--- 노드 실행: save_chathistory_node ---")
+    logger.debug("node_start", node="save_chathistory")
     doc_id = state.get("doc_id")
     if not doc_id:
-        print("❌ doc_id가 없어 저장을 건너뜁니다.")
+        logger.info("save_skipped", node="save_chathistory", reason="no_doc_id")
         return state
 
     # MongoDB 저장
@@ -85,6 +88,6 @@ async def save_chathistory_node(state: Dict[str, Any]) -> Dict[str, Any]:
             apply_body=state.get("apply_body")
         )
     except Exception as e:
-        print("❌ save_chat_qa 오류:", e)
+        logger.error("node_failed", node="save_chathistory", error=e)
 
     return state
\ No newline at end of file
@@ -1,15 +1,17 @@
 # ✅ app/services/node/03_retrieval/balanced_retrieval_node.py
 import os
 from typing import List, Dict, Any
-from langchain_chroma import Chroma
-from langchain_openai import OpenAIEmbeddings
 from langchain_core.documents import Document
 from dotenv import load_dotenv
 from datetime import datetime
 from graph_state import GraphState
+from app.core.logger import get_logger
+from app.services.vectorstore_registry import get_vectorstore
 load_dotenv()
 
-embedding_function = OpenAIEmbeddings()
+logger = get_logger("graph")
+
+PERSIST_DIR = "chroma_opinion"  # 고정 DB 경로
 DEFAULT_PARTIES = ["더불어민주당", "국민의힘"]
 
 def date_to_int(date_str: str) -> int | None:
@@ -19,7 +21,7 @@ def date_to_int(date_str: str) -> int | None:
         return None
 
 def balanced_retrieval_node(state: GraphState) -> GraphState:
-    print("--- 노드 실행: 2b. balanced_retrieval ---")
+    logger.debug("node_start", node="balanced_retrieval")
     plan = state["plan"]
     rewritten_question = plan["rewritten_question"]
     parameters = plan.get("parameters") or {}
@@ -50,16 +52,11 @@ def balanced_retrieval_node(state: GraphState) -> GraphState:
         party_filter = base_conditions + [{'party': {'$eq': party}}]
         search_filter = {"$and": party_filter} if len(party_filter) > 1 else party_filter[0]
 
-        print(f"🔍 [정당: {party}] 검색 필터: {search_filter}")
+        logger.debug("search_filter", node="balanced_retrieval", party=party, filter=search_filter)
 
         try:
-            persist_dir = f"chroma_opinion"  # 고정 DB 경로
-            vectorstore = Chroma(
-                persist_directory=persist_dir,
-                embedding_function=embedding_function,
-                collection_name="langchain"
-            )
-
+            # 시작 시 열어 둔 공유 핸들 (정당마다 다시 열지 않음)
+            vectorstore = get_vectorstore(PERSIST_DIR)
             docs_with_scores = vectorstore.similarity_search_with_relevance_scores(
                 query=rewritten_question,
                 k=k_per_side,
@@ -71,9 +68,9 @@ def balanced_retrieval_node(state: GraphState) -> GraphState:
                 "party": party,
                 "documents": docs
             })
-            print(f"✅ {party}: {len(docs)}개 검색됨")
+            logger.info("retrieved", node="balanced_retrieval", party=party, documents=len(docs))
 
         except Exception as e:
-            print(f"⚠️ {party} 검색 중 오류 발생: {e}")
+            logger.warning("search_failed", node="balanced_retrieval", party=party, error=e)
 
     return {**state, "documents_by_party": all_party_results}
@@ -8,10 +8,13 @@ from dotenv import load_dotenv
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from langchain_core.documents import Document
 from graph_state import GraphState
+from app.core.logger import get_logger
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 load_dotenv()
 
+logger = get_logger("graph")
+
 # --- 정규화 함수 ---
 def exp_normalize(x: np.ndarray) -> np.ndarray:
     b = x.max()
@@ -20,7 +23,7 @@ def exp_normalize(x: np.ndarray) -> np.ndarray:
 
 # --- GPU 설정 ---
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-print(f"📡 현재 디바이스: {device}")
+logger.info("reranker_device", device=device)
 
 # --- KoBGE Cross-Encoder 로드 ---
 # 실제 서버에 올릴 땐 미리 캐시해두고 쓸 수 있게 할 예정. (get_instance)
@@ -31,7 +34,7 @@ model.eval()
 
 # --- 리랭크 함수 ---
 def rerank_documents(query: str, documents: List[Document], top_k: int = 5, batch_size: int = 8) -> List[Document]:
-    print(f"📥 총 {len(documents)}개 문서 리랭킹 중...")
+    logger.debug("rerank_start", documents=len(documents))
 
     pairs = [[query, doc.page_content] for doc in documents]
     scores = []
@@ -52,8 +55,9 @@ def rerank_documents(query: str, documents: List[Document], top_k: int = 5, batc
     scored_docs = sorted(scores, key=lambda x: x[0], reverse=True)
     top_docs = [doc for score, doc in scored_docs[:top_k]]
 
-    for i, (score, doc) in enumerate(scored_docs[:top_k]):
-        print(f"✅ {i+1}위 문서 (score={score:.4f}): {doc.page_content[:60]}...")
+    if logger.debug_enabled():
+        for i, (score, doc) in enumerate(scored_docs[:top_k]):
+            logger.debug("reranked_document", rank=i + 1, score=float(score), content=doc.page_content[:60])
 
     return top_docs
 
@@ -64,28 +68,27 @@ def chunk_documents(documents: List[Document], chunk_size=300, chunk_overlap=50)
 
 # 노드 함수 개선
 def grade_and_filter_node(state: GraphState) -> GraphState:
-    print("--- 노드 실행: 3. grade_and_filter (GPU 리랭커 + 청킹) ---")
+    logger.debug("node_start", node="grade_and_filter")
     question = state.get("question")
     documents = state.get("documents")
 
     # 0. 혹시 Tuple(Document, score) 구조이면 Document만 추출
     if documents and isinstance(documents[0], tuple):
-        print("📌 튜플 형식 문서 감지 → Document만 추출 중")
         documents = [doc for doc, score in documents]
 
     if not documents:
-        print("❌ 평가할 문서가 없습니다.")
+        logger.info("no_documents", node="grade_and_filter")
         return {**state, "documents": [], "generation": "관련 문서를 찾을 수 없습니다."}
     
     # 1. 문서 청킹
     chunked_docs = chunk_documents(documents)
-    print(f"📦 총 {len(chunked_docs)}개 청크로 변환 완료.")
+    logger.debug("chunked", node="grade_and_filter", chunks=len(chunked_docs))
 
     # 2. 리랭크
     top_k = min(5, len(chunked_docs))
     top_chunks = rerank_documents(question, chunked_docs, top_k=top_k)
 
-    print(f"🎯 최종 선택 문서 조각 수: {len(top_chunks)}")
+    logger.info("graded", node="grade_and_filter", chunks=len(top_chunks))
 
     # 3. generate 생략 시 → 하이퍼링크 목록 생성
     plan = state.get("plan", {})
@@ -2,15 +2,16 @@
 from datetime import datetime
 from dotenv import load_dotenv
 from langchain_core.documents import Document
-from langchain_openai import OpenAIEmbeddings
-from langchain_chroma import Chroma
+from app.core.logger import get_logger
+from app.services.vectorstore_registry import get_vectorstore
 
 load_dotenv()
 
+logger = get_logger("graph")
+
 # --- 설정 ---
 PERSIST_DIR = "chroma_db"
 COLLECTION_NAME = "langchain"
-embedding_function = OpenAIEmbeddings()
 
 # --- 상태(State) 모방 클래스 ---
 class GraphState(dict):
@@ -29,7 +30,7 @@ def standard_retrieval_node(state: GraphState) -> GraphState:
     """
     메타데이터 필터링과 함께 유사도 점수를 포함하여 문서를 검색합니다.
     """
-    print("--- 노드 실행: standard_retrieval (유사도 점수 포함) ---")
+    logger.debug("node_start", node="standard_retrieval")
     plan = state["plan"]
     rewritten_question = plan["rewritten_question"]
     parameters = plan.get("parameters") or {}
@@ -60,20 +61,17 @@ def standard_retrieval_node(state: GraphState) -> GraphState:
     else:
         search_filter = {}
 
-    print(f"🔍 검색 필터: {search_filter}")
+    logger.debug("search_filter", node="standard_retrieval", filter=search_filter)
 
     # 4. 데이터 타입별 DB 순회
     all_results = []
     data_types = plan.get("data_type", [])
     for dtype in data_types:
         persist_path = f"chroma_db_{dtype}"
-        print(f"📁 검색 대상 DB: {persist_path}")
+        logger.debug("search_db", node="standard_retrieval", db=persist_path)
         try:
-            vectorstore = Chroma(
-                persist_directory=persist_path,
-                embedding_function=embedding_function,
-                collection_name="langchain"
-            )
+            # 시작 시 열어 둔 공유 핸들 (매 요청마다 SQLite/HNSW 를 다시 열지 않음)
+            vectorstore = get_vectorstore(persist_path)
             docs_with_scores = vectorstore.similarity_search_with_relevance_scores(
                 query=rewritten_question,
                 k=k,
@@ -81,17 +79,16 @@ def standard_retrieval_node(state: GraphState) -> GraphState:
             )
             all_results.extend(docs_with_scores)
         except Exception as e:
-            print(f"⚠️ {dtype} 컬렉션 검색 중 오류 발생: {e}")
+            logger.warning("search_failed", node="standard_retrieval", db=persist_path, error=e)
 
     # 5. 결과 정렬 및 top-k 추출
     all_results_sorted = sorted(all_results, key=lambda x: x[1], reverse=True)
     top_docs = all_results_sorted[:k]
     retrieved_docs = [doc for doc, score in top_docs]
-    print(f"📦 최종 문서 개수: {len(retrieved_docs)}")
-    for i, doc in enumerate(retrieved_docs, 1):
-        print(f"\n📄 문서 {i} (score: {top_docs[i-1][1]:.4f})")
-        print(f"내용: {doc.page_content[:500]}...")  # 500자까지만 출력
-        print(f"메타데이터: {doc.metadata}")
+    logger.info("retrieved", node="standard_retrieval", documents=len(retrieved_docs))
+    if logger.debug_enabled():
+        for i, (doc, score) in enumerate(top_docs, 1):
+            logger.debug("retrieved_document", rank=i, score=score, title=doc.metadata.get("title"), content=doc.page_content[:100])
 
     return {**state, "documents": retrieved_docs}
 
@@ -5,9 +5,12 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers.openai_tools import PydanticToolsParser
 from graph_state import GraphState
+from app.core.logger import get_logger
 
 load_dotenv()
 
+logger = get_logger("graph")
+
 # === LLM이 반환할 JSON 형식 정의 ===
 class GenMainOutput(BaseModel):
     generation: str = Field(..., description="응답 또는 수정 이유 설명")
@@ -66,7 +69,7 @@ USER_TEMPLATE_SIMPLE = """
 """
 
 def generate_main_node(state: GraphState) -> GraphState:
-    print("--- 노드 실행: generate_main_node ---")
+    logger.debug("node_start", node="generate_main")
 
     question = state.get("question", "")
     selected_text = state.get("selected_text", "")
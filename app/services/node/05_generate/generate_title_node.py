@@ -14,6 +14,9 @@ load_dotenv()
 client = OpenAI()
 
 from graph_state import GraphState
+from app.core.logger import get_logger
+
+logger = get_logger("graph")
 
 def generate_titles(
     article_content: str,
@@ -78,7 +81,7 @@ def generate_titles(
             return {"error": "Invalid JSON format received from AI."}
 
     except Exception as e:
-        print(f"An error occurred: {e}")
+        logger.error("node_failed", node="generate_titles", error=e)
         return {"error": str(e)}
     
 def generate_titles_node(state: GraphState) -> GraphState:
@@ -86,7 +89,7 @@ def generate_titles_node(state: GraphState) -> GraphState:
     state에서 기사 본문을 추출하여 generate_titles 함수를 호출하고,
     결과를 state의 generation 필드에 맞게 변환하는 '연결용 노드'.
     """
-    print("--- 노드 실행: generate_titles_node ---")
+    logger.debug("node_start", node="generate_titles")
     context = state["selected_text"]
 
     title_result = generate_titles(article_content=context)
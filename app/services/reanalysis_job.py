@@ -0,0 +1,144 @@
+# app/services/reanalysis_job.py
+# 모델 지문이 바뀐(stale) analysis_cache 항목을 백그라운드에서 천천히 재분석
+# - 최근에 열람/분석된 문서(last_accessed_dt 내림차순)부터 처리
+# - 저장된 문장 텍스트를 그대로 재분류 (본문 재분리 없음, 전역 문장 캐시 공유)
+# - 사용자 요청이 먼저 갱신한 항목은 덮어쓰지 않음 (save_analysis 의 expected_version)
+# - 재분석에 실패한 항목은 실패 횟수를 기록해 뒤로 미루고, REANALYSIS_MAX_ATTEMPTS 번 실패하면 건너뜀
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.database import db
+from app.core.logger import get_logger
+from app.models.analyze_model import SentenceAnalysis
+from app.services.exaone_client import get_model_version, is_model_loaded, is_error_result
+from app.services.analyze_service import classify_sentences, save_analysis, load_sentence_records
+
+# ====== 설정 ======
+analysis_collection = db["analysis_cache"]
+sentence_collection = db["sentence_cache"]
+
+logger = get_logger("reanalysis")
+
+tz_kst = timezone(timedelta(hours=9))
+
+_task: Optional[asyncio.Task] = None
+
+
+# ====== [stale 항목 조회/재분석] ======
+
+async def find_stale_entries(model_version: str, limit: int) -> List[dict]:
+    # 실패한 적 없는 항목(reanalysis_attempts 없음)이 먼저, 그 안에서 최근 열람순
+    # last_accessed_dt 가 없는 옛 항목은 내림차순 정렬에서 맨 뒤로 감
+    cursor = analysis_collection.find(
+        {
+            "model_version": {"$ne": model_version},
+            "reanalysis_attempts": {"$not": {"$gte": settings.REANALYSIS_MAX_ATTEMPTS}},
+        },
+        {"_id": 0, "doc_id": 1, "model_version": 1, "sentence_hashes": 1, "sentence_analysis": 1},
+    ).sort([("reanalysis_attempts", 1), ("last_accessed_dt", -1), ("doc_id", 1)]).limit(limit)
+    return await cursor.to_list(length=limit)
+
+async def mark_failed(doc_id: str, model_version: str):
+    # 실패 횟수 기록 → 다음 주기에는 다른 stale 항목 뒤로 밀림 (save_analysis 가 성공하면 지움)
+    await analysis_collection.update_one(
+        {"doc_id": doc_id, "model_version": {"$ne": model_version}},
+        {
+            "$inc": {"reanalysis_attempts": 1},
+            "$set": {"reanalysis_failed_at": datetime.now(tz=tz_kst), "reanalysis_failed_version": model_version},
+        },
+    )
+
+async def reset_failed_attempts(model_version: str) -> int:
+    # 다른 모델 지문에서 실패한 기록은 새 모델로 다시 시도
+    result = await analysis_collection.update_many(
+        {"reanalysis_attempts": {"$exists": True}, "reanalysis_failed_version": {"$ne": model_version}},
+        {"$unset": {"reanalysis_attempts": "", "reanalysis_failed_at": "", "reanalysis_failed_version": ""}},
+    )
+    return result.modified_count
+
+async def entry_texts(entry: dict) -> Tuple[List[str], bool]:
+    """(저장된 문장 원문 목록, 빠진 문장 없이 모두 읽었는지)"""
+    if "sentence_hashes" in entry:
+        records = await load_sentence_records(entry["doc_id"], entry["sentence_hashes"])
+        texts = [r["result"]["text"] for r in records if r is not None and "text" in r["result"]]
+        return texts, len(texts) == len(entry["sentence_hashes"])
+    # 옛 형식 (sentence_analysis 배열)
+    sentence_analysis = entry.get("sentence_analysis", [])
+    texts = [s["text"] for s in sentence_analysis if isinstance(s, dict) and "text" in s]
+    return texts, len(texts) == len(sentence_analysis)
+
+async def reanalyze_entry(entry: dict) -> bool:
+    texts, complete = await entry_texts(entry)
+    results = await classify_sentences(list(enumerate(texts)))
+    analysis: List[SentenceAnalysis] = [results[idx] for idx in range(len(texts))]
+    # 추론 오류 결과로 캐시를 덮어쓰지 않음 (다음 주기에 다시 시도)
+    if any(is_error_result(a.explanation) for a in analysis):
+        return False
+    # 빠진 문장이 있으면 문단 기록과 문장 순서가 어긋나므로 비움 (다음 분석 때 전체 다시 분리)
+    paragraphs = None if complete else []
+    return await save_analysis(entry["doc_id"], analysis, expected_version=entry.get("model_version"), paragraphs=paragraphs)
+
+async def purge_stale_sentences(model_version: str) -> int:
+    # 다른 모델 지문으로 저장된 전역 문장 캐시는 더 이상 조회되지 않으므로 정리
+    result = await sentence_collection.delete_many({"model_version": {"$ne": model_version}})
+    return result.deleted_count
+
+async def run_once(limit: int) -> int:
+    """stale 항목을 최대 limit 개 재분석. 처리한 개수 반환"""
+    model_version = get_model_version()
+    processed = 0
+    for entry in await find_stale_entries(model_version, limit):
+        try:
+            saved = await reanalyze_entry(entry)
+        except Exception as e:
+            logger.exception("reanalysis_failed", doc_id=entry.get("doc_id"), error=str(e))
+            saved = False
+        if saved:
+            processed += 1
+        else:
+            # 추론 오류 / expected_version 경합 / 예외 → 같은 항목이 매 주기 맨 앞을 막지 않도록 표시
+            await mark_failed(entry["doc_id"], model_version)
+        await asyncio.sleep(0)  # 사용자 요청에 양보
+    return processed
+
+
+# ====== [백그라운드 작업 수명 관리] ======
+
+async def _loop():
+    purged = False
+    while True:
+        try:
+            if is_model_loaded():
+                if not purged:
+                    deleted = await purge_stale_sentences(get_model_version())
+                    reset = await reset_failed_attempts(get_model_version())
+                    logger.info("stale_sentences_purged", deleted=deleted, reset_attempts=reset)
+                    purged = True
+                processed = await run_once(settings.REANALYSIS_BATCH_SIZE)
+                if processed:
+                    logger.info("reanalysis_batch_done", processed=processed)
+                    continue  # 밀린 항목이 있으면 바로 다음 묶음 처리
+        except Exception as e:
+            logger.exception("reanalysis_loop_error", error=str(e))
+        await asyncio.sleep(settings.REANALYSIS_INTERVAL_SEC)
+
+def start_reanalysis_job():
+    global _task
+    if not settings.REANALYSIS_ENABLED or (_task is not None and not _task.done()):
+        return
+    _task = asyncio.get_running_loop().create_task(_loop())
+    logger.info("reanalysis_job_started", interval_sec=settings.REANALYSIS_INTERVAL_SEC)
+
+async def stop_reanalysis_job():
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
@@ -0,0 +1,88 @@
+# app/services/sentence_cache.py
+# 문서와 무관하게 문장 단위로 EXAONE 분석 결과를 재사용하는 전역 캐시
+# - 키: hash_sentence(정규화된 문장) + 모델 버전
+# - 프로세스 내 LRU → sentence_cache 컬렉션 순으로 조회
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable
+
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.core.database import db
+from app.utils.lru_cache import LRUCache
+
+# ====== 설정 ======
+collection = db['sentence_cache']
+
+tz_kst = timezone(timedelta(hours=9))
+
+# 프로세스 단위 LRU (키: "모델버전:문장해시")
+_lru = LRUCache(settings.SENTENCE_CACHE_LRU_SIZE)
+
+# 프로세스 단위 적중 통계
+CACHE_STATS = {"memory_hits": 0, "db_hits": 0, "misses": 0}
+
+
+# ====== [공통 유틸 함수] ======
+
+def cache_key(sentence_hash: str, model_version: str) -> str:
+    return f"{model_version}:{sentence_hash}"
+
+def clear_memory_cache():
+    _lru.clear()
+
+def get_sentence_cache_stats() -> dict:
+    hits = CACHE_STATS["memory_hits"] + CACHE_STATS["db_hits"]
+    total = hits + CACHE_STATS["misses"]
+    return {
+        **CACHE_STATS,
+        "memory_size": len(_lru),
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+    }
+
+
+# ====== [캐시 조회/저장] ======
+
+async def get_cached_sentences(sentence_hashes: Iterable[str], model_version: str) -> Dict[str, dict]:
+    """{문장해시: 분석 결과 dict} ─ 캐시에 있는 것만 반환"""
+    found = {}
+    missing = []
+    for sentence_hash in dict.fromkeys(sentence_hashes):
+        key = cache_key(sentence_hash, model_version)
+        if key in _lru:
+            found[sentence_hash] = _lru.get(key)
+            CACHE_STATS["memory_hits"] += 1
+        else:
+            missing.append(key)
+
+    if missing:
+        db_hits = 0
+        async for entry in collection.find({"_id": {"$in": missing}}, {"hash": 1, "result": 1}):
+            found[entry["hash"]] = entry["result"]
+            _lru.put(entry["_id"], entry["result"])
+            db_hits += 1
+        CACHE_STATS["db_hits"] += db_hits
+        CACHE_STATS["misses"] += len(missing) - db_hits
+    return found
+
+async def save_cached_sentences(results: Dict[str, dict], model_version: str):
+    """{문장해시: 분석 결과 dict} 저장. 이미 있는 문장은 먼저 저장된 결과를 유지"""
+    if not results:
+        return
+    now = datetime.now(tz=tz_kst)
+    operations = []
+    for sentence_hash, result in results.items():
+        key = cache_key(sentence_hash, model_version)
+        _lru.put(key, result)
+        operations.append(UpdateOne(
+            {"_id": key},
+            {"$setOnInsert": {
+                "hash": sentence_hash,
+                "model_version": model_version,
+                "result": result,
+                "created_dt": now,
+            }},
+            upsert=True,
+        ))
+    await collection.bulk_write(operations, ordered=False)
@@ -0,0 +1,24 @@
+# app/services/sentence_splitter.py
+# kss / NLTK 문장 분리 (DB·모델 의존성 없음 → 분리 워커 프로세스에서 그대로 import)
+from typing import List
+
+import kss
+import nltk
+from nltk.tokenize import sent_tokenize
+
+nltk.download('punkt', quiet=True)
+
+
+def split_text(text: str, lang: str) -> List[str]:
+    if lang == "ko":
+        # kss는 문장 끝 구두점과 공백을 비교적 일관되게 처리하지만,
+        # 혹시 모를 상황을 대비하여 분리 후에도 정규화를 적용하는 것이 좋습니다.
+        return kss.split_sentences(text)
+    elif lang == "en":
+        return sent_tokenize(text)
+    else:
+        return [text]
+
+
+def split_texts(texts: List[str], lang: str) -> List[List[str]]:
+    return [split_text(text, lang) for text in texts]
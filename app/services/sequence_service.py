@@ -0,0 +1,82 @@
+# app/services/sequence_service.py
+# counters 컬렉션 기반 ID 발급 ($inc 원자 연산 → O(1), 동시 업로드에도 중복 없음)
+
+import re
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from app.core.database import db
+from pymongo import ReturnDocument
+
+# ===== 설정 =====
+counters = db['counters']
+
+SEEDED_CACHE_LIMIT = 10000
+
+_seeded = set()                       # 이미 시드(기존 최대값 반영)된 카운터 이름
+_blocks: Dict[str, List[int]] = {}    # 워커별 선할당 블록 {name: [다음 값, 블록 끝]}
+_block_locks: Dict[str, asyncio.Lock] = {}
+
+
+# ===== 공통 유틸 =====
+
+def parse_id_number(current_id: Optional[str], prefix: str) -> int:
+    if current_id:
+        match = re.search(rf"{prefix}_(\d{{8}})", current_id)
+        if match:
+            return int(match.group(1))
+    return 0
+
+def format_id(prefix: str, number: int) -> str:
+    return f"{prefix}_{number:08d}"
+
+
+# ===== 시퀀스 발급 =====
+
+async def _ensure_seeded(name: str, seed: Optional[Callable[[], Awaitable[int]]]):
+    """
+    카운터가 처음 생길 때 기존 데이터의 최대 번호부터 이어가도록 맞춘다.
+    ($max 로 올리기만 하므로 여러 워커가 동시에 시드해도 안전)
+    """
+    if name in _seeded:
+        return
+    if seed and not await counters.find_one({"_id": name}, {"_id": 1}):
+        current = await seed()
+        await counters.update_one({"_id": name}, {"$max": {"seq": current}}, upsert=True)
+    if len(_seeded) >= SEEDED_CACHE_LIMIT:
+        _seeded.clear()
+    _seeded.add(name)
+
+async def _reserve(name: str, count: int) -> int:
+    doc = await counters.find_one_and_update(
+        {"_id": name},
+        {"$inc": {"seq": count}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    return doc["seq"]
+
+async def next_sequence(
+    name: str,
+    seed: Optional[Callable[[], Awaitable[int]]] = None,
+    block_size: int = 1,
+) -> int:
+    """
+    name 카운터의 다음 값을 발급.
+    block_size > 1 이면 한 번에 block_size 개를 예약해 두고 워커 안에서 나눠 쓴다
+    (Atlas 왕복이 block_size 번에 한 번으로 줄지만, 워커 간에는 번호 순서가 섞이고 재시작 시 빈 번호가 생김).
+    """
+    await _ensure_seeded(name, seed)
+    if block_size <= 1:
+        return await _reserve(name, 1)
+
+    lock = _block_locks.setdefault(name, asyncio.Lock())
+    async with lock:
+        block = _blocks.get(name)
+        if not block or block[0] > block[1]:
+            end = await _reserve(name, block_size)
+            block = [end - block_size + 1, end]
+            _blocks[name] = block
+        value = block[0]
+        block[0] += 1
+        return value
@@ -0,0 +1,114 @@
+# app/services/split_executor.py
+# kss / NLTK 문장 분리를 이벤트 루프 밖(프로세스 풀)에서 실행한다.
+# 긴 문서는 문단을 워커 수만큼 나눠 병렬로 분리하고, 원래 문단 순서대로 합친다.
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger("split")
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+# ===== 워커 프로세스 측 =====
+
+def _init_worker():
+    # kss / punkt 로딩을 워커 시작 시 한 번만
+    import app.services.sentence_splitter  # noqa: F401
+
+
+def _warmup() -> bool:
+    return True
+
+
+def _split(texts: List[str], lang: str) -> List[List[str]]:
+    from app.services.sentence_splitter import split_texts
+    return split_texts(texts, lang)
+
+
+# ===== 풀 수명 관리 =====
+
+def get_split_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # JVM/torch 스레드를 가진 부모를 fork 하지 않도록 spawn 사용
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.SPLIT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _executor
+
+
+def start_split_executor():
+    if settings.SPLIT_WORKERS <= 0:
+        return
+    executor = get_split_executor()
+    # 워커(와 kss)를 미리 띄워 첫 분석 요청이 기동 비용을 내지 않도록 함
+    for _ in range(settings.SPLIT_WORKERS):
+        executor.submit(_warmup)
+    logger.info("split_pool_started", workers=settings.SPLIT_WORKERS)
+
+
+def shutdown_split_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+# ===== 분리 요청 =====
+
+def partition_texts(texts: List[str], parts: int) -> List[List[str]]:
+    """문단 순서를 유지한 채 글자 수가 비슷하도록 최대 parts 개 묶음으로 나눔"""
+    parts = max(1, min(parts, len(texts)))
+    target = sum(len(text) for text in texts) / parts
+    chunks, current, current_len = [], [], 0
+    for text in texts:
+        current.append(text)
+        current_len += len(text)
+        if current_len >= target and len(chunks) < parts - 1:
+            chunks.append(current)
+            current, current_len = [], 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def split_in_pool(texts: List[str], lang: str) -> List[List[str]]:
+    """texts 각각의 문장 목록을 입력 순서대로 반환"""
+    if not texts:
+        return []
+    loop = asyncio.get_running_loop()
+    if settings.SPLIT_WORKERS <= 0:
+        # 풀 비활성화 시에도 이벤트 루프는 막지 않도록 스레드에서 실행
+        return await loop.run_in_executor(None, _split, texts, lang)
+
+    total_chars = sum(len(text) for text in texts)
+    parts = settings.SPLIT_WORKERS if total_chars >= settings.SPLIT_PARALLEL_MIN_CHARS else 1
+    chunks = partition_texts(texts, parts)
+    executor = get_split_executor()
+    try:
+        results = await _split_chunks(loop, executor, chunks, lang)
+    except BrokenProcessPool:
+        # 워커가 죽으면 풀 전체가 깨짐 → 새 풀로 한 번 재시도, 그래도 실패하면 이번 요청은 스레드에서 분리
+        if _executor is executor:
+            shutdown_split_executor()
+        try:
+            results = await _split_chunks(loop, get_split_executor(), chunks, lang)
+        except BrokenProcessPool:
+            shutdown_split_executor()
+            results = [await loop.run_in_executor(None, _split, texts, lang)]
+    return [sentences for chunk_result in results for sentences in chunk_result]
+
+
+async def _split_chunks(loop, executor: ProcessPoolExecutor, chunks: List[List[str]], lang: str) -> List[List[List[str]]]:
+    return await asyncio.gather(*(
+        loop.run_in_executor(executor, _split, chunk, lang)
+        for chunk in chunks
+    ))
@@ -5,12 +5,11 @@ import traceback
 from bson import ObjectId
 from datetime import datetime, timedelta, timezone
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.database import db, get_blob_bucket
+from app.services.doc_projection import DOC_SUMMARY_PROJECTION
+from app.core.logger import get_logger
 
 # MongoDB 연결 설정
-ATLAS_URI = os.getenv("ATLAS_URI")
-client = AsyncIOMotorClient(ATLAS_URI)
-db = client['uploadedbyusers']
 
 collection = db['docs']
 temp_collection = db['temp_docs']
@@ -21,6 +20,8 @@ DELETE_YES = "y"
 DELETE_NO = "n"
 tz_kst = timezone(timedelta(hours=9))
 
+logger = get_logger("trash")
+
 # ===== 유틸 =====
 
 def convert_mongo_document(doc: dict) -> dict:
@@ -41,12 +42,23 @@ def convert_mongo_document(doc: dict) -> dict:
     return result
 
 
+async def delete_blobs(file_ids: list):
+    """GridFS 에 저장된 원본 파일 삭제"""
+    for file_id in file_ids:
+        if not file_id:
+            continue
+        try:
+            await get_blob_bucket().delete(file_id)
+        except Exception as e:
+            logger.warning("blob_delete_failed", file_id=file_id, error=str(e))
+
+
 # ===== 휴지통 기능 =====
 
 # 휴지통 목록 조회 (delete_yn = 'y')
 async def get_deleted_documents(user_id: str):
     try:
-        docs_cursor = collection.find({"user_id": user_id, "delete_yn": DELETE_YES})
+        docs_cursor = collection.find({"user_id": user_id, "delete_yn": DELETE_YES}, DOC_SUMMARY_PROJECTION)
         docs_raw = await docs_cursor.to_list(length=100)
         return [convert_mongo_document(doc) for doc in docs_raw]
     except Exception as e:
@@ -70,17 +82,20 @@ async def restore_document(document_id: str) -> bool:
 # 휴지통에서 개별 문서 영구 삭제
 async def delete_document_permanently(document_id: str) -> bool:
     try:
-        # 1. 본문(doc) 영구 삭제
-        result = await collection.delete_one(
-            {"doc_id": document_id, "delete_yn": DELETE_YES}
+        # 1. 본문(doc) 영구 삭제 (+ GridFS 원본 파일)
+        doc = await collection.find_one_and_delete(
+            {"doc_id": document_id, "delete_yn": DELETE_YES},
+            projection={"doc_id": 1, "file_id": 1},
         )
+        if doc:
+            await delete_blobs([doc.get("file_id")])
         # 2. 임시 문서(temp_docs) 영구 삭제
         await temp_collection.delete_one({"doc_id": document_id})
         # 3. 채팅기록(chat_qas) 영구 삭제
         await chat_collection.delete_many({"doc_id": document_id})
         
-        print(f"[삭제 요청] doc_id={document_id} | matched={result.raw_result.get('n')} | deleted={result.deleted_count}")
-        return result.deleted_count > 0
+        logger.info("document_deleted", doc_id=document_id, deleted=doc is not None)
+        return doc is not None
     except Exception as e:
         print("❌ delete_document_permanently error:", e)
         traceback.print_exc()
@@ -90,15 +105,18 @@ async def delete_document_permanently(document_id: str) -> bool:
 async def delete_all_deleted_documents() -> int:
     try:
         # 휴지통에 있는 모든 문서 id 목록 가져오기
-        docs_cursor = collection.find({"delete_yn": DELETE_YES})
+        docs_cursor = collection.find({"delete_yn": DELETE_YES}, {"doc_id": 1, "file_id": 1})
         docs_raw = await docs_cursor.to_list(length=None)
         doc_ids = [doc["doc_id"] for doc in docs_raw]
+        file_ids = [doc.get("file_id") for doc in docs_raw]
         
         # 1. docs 컬렉션에서 영구 삭제
         result = await collection.delete_many({"delete_yn": DELETE_YES})
         # 2. temp_docs, chat_qas 컬렉션에서 모두 삭제
         await temp_collection.delete_many({"doc_id": {"$in": doc_ids}})
         await chat_collection.delete_many({"doc_id": {"$in": doc_ids}})
+        # 3. GridFS 원본 파일 삭제
+        await delete_blobs(file_ids)
         
         print(f"[전체 삭제] deleted_count={result.deleted_count}")
         return result.deleted_count
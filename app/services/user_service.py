@@ -1,16 +1,14 @@
 # app/services/user_service.py
 
-import os
-import re
 from datetime import datetime, timedelta, timezone
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.database import db, get_blob_bucket
 from app.models.user_model import UserInDB
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.services.sequence_service import next_sequence, parse_id_number, format_id
 
 # ===== 설정 =====
-ATLAS_URI = os.getenv("ATLAS_URI")
-client = AsyncIOMotorClient(ATLAS_URI)
-db = client['uploadedbyusers']
 
 collection = db['users']
 docs_collection = db['docs']
@@ -18,30 +16,28 @@ temp_docs_collection = db['temp_docs']
 categories_collection = db['categories']
 chat_collection = db['chat_qas']
 
+logger = get_logger("user")
+
 tz_kst = timezone(timedelta(hours=9))
 
 
 # ===== 공통 유틸 =====
 
-def build_next_user_id(current_id: str = None) -> str:
-    if current_id:
-        match = re.search(r"user_(\d{8})", current_id)
-        next_number = int(match.group(1)) + 1 if match else 1
-    else:
-        next_number = 1
-    return f"user_{next_number:08d}"
+async def get_latest_user_number() -> int:
+    latest_user = await collection.find_one(
+        {"user_id": {"$regex": "^user_\\d{8}$"}},
+        {"user_id": 1},
+        sort=[("user_id", -1)]
+    )
+    return parse_id_number(latest_user["user_id"] if latest_user else None, "user")
 
 
 # ===== 사용자 관련 기능 =====
 
 # 사용자 ID 생성
 async def get_next_user_id():
-    latest_user = await collection.find_one(
-        {"user_id": {"$regex": "^user_\\d{8}$"}},
-        sort=[("user_id", -1)]
-    )
-    current_id = latest_user["user_id"] if latest_user else None
-    return build_next_user_id(current_id)
+    number = await next_sequence("user_id", seed=get_latest_user_number, block_size=settings.ID_BLOCK_SIZE)
+    return format_id("user", number)
 
 # 사용자 생성 또는 조회
 async def find_or_create_user(user_name: str, user_email: str, provider: str):
@@ -82,13 +78,21 @@ async def find_user_by_id(user_id: str):
 # 사용자 및 연관 데이터 삭제
 async def delete_user_and_related(user_id: str):
     # 1. 해당 user의 모든 doc_id 리스트 조회
-    doc_cursor = docs_collection.find({"user_id": user_id})
+    doc_cursor = docs_collection.find({"user_id": user_id}, {"doc_id": 1, "file_id": 1})
     docs = await doc_cursor.to_list(length=None)
     doc_ids = [doc["doc_id"] for doc in docs]
     
     # 2. 해당 유저의 문서와 연관된 챗팅 모두 삭제
     if doc_ids:
         await chat_collection.delete_many({"doc_id": {"$in": doc_ids}})
+
+    # 2-1. GridFS 원본 파일 삭제
+    for doc in docs:
+        if doc.get("file_id"):
+            try:
+                await get_blob_bucket().delete(doc["file_id"])
+            except Exception as e:
+                logger.warning("blob_delete_failed", user_id=user_id, file_id=str(doc["file_id"]), error=str(e))
     
     # 3. 나머지 컬렉션 삭제
     await docs_collection.delete_many({"user_id": user_id})
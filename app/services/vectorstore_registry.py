@@ -0,0 +1,119 @@
+# app/services/vectorstore_registry.py
+# 프로세스 단위 Chroma 벡터스토어 레지스트리
+# - 시작 시 VECTORSTORE_DIRS 의 컬렉션을 한 번만 열고(SQLite/HNSW 세그먼트 로드) 검색 노드가 핸들을 공유
+# - 워밍업: 저장된 임베딩 하나로 벡터 검색 → HNSW 인덱스를 미리 메모리에 올림 (OpenAI 임베딩 호출 없음)
+# - 디렉터리별 로드 시간 / 문서 수 / 디스크 크기 기록
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import chromadb
+from langchain_chroma import Chroma
+from langchain_openai import OpenAIEmbeddings
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+# ===== 설정 =====
+COLLECTION_NAME = "langchain"
+
+logger = get_logger("vectorstore")
+
+_embedding_function: Optional[OpenAIEmbeddings] = None
+_stores: Dict[str, Chroma] = {}
+_stats: Dict[str, dict] = {}
+_lock = threading.Lock()  # 검색 노드는 스레드에서 실행될 수 있음
+
+
+# ===== 공통 유틸 =====
+
+def get_embedding_function() -> OpenAIEmbeddings:
+    global _embedding_function
+    if _embedding_function is None:
+        _embedding_function = OpenAIEmbeddings()
+    return _embedding_function
+
+def directory_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+def warmup_vectorstore(store: Chroma) -> bool:
+    sample = store.get(limit=1, include=["embeddings"])
+    embeddings = sample.get("embeddings")
+    if embeddings is None or len(embeddings) == 0:
+        return False
+    store.similarity_search_by_vector_with_relevance_scores([float(v) for v in embeddings[0]], k=1)
+    return True
+
+
+# ===== 열기 / 조회 =====
+
+def _open(persist_dir: str, warmup: bool) -> Chroma:
+    started = time.perf_counter()
+    # 클라이언트를 직접 만들어 넘김 → 문서 수는 chromadb 공개 API(collection.count)로 조회
+    client = chromadb.PersistentClient(path=persist_dir)
+    store = Chroma(
+        client=client,
+        embedding_function=get_embedding_function(),
+        collection_name=COLLECTION_NAME,
+    )
+    warmed = False
+    if warmup:
+        try:
+            warmed = warmup_vectorstore(store)
+        except Exception as e:
+            logger.warning("vectorstore_warmup_failed", dir=persist_dir, error=str(e))
+    stats = {
+        "dir": persist_dir,
+        "documents": client.get_collection(COLLECTION_NAME).count(),
+        "size_bytes": directory_size(persist_dir),
+        "load_ms": round((time.perf_counter() - started) * 1000, 1),
+        "warmed_up": warmed,
+    }
+    _stats[persist_dir] = stats
+    logger.info("vectorstore_loaded", **stats)
+    return store
+
+def get_vectorstore(persist_dir: str) -> Chroma:
+    """공유 핸들 반환. 시작 시 열지 않은 디렉터리는 처음 요청될 때 한 번 연다"""
+    store = _stores.get(persist_dir)
+    if store is not None:
+        return store
+    # persist_dir 은 LLM 이 고른 data_type 으로 만들어질 수 있음 → 없는 디렉터리에 빈 DB 를 만들지 않음
+    if not os.path.isdir(persist_dir):
+        raise FileNotFoundError(f"벡터스토어 디렉터리가 없습니다: {persist_dir}")
+    with _lock:
+        store = _stores.get(persist_dir)
+        if store is None:
+            store = _open(persist_dir, warmup=False)
+            _stores[persist_dir] = store
+    return store
+
+def get_vectorstore_stats() -> Dict[str, dict]:
+    return {persist_dir: dict(stats) for persist_dir, stats in _stats.items()}
+
+
+# ===== 수명 관리 =====
+
+def load_vectorstores():
+    """시작 시 VECTORSTORE_DIRS 를 미리 연다. 없는 디렉터리는 건너뜀 (빈 DB 를 새로 만들지 않도록)"""
+    for persist_dir in settings.VECTORSTORE_DIRS:
+        if persist_dir in _stores:
+            continue
+        if not os.path.isdir(persist_dir):
+            logger.warning("vectorstore_missing", dir=persist_dir)
+            continue
+        try:
+            store = _open(persist_dir, warmup=settings.VECTORSTORE_WARMUP)
+        except Exception as e:
+            logger.exception("vectorstore_load_failed", dir=persist_dir, error=str(e))
+            continue
+        with _lock:
+            _stores.setdefault(persist_dir, store)
@@ -16,9 +16,9 @@ SECRET_KEY = os.getenv("SECRET_KEY", "ssami-secret")
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def patch_mongo(monkeypatch):
-    from motor.motor_asyncio import AsyncIOMotorClient
-    test_client = AsyncIOMotorClient(os.getenv("ATLAS_URI"))
-    test_db = test_client["uploadedbyusers"]
+    # 앱과 같은 공유 클라이언트 사용 (테스트마다 새 이벤트 루프이므로 끝나면 닫음)
+    from app.core.database import get_database, close_database
+    test_db = get_database()
 
     # document services
     import app.services.document_service as doc_service
@@ -27,6 +27,17 @@ async def patch_mongo(monkeypatch):
     await test_db["docs"].delete_many({})
     await test_db["temp_docs"].delete_many({})
 
+    # content cache (동일 파일 재업로드)
+    import app.services.content_cache as content_cache
+    content_cache.collection = test_db["content_cache"]
+    await test_db["content_cache"].delete_many({})
+
+    # 전역 문장 분석 캐시
+    import app.services.sentence_cache as sentence_cache
+    sentence_cache.collection = test_db["sentence_cache"]
+    sentence_cache.clear_memory_cache()
+    await test_db["sentence_cache"].delete_many({})
+
     # category services
     import app.services.category_service as cat_service
     cat_service.collection = test_db["categories"]
@@ -40,7 +51,7 @@ async def patch_mongo(monkeypatch):
 
     yield
 
-    test_client.close()
+    close_database()
     await asyncio.sleep(0.1)
 
 # 2. 인증 토큰 헤더
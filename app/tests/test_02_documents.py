@@ -67,6 +67,13 @@ async def test_list_and_delete(client, dummy_user, auth_headers):
     response = await client.get("/documents/", params={"user_id": dummy_user["user_id"]}, headers=headers)
     print("목록 조회 응답:", response.status_code)
     assert response.status_code == 200
+    assert isinstance(response.json(), list)  # limit/cursor 없이 호출하는 기존 클라이언트는 전체 목록 배열
+
+    # 페이지 단위 조회
+    response = await client.get("/documents/", params={"user_id": dummy_user["user_id"], "limit": 1}, headers=headers)
+    print("페이지 조회 응답:", response.status_code)
+    assert response.status_code == 200
+    assert set(response.json()) == {"items", "next_cursor", "has_more"}
 
     # 삭제 (존재하지 않는 문서)
     response = await client.delete("/documents/invalid_doc_id", headers=headers)
@@ -83,4 +90,103 @@ async def test_list_and_delete(client, dummy_user, auth_headers):
     del_res = await client.delete(f"/documents/{doc_id}", headers=headers)
     print("실제 문서 삭제 응답:", del_res.status_code)
     assert del_res.status_code == 200
-    print("=== [문서 목록조회/삭제 테스트 끝] ===\n")
\ No newline at end of file
+    print("=== [문서 목록조회/삭제 테스트 끝] ===\n")
+
+@pytest.mark.asyncio
+async def test_upload_backpressure(client, dummy_user, auth_headers, monkeypatch):
+    print("\n=== [추출 대기열 초과 테스트 시작] ===")
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "EXTRACT_QUEUE_LIMIT", 0)
+    headers = auth_headers(dummy_user["user_id"])
+    files = {
+        "file": ("test.hwpx", io.BytesIO(b"busy hwpx"), "application/octet-stream")
+    }
+    data = {"user_id": dummy_user["user_id"], "category_id": ""}
+    response = await client.post("/documents/upload/hwpx", files=files, data=data, headers=headers)
+    print("대기열 초과 응답:", response.status_code, response.headers.get("retry-after"))
+    assert response.status_code == 503
+    assert "retry-after" in response.headers
+    print("=== [추출 대기열 초과 테스트 끝] ===\n")
+
+
+@pytest.mark.asyncio
+async def test_reupload_hits_content_cache(client, dummy_user, auth_headers):
+    print("\n=== [동일 파일 재업로드 캐시 테스트 시작] ===")
+    import glob
+    import os
+    headers = auth_headers(dummy_user["user_id"])
+    sample_dir = os.path.join(os.path.dirname(__file__), "..", "services", "python-hwpxlib-main")
+    sample_path = glob.glob(os.path.join(sample_dir, "*.hwpx"))[0]
+    with open(sample_path, "rb") as f:
+        file_content = f.read()
+
+    before = (await client.get("/documents/cache/stats", headers=headers)).json()
+    data = {"user_id": dummy_user["user_id"], "category_id": ""}
+    first = await client.post("/documents/upload/hwpx", files={"file": ("a.hwpx", io.BytesIO(file_content))}, data=data, headers=headers)
+    second = await client.post("/documents/upload/hwpx", files={"file": ("b.hwpx", io.BytesIO(file_content))}, data=data, headers=headers)
+    assert first.status_code == 200 and second.status_code == 200
+    after = (await client.get("/documents/cache/stats", headers=headers)).json()
+    print("캐시 통계:", before, "→", after)
+    assert after["hits"] == before["hits"] + 1
+    assert after["misses"] == before["misses"] + 1
+    print("=== [동일 파일 재업로드 캐시 테스트 끝] ===\n")
+
+
+@pytest.mark.asyncio
+async def test_list_returns_summaries(client, dummy_user, auth_headers):
+    print("\n=== [문서 목록 요약 응답 테스트 시작] ===")
+    headers = auth_headers(dummy_user["user_id"])
+    files = {
+        "file": ("summary.hwpx", io.BytesIO(b"summary hwpx content"), "application/octet-stream")
+    }
+    data = {"user_id": dummy_user["user_id"], "category_id": ""}
+    await client.post("/documents/upload/hwpx", files=files, data=data, headers=headers)
+
+    response = await client.get("/documents/", params={"user_id": dummy_user["user_id"]}, headers=headers)
+    assert response.status_code == 200
+    docs = response.json()["items"]
+    print("목록 요약:", docs)
+    assert docs
+    for doc in docs:
+        assert "preview" in doc
+        assert "contents" not in doc
+        assert "file_blob" not in doc
+    print("=== [문서 목록 요약 응답 테스트 끝] ===\n")
+
+
+
+@pytest.mark.asyncio
+async def test_list_pagination(client, dummy_user, auth_headers):
+    print("\n=== [문서 목록 페이지네이션 테스트 시작] ===")
+    headers = auth_headers(dummy_user["user_id"])
+    data = {"user_id": dummy_user["user_id"], "category_id": ""}
+    uploaded = set()
+    for i in range(5):
+        files = {"file": (f"page{i}.hwpx", io.BytesIO(f"page {i}".encode()), "application/octet-stream")}
+        res = await client.post("/documents/upload/hwpx", files=files, data=data, headers=headers)
+        uploaded.add(res.json()["doc_id"])
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"user_id": dummy_user["user_id"], "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        res = await client.get("/documents/", params=params, headers=headers)
+        assert res.status_code == 200
+        page = res.json()
+        assert len(page["items"]) <= 2
+        seen.extend(doc["doc_id"] for doc in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    print("페이지 순회 결과:", seen)
+    assert len(seen) == len(set(seen))
+    assert uploaded <= set(seen)
+
+    # 잘못된 정렬/커서
+    res = await client.get("/documents/", params={"user_id": dummy_user["user_id"], "sort": "nope"}, headers=headers)
+    assert res.status_code == 400
+    res = await client.get("/documents/", params={"user_id": dummy_user["user_id"], "cursor": "broken"}, headers=headers)
+    assert res.status_code == 400
+    print("=== [문서 목록 페이지네이션 테스트 끝] ===\n")
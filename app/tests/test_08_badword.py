@@ -0,0 +1,37 @@
+# app/tests/test_08_badword.py
+import re
+import random
+from app.utils.aho_corasick import AhoCorasick, is_word_boundary
+
+
+def regex_badwords(content, words):
+    # 기존 contains_badword 의 판정 방식
+    return sorted(w for w in words if re.search(r'\b' + re.escape(w) + r'\b', content, re.IGNORECASE))
+
+
+def automaton_badwords(content, matcher):
+    return sorted({
+        word for start, end, word in matcher.iter_matches(content)
+        if is_word_boundary(content, start) and is_word_boundary(content, end)
+    })
+
+
+def test_automaton_matches_regex_rules():
+    print("\n=== [비속어 오토마톤 테스트 시작] ===")
+    words = {"씨발", "바보", "ab", "abc", "bc", "Foo", "개새"}
+    matcher = AhoCorasick(words)
+    alphabet = list("abcFO 씨발바보개새.!?")
+    rng = random.Random(0)
+    for _ in range(2000):
+        content = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        assert automaton_badwords(content, matcher) == regex_badwords(content, words), content
+    print("=== [비속어 오토마톤 테스트 끝] ===\n")
+
+
+def test_automaton_reports_offsets():
+    matcher = AhoCorasick({"바보", "FOO"})
+    content = "너는 바보 foo 야"
+    spans = [(s, e, w) for s, e, w in matcher.iter_matches(content)]
+    assert spans == [(3, 5, "바보"), (6, 9, "FOO")]
+    for start, end, _ in spans:
+        assert content[start:end].lower() in {"바보", "foo"}
@@ -0,0 +1,88 @@
+# app/tests/test_09_inference_scheduler.py
+import asyncio
+import threading
+
+import pytest
+
+from app.services.inference_scheduler import InferenceScheduler
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced_and_keep_order():
+    calls = []
+
+    def fake_infer(sentences):
+        calls.append(list(sentences))
+        return [{"label": s.upper()} for s in sentences]
+
+    scheduler = InferenceScheduler(fake_infer, max_batch_size=8, max_wait_ms=50)
+    scheduler.start()
+    try:
+        first, second = await asyncio.gather(
+            scheduler.submit(["ccc", "a"]),
+            scheduler.submit(["bb"]),
+        )
+    finally:
+        await scheduler.stop()
+
+    assert [r["label"] for r in first] == ["CCC", "A"]
+    assert [r["label"] for r in second] == ["BB"]
+    # 두 요청이 한 배치로 묶이고, 길이순으로 정렬되어 모델에 전달
+    assert calls == [["a", "bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_at_max_batch_size():
+    calls = []
+
+    def fake_infer(sentences):
+        calls.append(len(sentences))
+        return [{} for _ in sentences]
+
+    scheduler = InferenceScheduler(fake_infer, max_batch_size=3, max_wait_ms=0)
+    try:
+        results = await scheduler.submit([str(i) for i in range(7)])
+    finally:
+        await scheduler.stop()
+
+    assert len(results) == 7
+    assert calls == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_inference_error_is_propagated():
+    def broken_infer(sentences):
+        raise RuntimeError("boom")
+
+    scheduler = InferenceScheduler(broken_infer, max_batch_size=4, max_wait_ms=0)
+    try:
+        with pytest.raises(RuntimeError, match="boom"):
+            await scheduler.submit(["x"])
+    finally:
+        await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_fails_in_flight_and_queued_requests():
+    started, release = threading.Event(), threading.Event()
+
+    def slow_infer(sentences):
+        started.set()
+        release.wait(5)
+        return [{} for _ in sentences]
+
+    scheduler = InferenceScheduler(slow_infer, max_batch_size=1, max_wait_ms=0)
+    scheduler.start()
+    in_flight = asyncio.ensure_future(scheduler.submit(["처리 중"]))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+    queued = asyncio.ensure_future(scheduler.submit(["대기 중"]))
+    await asyncio.sleep(0)
+
+    try:
+        await scheduler.stop()
+        # 추론 도중 종료돼도 두 요청 모두 예외로 끝나야 함 (영원히 기다리지 않음)
+        for request in (in_flight, queued):
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(request, 1)
+    finally:
+        release.set()
@@ -0,0 +1,34 @@
+# app/tests/test_10_sentence_cache.py
+import pytest
+
+import app.services.sentence_cache as sentence_cache
+from app.services.sentence_cache import get_cached_sentences, save_cached_sentences
+
+RESULT = {
+    "text": "모든 언론이 이 사실을 숨기고 있다.",
+    "flag": True,
+    "label": "과도한 일반화",
+    "highlighted": ["모든"],
+    "highlight_spans": [{"word": "모든", "start": 0, "end": 2}],
+    "explanation": ["과도한 일반화: 설명"],
+}
+
+
+@pytest.mark.asyncio
+async def test_sentence_cache_roundtrip_and_lru():
+    print("\n=== [전역 문장 캐시 테스트 시작] ===")
+    await save_cached_sentences({"hash_a": RESULT}, "model_v1")
+
+    # 1. 메모리(LRU) 적중
+    found = await get_cached_sentences(["hash_a", "hash_b"], "model_v1")
+    assert found == {"hash_a": RESULT}
+
+    # 2. LRU 를 비워도 컬렉션에서 다시 로드
+    sentence_cache.clear_memory_cache()
+    before = sentence_cache.get_sentence_cache_stats()
+    found = await get_cached_sentences(["hash_a"], "model_v1")
+    assert found["hash_a"]["label"] == "과도한 일반화"
+    assert sentence_cache.get_sentence_cache_stats()["db_hits"] == before["db_hits"] + 1
+
+    # 3. 다른 모델 버전과는 공유되지 않음
+    assert await get_cached_sentences(["hash_a"], "model_v2") == {}
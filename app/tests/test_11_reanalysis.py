@@ -0,0 +1,90 @@
+# app/tests/test_11_reanalysis.py
+import pytest
+from datetime import datetime, timedelta
+
+from app.core.database import db
+from app.services.exaone_client import compute_model_fingerprint
+import app.services.reanalysis_job as reanalysis_job
+from app.services.reanalysis_job import find_stale_entries
+
+ID2LABEL = {0: "문제 없음", 1: "과도한 일반화"}
+EXPLANATIONS = {"과도한 일반화": "설명"}
+
+
+def test_fingerprint_tracks_model_labels_and_badwords():
+    base = compute_model_fingerprint("/models/finetuned_exaone_v6", ID2LABEL, EXPLANATIONS, {"욕1"}, {})
+    assert base == compute_model_fingerprint("/other/finetuned_exaone_v6", ID2LABEL, EXPLANATIONS, {"욕1"}, {})
+    assert base != compute_model_fingerprint("/models/finetuned_exaone_v7", ID2LABEL, EXPLANATIONS, {"욕1"}, {})
+    assert base != compute_model_fingerprint("/models/finetuned_exaone_v6", {**ID2LABEL, 2: "새 라벨"}, EXPLANATIONS, {"욕1"}, {})
+    assert base != compute_model_fingerprint("/models/finetuned_exaone_v6", ID2LABEL, {"과도한 일반화": "바뀐 설명"}, {"욕1"}, {})
+    assert base != compute_model_fingerprint("/models/finetuned_exaone_v6", ID2LABEL, EXPLANATIONS, {"욕1", "욕2"}, {})
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_recently_opened_first():
+    print("\n=== [stale 분석 캐시 우선순위 테스트 시작] ===")
+    collection = db["analysis_cache"]
+    doc_ids = ["doc_reanalysis_1", "doc_reanalysis_2", "doc_reanalysis_3", "doc_reanalysis_4"]
+    await collection.delete_many({"doc_id": {"$in": doc_ids}})
+    now = datetime.now()
+    await collection.insert_many([
+        {"doc_id": doc_ids[0], "model_version": "old", "last_accessed_dt": now - timedelta(days=2), "sentence_analysis": []},
+        {"doc_id": doc_ids[1], "model_version": "old", "last_accessed_dt": now, "sentence_analysis": []},
+        {"doc_id": doc_ids[2], "sentence_analysis": []},  # 지문이 없는 옛 항목
+        {"doc_id": doc_ids[3], "model_version": "current", "last_accessed_dt": now, "sentence_analysis": []},
+    ])
+    try:
+        stale = [e["doc_id"] for e in await find_stale_entries("current", 100) if e["doc_id"] in doc_ids]
+        assert stale == [doc_ids[1], doc_ids[0], doc_ids[2]]
+    finally:
+        await collection.delete_many({"doc_id": {"$in": doc_ids}})
+
+
+@pytest.mark.asyncio
+async def test_failing_entries_do_not_block_later_passes(monkeypatch):
+    print("\n=== [재분석 실패 항목 뒤로 미루기 테스트 시작] ===")
+    collection = db["analysis_cache"]
+    doc_ids = ["doc_reanalysis_fail_1", "doc_reanalysis_fail_2", "doc_reanalysis_ok"]
+    await collection.delete_many({"doc_id": {"$in": doc_ids}})
+    now = datetime.now()
+    await collection.insert_many([
+        {"doc_id": doc_ids[0], "model_version": "old", "last_accessed_dt": now, "sentence_analysis": []},
+        {"doc_id": doc_ids[1], "model_version": "old", "last_accessed_dt": now - timedelta(minutes=1), "sentence_analysis": []},
+        {"doc_id": doc_ids[2], "model_version": "old", "last_accessed_dt": now - timedelta(days=1), "sentence_analysis": []},
+    ])
+    attempted = []
+
+    async def fake_reanalyze(entry):
+        attempted.append(entry["doc_id"])
+        return entry["doc_id"] == doc_ids[2]
+
+    monkeypatch.setattr(reanalysis_job, "reanalyze_entry", fake_reanalyze)
+    monkeypatch.setattr(reanalysis_job, "get_model_version", lambda: "current")
+    monkeypatch.setattr(reanalysis_job, "find_stale_entries", _only(doc_ids, reanalysis_job.find_stale_entries))
+    try:
+        # 1회차: 최근 열람순으로 두 항목 실패 → 실패 횟수 기록
+        assert await reanalysis_job.run_once(2) == 0
+        assert attempted == doc_ids[:2]
+
+        # 2회차: 실패한 항목은 뒤로 밀려 나머지 항목이 먼저 처리됨
+        attempted.clear()
+        assert await reanalysis_job.run_once(1) == 1
+        assert attempted == [doc_ids[2]]
+
+        # 최대 실패 횟수에 도달한 항목은 더 이상 조회되지 않음
+        monkeypatch.setattr(reanalysis_job.settings, "REANALYSIS_MAX_ATTEMPTS", 1)
+        stale = [e["doc_id"] for e in await reanalysis_job.find_stale_entries("current", 10)]
+        assert stale == [doc_ids[2]]
+
+        # 다른 모델 지문에서의 실패 기록은 초기화
+        assert await reanalysis_job.reset_failed_attempts("newer") == 2
+        assert "reanalysis_attempts" not in await collection.find_one({"doc_id": doc_ids[0]})
+    finally:
+        await collection.delete_many({"doc_id": {"$in": doc_ids}})
+
+
+def _only(doc_ids, find_stale_entries):
+    # 다른 테스트가 남긴 stale 항목은 제외
+    async def find(model_version, limit):
+        return [e for e in await find_stale_entries(model_version, 1000) if e["doc_id"] in doc_ids][:limit]
+    return find
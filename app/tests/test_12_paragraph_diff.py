@@ -0,0 +1,72 @@
+# app/tests/test_12_paragraph_diff.py
+import pytest
+
+import app.services.analyze_service as analyze_service
+from app.services.analyze_service import build_paragraph_map, split_with_paragraph_diff
+from app.services.split_executor import partition_texts
+
+
+@pytest.mark.asyncio
+async def test_only_changed_paragraphs_are_resplit(monkeypatch):
+    split_calls = []
+
+    async def fake_split_in_pool(texts, lang):
+        split_calls.extend(texts)
+        return [[part.strip() + "." for part in text.split(".") if part.strip()] for text in texts]
+
+    monkeypatch.setattr(analyze_service, "split_in_pool", fake_split_in_pool)
+    monkeypatch.setattr(analyze_service, "detect_language", lambda text: "ko")
+    analyze_service.split_cache.clear()
+
+    before = "첫 문단. 둘째 문장.\n두번째 문단.\n세번째 문단. 끝."
+    sentences, paragraphs = await split_with_paragraph_diff(before, {})
+    assert len(split_calls) == 3
+    assert [t for t, _ in sentences] == ["첫 문단.", "둘째 문장.", "두번째 문단.", "세번째 문단.", "끝."]
+
+    # 두번째 문단만 수정 + 맨 앞에 문단 추가
+    split_calls.clear()
+    paragraph_map = build_paragraph_map(paragraphs, [t for t, _ in sentences])
+    after = "새 문단.\n첫 문단. 둘째 문장.\n두번째 문단 수정.\n세번째 문단. 끝."
+    new_sentences, new_paragraphs = await split_with_paragraph_diff(after, paragraph_map)
+
+    assert split_calls == ["새 문단.", "두번째 문단 수정."]
+    assert [t for t, _ in new_sentences] == ["새 문단.", "첫 문단.", "둘째 문장.", "두번째 문단 수정.", "세번째 문단.", "끝."]
+    # 재사용된 문단의 문장 해시는 이전 값 그대로
+    assert new_sentences[1][1] == sentences[0][1]
+    assert len(new_paragraphs) == 4
+
+
+def test_mismatched_paragraph_record_is_ignored():
+    paragraphs = [{"hash": "p1", "sentence_hashes": ["a", "b"]}]
+    assert build_paragraph_map(paragraphs, ["하나."]) == {}
+
+
+def test_split_and_language_are_memoized(monkeypatch):
+    calls = []
+
+    def fake_split(text, lang):
+        calls.append(text)
+        return [text]
+
+    monkeypatch.setattr(analyze_service, "split_text", fake_split)
+    analyze_service.split_cache.clear()
+
+    assert analyze_service.split_sentences("메모 테스트 문단.", "ko") == ["메모 테스트 문단."]
+    assert analyze_service.split_sentences("메모 테스트 문단.", "ko") == ["메모 테스트 문단."]
+    assert calls == ["메모 테스트 문단."]
+
+    # 언어 감지는 앞쪽 샘플만 사용하고, 같은 샘플이면 다시 감지하지 않음
+    long_text = "\n".join(["한국어로 작성된 긴 문단입니다."] * 500)
+    assert len(analyze_service.language_sample(long_text)) <= analyze_service.settings.LANG_DETECT_SAMPLE_CHARS
+    assert analyze_service.detect_language(long_text) == "ko"
+    hits = analyze_service.language_cache.hits
+    assert analyze_service.detect_language(long_text) == "ko"
+    assert analyze_service.language_cache.hits == hits + 1
+
+
+def test_partition_keeps_order_and_balances():
+    texts = ["a" * 10, "b" * 10, "c" * 10, "d" * 10, "e" * 5]
+    chunks = partition_texts(texts, 2)
+    assert len(chunks) == 2
+    assert [t for chunk in chunks for t in chunk] == texts
+    assert partition_texts(["x"], 4) == [["x"]]
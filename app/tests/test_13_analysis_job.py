@@ -0,0 +1,77 @@
+# app/tests/test_13_analysis_job.py
+import pytest
+
+from app.core.database import db
+import app.services.analysis_job as analysis_job
+
+USER_ID = "user_job_test"
+DOC_IDS = ["doc_job_1", "doc_job_2", "doc_job_3", "doc_job_4"]
+
+
+async def _cleanup():
+    await db["docs"].delete_many({"user_id": USER_ID})
+    await db["temp_docs"].delete_many({"user_id": USER_ID})
+    await db["analysis_jobs"].delete_many({"user_id": USER_ID})
+
+
+@pytest.mark.asyncio
+async def test_job_reads_temp_contents_first_and_reports_progress(monkeypatch):
+    print("\n=== [일괄 분석 작업 테스트 시작] ===")
+    await _cleanup()
+    await db["docs"].insert_many([
+        {"doc_id": DOC_IDS[0], "user_id": USER_ID, "delete_yn": "n", "contents": "저장된 본문"},
+        {"doc_id": DOC_IDS[1], "user_id": USER_ID, "delete_yn": "n", "contents": "실패할 본문"},
+        {"doc_id": DOC_IDS[2], "user_id": USER_ID, "delete_yn": "n", "contents": b"legacy"},
+        {"doc_id": DOC_IDS[3], "user_id": USER_ID, "delete_yn": "y", "contents": "삭제된 문서"},
+    ])
+    await db["temp_docs"].insert_one({"doc_id": DOC_IDS[0], "user_id": USER_ID, "contents": "편집 중인 본문"})
+
+    analyzed = {}
+
+    async def fake_analyze_document(doc_id, contents):
+        if contents == "실패할 본문":
+            raise RuntimeError("분석 실패")
+        analyzed[doc_id] = contents
+        return [object(), object()]
+
+    monkeypatch.setattr(analysis_job, "analyze_document", fake_analyze_document)
+    try:
+        # 삭제된 문서는 사용자 전체 대상에서 빠짐
+        assert set(await analysis_job.resolve_doc_ids(USER_ID)) == set(DOC_IDS[:3])
+
+        job = await analysis_job.create_job(USER_ID, doc_ids=DOC_IDS + [DOC_IDS[0]])
+        assert job["total"] == 4
+        await analysis_job._tasks[job["job_id"]]
+
+        status = await analysis_job.get_job(job["job_id"], USER_ID)
+        assert analyzed == {DOC_IDS[0]: "편집 중인 본문"}
+        assert status["status"] == "completed"
+        assert (status["processed"], status["succeeded"], status["failed"], status["skipped"]) == (4, 1, 1, 2)
+        assert status["sentences"] == 2
+        assert status["errors"][0]["doc_id"] == DOC_IDS[1]
+        assert await analysis_job.get_job(job["job_id"], "user_other") is None
+    finally:
+        await _cleanup()
+
+
+@pytest.mark.asyncio
+async def test_unfinished_jobs_are_marked_interrupted_at_startup():
+    print("\n=== [중단된 일괄 분석 작업 정리 테스트 시작] ===")
+    await _cleanup()
+    await db["analysis_jobs"].insert_many([
+        {"job_id": "job_dead_worker", "user_id": USER_ID, "status": "running", "worker": analysis_job.WORKER_ID},
+        {"job_id": "job_legacy", "user_id": USER_ID, "status": "queued"},
+        {"job_id": "job_other_host", "user_id": USER_ID, "status": "running", "worker": "other-host:1"},
+        {"job_id": "job_done", "user_id": USER_ID, "status": "completed", "worker": analysis_job.WORKER_ID},
+    ])
+    try:
+        assert await analysis_job.recover_interrupted_jobs() == 2
+        statuses = {j["job_id"]: j["status"] async for j in db["analysis_jobs"].find({"user_id": USER_ID})}
+        assert statuses == {
+            "job_dead_worker": "interrupted",
+            "job_legacy": "interrupted",
+            "job_other_host": "running",
+            "job_done": "completed",
+        }
+    finally:
+        await _cleanup()
@@ -0,0 +1,116 @@
+# app/tests/test_14_prev_analysis.py
+import asyncio
+import pytest
+
+from app.core.database import db
+from app.models.analyze_model import SentenceAnalysis
+from app.services.analyze_service import load_prev_analysis, save_analysis, hash_sentence, from_sentence_cache
+from app.services.exaone_client import get_model_version
+
+DOC_ID = "doc_prev_analysis_test"
+
+
+def _sentence(text):
+    return {"index": 0, "text": text, "flag": False, "label": "문제 없음"}
+
+
+async def _cleanup():
+    for name in ("analysis_cache", "analysis_sentences", "temp_docs", "docs"):
+        await db[name].delete_many({"doc_id": DOC_ID})
+
+
+@pytest.mark.asyncio
+async def test_prev_analysis_priority_is_kept():
+    print("\n=== [이전 분석 결과 우선순위 테스트 시작] ===")
+    await _cleanup()
+    try:
+        # 분석 결과가 없는 temp_docs 는 건너뛰고 docs 결과 사용
+        await db["temp_docs"].insert_one({"doc_id": DOC_ID, "contents": "본문"})
+        await db["docs"].insert_one({"doc_id": DOC_ID, "file_blob": b"x" * 1024, "sentence_analysis": [_sentence("docs 문장")]})
+        state = await load_prev_analysis(DOC_ID)
+        assert [s["text"] for s in state["sentence_analysis"]] == ["docs 문장"]
+
+        # temp_docs 결과가 docs 보다 우선
+        await db["temp_docs"].update_one({"doc_id": DOC_ID}, {"$set": {"sentence_analysis": [_sentence("temp 문장")]}})
+        state = await load_prev_analysis(DOC_ID)
+        assert [s["text"] for s in state["sentence_analysis"]] == ["temp 문장"]
+
+        # analysis_cache 가 가장 우선
+        await db["analysis_cache"].insert_one({
+            "doc_id": DOC_ID,
+            "model_version": get_model_version(),
+            "sentence_analysis": [_sentence("cache 문장")],
+            "paragraphs": [],
+        })
+        state = await load_prev_analysis(DOC_ID)
+        assert [s["text"] for s in state["sentence_analysis"]] == ["cache 문장"]
+        assert state["sentences"] == ["cache 문장"]
+    finally:
+        await _cleanup()
+
+
+@pytest.mark.asyncio
+async def test_save_analysis_upserts_only_changed_sentences():
+    print("\n=== [문장 단위 분석 결과 저장 테스트 시작] ===")
+    await _cleanup()
+    collection = db["analysis_sentences"]
+    try:
+        first = [SentenceAnalysis(**_sentence("첫 문장.")), SentenceAnalysis(**{**_sentence("둘째 문장."), "index": 1})]
+        assert await save_analysis(DOC_ID, first)
+        assert await collection.count_documents({"doc_id": DOC_ID}) == 2
+        kept = await collection.find_one({"doc_id": DOC_ID, "hash": hash_sentence("첫 문장.")})
+
+        # 둘째 문장 → 셋째 문장: 첫 문장 기록은 그대로, 둘째는 삭제, 셋째만 추가
+        await collection.update_one({"_id": kept["_id"]}, {"$set": {"marker": True}})
+        second = [first[0], SentenceAnalysis(**{**_sentence("셋째 문장."), "index": 1})]
+        assert await save_analysis(DOC_ID, second)
+        hashes = {r["hash"] async for r in collection.find({"doc_id": DOC_ID})}
+        assert hashes == {hash_sentence("첫 문장."), hash_sentence("셋째 문장.")}
+        assert (await collection.find_one({"_id": kept["_id"]}))["marker"] is True
+
+        cache_doc = await db["analysis_cache"].find_one({"doc_id": DOC_ID})
+        assert "sentence_analysis" not in cache_doc
+        state = await load_prev_analysis(DOC_ID)
+        assert [s["text"] for s in state["sentence_analysis"]] == ["첫 문장.", "셋째 문장."]
+        assert state["hashes"] == cache_doc["sentence_hashes"]
+    finally:
+        await _cleanup()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_keep_records_consistent():
+    print("\n=== [동시 저장 문장 기록 일관성 테스트 시작] ===")
+    await _cleanup()
+    try:
+        tab_a = [SentenceAnalysis(**{**_sentence(f"A 문장 {i}."), "index": i}) for i in range(20)]
+        tab_b = [SentenceAnalysis(**{**_sentence(f"B 문장 {i}."), "index": i}) for i in range(20)]
+        for _ in range(5):
+            await asyncio.gather(save_analysis(DOC_ID, tab_a), save_analysis(DOC_ID, tab_b))
+            cache_doc = await db["analysis_cache"].find_one({"doc_id": DOC_ID})
+            hashes = {r["hash"] async for r in db["analysis_sentences"].find({"doc_id": DOC_ID})}
+            # 마지막에 저장된 해시 목록의 문장 기록은 모두 있고, 다른 탭의 기록은 남지 않음
+            assert hashes == set(cache_doc["sentence_hashes"])
+    finally:
+        await _cleanup()
+
+
+@pytest.mark.asyncio
+async def test_reused_sentences_get_spans_for_their_own_text():
+    print("\n=== [재사용 문장 하이라이트 위치 테스트 시작] ===")
+    await _cleanup()
+    try:
+        flagged = {"flag": True, "label": "과장", "highlighted": ["모든"]}
+        # 같은 해시(공백만 다름)의 두 문장 중 첫 문장 결과에 다른 원문 기준 위치가 남아 있는 경우
+        stale = SentenceAnalysis(**{**_sentence("정말  모든 사람."), **flagged, "highlight_spans": [{"word": "모든", "start": 3, "end": 5}]})
+        duplicate = SentenceAnalysis(**{**_sentence("정말 모든 사람."), **flagged, "index": 1, "highlight_spans": [{"word": "모든", "start": 3, "end": 5}]})
+        assert await save_analysis(DOC_ID, [stale, duplicate])
+
+        record = await db["analysis_sentences"].find_one({"doc_id": DOC_ID})
+        assert record["result"]["text"] == "정말  모든 사람."
+        assert record["result"]["highlight_spans"] == [{"word": "모든", "start": 4, "end": 6}]
+
+        # 문서 캐시에서 재사용할 때도 현재 원문 기준으로 다시 계산
+        reused = from_sentence_cache(1, "정말 모든 사람.", record["result"])
+        assert [(s.start, s.end) for s in reused.highlight_spans] == [(3, 5)]
+    finally:
+        await _cleanup()
@@ -0,0 +1,79 @@
+# app/tests/test_15_sequence_service.py
+import asyncio
+
+import pytest
+
+from app.core.database import db
+import app.services.sequence_service as sequence_service
+
+SEED_NAME = "test_seq_seed"
+CONCURRENT_NAME = "test_seq_concurrent"
+BLOCK_NAME = "test_seq_block"
+
+
+async def _reset(name: str):
+    await db["counters"].delete_one({"_id": name})
+    sequence_service._seeded.discard(name)
+    sequence_service._blocks.pop(name, None)
+    sequence_service._block_locks.pop(name, None)
+
+
+@pytest.mark.asyncio
+async def test_next_sequence_seeds_from_existing_max():
+    print("\n=== [시퀀스 시드 테스트 시작] ===")
+    await _reset(SEED_NAME)
+    calls = []
+
+    async def seed():
+        calls.append(1)
+        return 41
+
+    try:
+        first = await sequence_service.next_sequence(SEED_NAME, seed=seed)
+        second = await sequence_service.next_sequence(SEED_NAME, seed=seed)
+        print("발급 값:", first, second)
+        assert (first, second) == (42, 43)
+        assert len(calls) == 1  # 카운터가 생긴 뒤에는 다시 시드하지 않음
+
+        # 다른 워커(캐시 없음)가 와도 이미 있는 카운터는 시드로 되돌리지 않음
+        sequence_service._seeded.discard(SEED_NAME)
+        assert await sequence_service.next_sequence(SEED_NAME, seed=seed) == 44
+        assert len(calls) == 1
+    finally:
+        await _reset(SEED_NAME)
+    print("=== [시퀀스 시드 테스트 끝] ===\n")
+
+
+@pytest.mark.asyncio
+async def test_next_sequence_concurrent_calls_are_unique():
+    print("\n=== [시퀀스 동시 발급 테스트 시작] ===")
+    await _reset(CONCURRENT_NAME)
+    try:
+        values = await asyncio.gather(*(sequence_service.next_sequence(CONCURRENT_NAME) for _ in range(50)))
+        print("발급 범위:", min(values), "~", max(values))
+        assert sorted(values) == list(range(1, 51))
+    finally:
+        await _reset(CONCURRENT_NAME)
+    print("=== [시퀀스 동시 발급 테스트 끝] ===\n")
+
+
+@pytest.mark.asyncio
+async def test_next_sequence_block_allocation():
+    print("\n=== [시퀀스 블록 할당 테스트 시작] ===")
+    await _reset(BLOCK_NAME)
+    try:
+        values = await asyncio.gather(*(
+            sequence_service.next_sequence(BLOCK_NAME, block_size=10) for _ in range(25)
+        ))
+        print("발급 값 개수:", len(set(values)))
+        assert sorted(values) == list(range(1, 26))
+
+        # 25개 발급에 블록 3개(30개) 예약
+        counter = await db["counters"].find_one({"_id": BLOCK_NAME})
+        assert counter["seq"] == 30
+
+        # 단건 발급은 예약된 블록 뒤에서 이어짐
+        assert await sequence_service.next_sequence(BLOCK_NAME) == 31
+    finally:
+        await _reset(BLOCK_NAME)
+    print("=== [시퀀스 블록 할당 테스트 끝] ===\n")
@@ -0,0 +1,93 @@
+# app/tests/test_16_exaone_backend.py
+from types import SimpleNamespace
+
+import torch
+
+import app.services.exaone_backend as exaone_backend
+from app.services.exaone_backend import build_backend, check_parity, torch_runner
+
+CPU = torch.device("cpu")
+
+
+class TinyClassifier(torch.nn.Module):
+    """PeftModel 자리를 대신하는 작은 분류기 (merge_and_unload 는 자기 자신 반환)"""
+
+    def __init__(self):
+        super().__init__()
+        torch.manual_seed(0)
+        self.embed = torch.nn.Embedding(32, 16)
+        self.head = torch.nn.Linear(16, 4)
+
+    def forward(self, input_ids, attention_mask=None):
+        return SimpleNamespace(logits=self.head(self.embed(input_ids).mean(dim=1)))
+
+    def merge_and_unload(self):
+        return self
+
+
+def fake_tokenizer(sentences, **kwargs):
+    ids = [[(ord(ch) % 31) + 1 for ch in s[:8]] + [0] * (8 - len(s[:8])) for s in sentences]
+    input_ids = torch.tensor(ids)
+    return {"input_ids": input_ids, "attention_mask": (input_ids != 0).long()}
+
+
+def test_check_parity_reports_agreement_and_max_diff():
+    inputs = fake_tokenizer(["가나다", "라마바", "사아자", "차카타"])
+    reference = torch.tensor([[2.0, 0.0], [0.0, 2.0], [2.0, 0.0], [0.0, 2.0]])
+
+    same = check_parity(reference, lambda _: reference + 0.5, inputs)
+    assert same == (1.0, 0.5)
+
+    # 절반의 argmax 가 뒤집힌 후보
+    flipped = reference.clone()
+    flipped[:2] = flipped[:2].flip(dims=[-1])
+    agreement, max_diff = check_parity(reference, lambda _: flipped, inputs)
+    assert agreement == 0.5
+    assert max_diff == 2.0
+
+
+def test_torch_and_unknown_backends_keep_the_model():
+    model = TinyClassifier()
+    for backend in ("torch", "unknown"):
+        kept, _, name = build_backend(model, fake_tokenizer, CPU, backend, "", "", min_agreement=0.9)
+        assert kept is model
+        assert name == "torch"
+
+    # GPU 에서는 양자화/ONNX 를 쓰지 않음
+    kept, _, name = build_backend(model, fake_tokenizer, torch.device("cuda"), "quantized", "", "", min_agreement=0.9)
+    assert kept is model and name == "torch"
+
+
+def test_quantized_backend_drops_fp32_weights():
+    model = TinyClassifier()
+    reference = torch_runner(model)(fake_tokenizer(exaone_backend.PARITY_SENTENCES))
+
+    runtime_model, runner, name = build_backend(model, fake_tokenizer, CPU, "quantized", "", "", min_agreement=0.0)
+    assert name == "quantized"
+    # 반환된 모델은 int8 복사본 → fp32 병합 모델을 붙잡고 있지 않음
+    assert runtime_model is not model
+    assert not isinstance(runtime_model.head, type(model.head))
+    assert runner(fake_tokenizer(exaone_backend.PARITY_SENTENCES)).shape == reference.shape
+
+
+def test_parity_failure_falls_back_to_merged_torch_model(monkeypatch):
+    model = TinyClassifier()
+    monkeypatch.setattr(exaone_backend, "check_parity", lambda *args: (0.5, 3.0))
+
+    kept, runner, name = build_backend(model, fake_tokenizer, CPU, "quantized", "", "", min_agreement=0.95)
+    assert name == "torch"
+    assert kept is model  # merge_and_unload 결과 (fp32)
+    inputs = fake_tokenizer(["테스트 문장"])
+    assert torch.equal(runner(inputs), torch_runner(model)(inputs))
+
+
+def test_onnx_build_failure_falls_back_to_torch(monkeypatch):
+    model = TinyClassifier()
+
+    def broken_onnx(*args):
+        raise ImportError("onnxruntime 없음")
+
+    monkeypatch.setattr(exaone_backend, "_build_onnx", broken_onnx)
+    kept, _, name = build_backend(model, fake_tokenizer, CPU, "onnx", "", "", min_agreement=0.95)
+    assert name == "torch"
+    assert kept is model
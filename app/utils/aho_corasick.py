@@ -0,0 +1,93 @@
+# app/utils/aho_corasick.py
+from collections import deque
+from typing import Iterable, Iterator, List, Tuple
+
+
+def _fold_char(ch: str) -> str:
+    # 대소문자 무시 비교용. 길이가 바뀌는 문자(İ 등)는 원문 유지 → 위치(offset)가 원문과 1:1 대응
+    lowered = ch.lower()
+    return lowered if len(lowered) == 1 else ch
+
+
+def is_word_char(ch: str) -> bool:
+    # re 의 유니코드 \w 와 동일한 기준 (한글 포함)
+    return ch.isalnum() or ch == "_"
+
+
+def is_word_boundary(text: str, pos: int) -> bool:
+    """re 의 \\b 와 같은 의미: pos 앞뒤 문자 중 정확히 한쪽만 단어 문자일 때 True"""
+    before = pos > 0 and is_word_char(text[pos - 1])
+    after = pos < len(text) and is_word_char(text[pos])
+    return before != after
+
+
+class AhoCorasick:
+    """
+    다중 패턴 문자열 검색 오토마톤.
+    패턴 수와 무관하게 텍스트를 한 번만 순회하며 모든 패턴의 출현 위치(겹침 포함)를 찾는다.
+    """
+
+    def __init__(self, patterns: Iterable[str], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.patterns: List[str] = []
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]   # 노드에서 끝나는 패턴 인덱스
+        self._out_link: List[int] = [0]     # 출력이 있는 가장 가까운 fail 조상 (0 이면 없음)
+
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _fold(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        return "".join(_fold_char(ch) for ch in text)
+
+    def _add(self, pattern: str):
+        node = 0
+        for ch in self._fold(pattern):
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._out_link.append(0)
+            node = nxt
+        self._out[node].append(len(self.patterns))
+        self.patterns.append(pattern)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                fail_node = self._fail[child]
+                self._out_link[child] = fail_node if self._out[fail_node] else self._out_link[fail_node]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """(start, end, 원본 패턴) 을 end 오름차순으로 반환. text[start:end] 가 매칭 구간"""
+        node = 0
+        patterns = self.patterns
+        for i, ch in enumerate(self._fold(text)):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            out_node = node
+            while out_node:
+                for idx in self._out[out_node]:
+                    pattern = patterns[idx]
+                    yield i + 1 - len(pattern), i + 1, pattern
+                out_node = self._out_link[out_node]
@@ -0,0 +1,32 @@
+# script/migrate_blobs_to_gridfs.py
+# docs 컬렉션에 인라인으로 저장된 file_blob 을 GridFS(doc_blobs) 로 옮기는 1회성 스크립트
+# 실행: python -m script.migrate_blobs_to_gridfs
+import asyncio
+
+from app.core.database import get_database, get_blob_bucket, close_database
+
+
+async def migrate():
+    # 앱과 같은 설정(settings.ATLAS_URI)의 공유 클라이언트 / GridFS 버킷 사용
+    docs = get_database()["docs"]
+    fs_bucket = get_blob_bucket()
+
+    moved = 0
+    cursor = docs.find({"file_blob": {"$ne": None}, "file_id": {"$exists": False}}, {"_id": 1})
+    async for ref in cursor:
+        doc = await docs.find_one({"_id": ref["_id"]})
+        file_id = await fs_bucket.upload_from_stream(
+            f"{doc.get('title', 'document')}.{doc.get('file_type', 'hwpx')}",
+            doc["file_blob"],
+            metadata={"doc_id": doc.get("doc_id"), "user_id": doc.get("user_id")},
+        )
+        await docs.update_one({"_id": doc["_id"]}, {"$set": {"file_id": file_id}, "$unset": {"file_blob": ""}})
+        moved += 1
+        print(f"✅ {doc.get('doc_id')} → {file_id}")
+
+    print(f"[완료] GridFS 로 이동한 문서 수: {moved}")
+    close_database()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())